@@ -1,3 +1,4 @@
+from .rules import RuleViolation, check_draft
 from .scorer import critique_and_score
 
-__all__ = ["critique_and_score"]
+__all__ = ["RuleViolation", "check_draft", "critique_and_score"]
@@ -0,0 +1,130 @@
+"""
+Deterministic pre-critic: mechanical platform constraints checked without an LLM.
+
+Runs before the LLM critique. Hard violations (length far outside range, tweet limits, DataVex before the
+blog's final 10–15%, banned hype words) send the draft straight to revision with a generated instruction
+and skip the critique call; soft ones (length just outside range, DataVex before the final tweet) are
+appended to the LLM feedback.
+"""
+import re
+from dataclasses import dataclass
+
+from config.settings import settings
+from utils.schemas import CritiqueResult, CritiqueScores
+
+_WORD = re.compile(r"[\w’'-]+")
+_TWEET_MAX_CHARS = 280
+_LIMITS = {
+    "blog": (800, 1200),
+    "linkedin": (200, 300),
+}
+_TWEET_COUNT = (5, 8)
+
+
+@dataclass
+class RuleViolation:
+    rule: str  # length | tweet_length | tweet_count | datavex_placement | banned_phrase
+    message: str  # phrased as a revision instruction
+    hard: bool
+
+
+def _words(text: str) -> list[str]:
+    return _WORD.findall(text)
+
+
+def _check_length(text: str, platform: str) -> list[RuleViolation]:
+    lo, hi = _LIMITS[platform]
+    n = len(_words(text))
+    if lo <= n <= hi:
+        return []
+    slack = settings.precritic_length_tolerance
+    hard = n < lo * (1 - slack) or n > hi * (1 + slack)
+    verb = "Expand" if n < lo else "Cut"
+    return [RuleViolation("length", f"{verb} to {lo}–{hi} words (currently {n}).", hard)]
+
+
+def _check_blog_placement(text: str) -> list[RuleViolation]:
+    words = _words(text)
+    first = next((i for i, w in enumerate(words) if "datavex" in w.lower()), None)
+    if first is None or not words:
+        return []
+    tail_start = 1 - settings.datavex_tail_fraction
+    position = first / len(words)
+    if position >= tail_start:
+        return []
+    return [
+        RuleViolation(
+            "datavex_placement",
+            f"Remove DataVex from the body: it first appears {position:.0%} of the way through; mention it only "
+            f"in the closing section (final {settings.datavex_tail_fraction:.0%}).",
+            True,
+        )
+    ]
+
+
+def _check_twitter(text: str) -> list[RuleViolation]:
+    tweets = [line.strip() for line in text.splitlines() if line.strip()]
+    violations = []
+    lo, hi = _TWEET_COUNT
+    if not lo <= len(tweets) <= hi:
+        violations.append(
+            RuleViolation("tweet_count", f"Write {lo}–{hi} tweets, one per line (currently {len(tweets)}).", True)
+        )
+    long = [i + 1 for i, t in enumerate(tweets) if len(t) > _TWEET_MAX_CHARS]
+    if long:
+        violations.append(
+            RuleViolation(
+                "tweet_length",
+                f"Shorten tweet(s) {', '.join(map(str, long))} to at most {_TWEET_MAX_CHARS} characters.",
+                True,
+            )
+        )
+    early = [i + 1 for i, t in enumerate(tweets[:-1]) if "datavex" in t.lower()]
+    if early:
+        violations.append(
+            RuleViolation("datavex_placement", "Mention DataVex only in the final tweet, if at all.", False)
+        )
+    return violations
+
+
+def _check_banned(text: str) -> list[RuleViolation]:
+    lowered = text.lower()
+    found = [p for p in settings.precritic_banned_phrases if p.lower() in lowered]
+    if not found:
+        return []
+    return [RuleViolation("banned_phrase", f"Remove hype phrasing: {', '.join(repr(p) for p in found)}.", True)]
+
+
+def check_draft(content: str, platform: str) -> list[RuleViolation]:
+    """All rule violations for a draft on platform ("blog" | "linkedin" | "twitter")."""
+    violations = _check_twitter(content) if platform == "twitter" else _check_length(content, platform)
+    if platform == "blog":
+        violations += _check_blog_placement(content)
+    return violations + _check_banned(content)
+
+
+def revision_instruction(violations: list[RuleViolation]) -> str:
+    return "Fix these constraints before anything else: " + " ".join(v.message for v in violations)
+
+
+def rules_critique(violations: list[RuleViolation], draft_number: int) -> CritiqueResult:
+    """
+    Critique for a draft that failed hard constraints, without an LLM call. Dimensions the rules cannot judge
+    keep the neutral 5; platform_fit (and structure, for misplaced DataVex) drop per violation.
+    """
+    hard = [v for v in violations if v.hard]
+    platform_fit = max(0.0, 5.0 - 2.0 * len(hard))
+    structure = 5.0 - 2.0 * any(v.rule == "datavex_placement" for v in hard)
+    return CritiqueResult(
+        scores=CritiqueScores(
+            hook_strength=5,
+            authority=5,
+            differentiation=5,
+            structure=structure,
+            platform_fit=platform_fit,
+        ),
+        feedback=revision_instruction(violations),
+        draft_number=draft_number,
+        source="rules",
+        rule_violations=[v.message for v in violations],
+    )
@@ -1,28 +1,30 @@
 """Critique agent: substantive feedback + quantitative scores. No RAG for scoring."""
 import json
 import re
+from typing import TYPE_CHECKING
 
 from langchain_core.messages import HumanMessage, SystemMessage
-from langchain_google_genai import ChatGoogleGenerativeAI
 
-from config.settings import require_google_api_key, settings
+from config.settings import settings
+from utils.cancellation import RunCancelled
 from utils.schemas import CritiqueResult, CritiqueScores
+from utils.llm import get_chat_model, invoke_llm
 from utils.logging import get_logger
+from utils.metrics import CRITIQUE_RULE_VIOLATIONS
+from utils.routing import route_model
 
-logger = get_logger(__name__)
+from .rules import check_draft, rules_critique
 
-_LLM: ChatGoogleGenerativeAI | None = None
+if TYPE_CHECKING:
+    from langchain_google_genai import ChatGoogleGenerativeAI
 
+logger = get_logger(__name__)
 
-def _get_llm() -> ChatGoogleGenerativeAI:
-    global _LLM
-    if _LLM is None:
-        _LLM = ChatGoogleGenerativeAI(
-            model=settings.llm_strategy,
-            temperature=0.2,
-            google_api_key=require_google_api_key(),
-        )
-    return _LLM
+
+def _get_llm(draft_number: int, model: str | None = None) -> "ChatGoogleGenerativeAI":
+    if model is None:
+        model = route_model("critique", settings.llm_strategy, importance_key=f"critique_{draft_number}")
+    return get_chat_model(model, temperature=0.2)
 
 
 def _parse_scores(data: dict) -> CritiqueScores:
@@ -46,10 +48,23 @@ def critique_and_score(
     content: str,
     platform: str,  # "blog" | "linkedin" | "twitter"
     draft_number: int,
+    model: str | None = None,
 ) -> CritiqueResult:
     """
     Produce substantive critique and 0–10 scores for hook_strength, authority, differentiation, structure, platform_fit.
+    model overrides the routed critique model (settings.llm_strategy), e.g. Flash for cheap candidate scoring.
+    The rule-based pre-critic runs first: hard constraint failures return its critique without an LLM call,
+    soft ones are appended to the LLM feedback.
     """
+    violations = check_draft(content, platform) if settings.precritic_enabled else []
+    for v in violations:
+        CRITIQUE_RULE_VIOLATIONS.labels(platform=platform, rule=v.rule, severity="hard" if v.hard else "soft").inc()
+    if any(v.hard for v in violations):
+        logger.info(
+            "critique_rules_failed", platform=platform, draft_number=draft_number, rules=[v.rule for v in violations]
+        )
+        return rules_critique(violations, draft_number)
+
     system = """You are an editorial critic. Score the content on five dimensions (0–10 each) and give actionable feedback.
 Dimensions:
 - hook_strength: Does the opening grab attention and promise value?
@@ -69,7 +84,7 @@ Content:
 Score and critique. Output ONLY valid JSON."""
 
     try:
-        resp = _get_llm().invoke([SystemMessage(content=system), HumanMessage(content=user)])
+        resp = invoke_llm(_get_llm(draft_number, model), [SystemMessage(content=system), HumanMessage(content=user)], stage="critique")
         text = resp.content.strip()
         if "```" in text:
             text = re.sub(r"^```(?:json)?\s*", "", text)
@@ -77,11 +92,24 @@ Score and critique. Output ONLY valid JSON."""
         data = json.loads(text)
         scores = _parse_scores(data)
         feedback = data.get("feedback", "")
-        return CritiqueResult(scores=scores, feedback=feedback, draft_number=draft_number)
+        if violations:
+            feedback = f"{feedback} {' '.join(v.message for v in violations)}".strip()
+        return CritiqueResult(
+            scores=scores,
+            feedback=feedback,
+            draft_number=draft_number,
+            rule_violations=[v.message for v in violations],
+        )
+    except RunCancelled:
+        raise
     except Exception as e:
         logger.warning("critique_parse_failed", error=str(e))
+        feedback = "Could not parse critique; default scores applied."
+        if violations:
+            feedback = f"{feedback} {' '.join(v.message for v in violations)}"
         return CritiqueResult(
             scores=CritiqueScores(hook_strength=5, authority=5, differentiation=5, structure=5, platform_fit=5),
-            feedback="Could not parse critique; default scores applied.",
+            feedback=feedback,
             draft_number=draft_number,
+            rule_violations=[v.message for v in violations],
         )
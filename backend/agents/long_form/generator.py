@@ -1,25 +1,190 @@
-"""Long-form blog generator (800–1200 words). Platform-native, same signal/angle; DataVex in final 10–15%."""
+"""
+Long-form blog generator (800–1200 words). Platform-native, same signal/angle; DataVex in final 10–15%.
+
+BLOG_GENERATION_MODE=sections replaces the single long generation with an outline call, the body sections and
+the DataVex tail drafted concurrently from that outline, and a light edit-based coherence pass over the result.
+"""
+import json
+import re
+import time
+from typing import TYPE_CHECKING
+
 from langchain_core.messages import HumanMessage, SystemMessage
-from langchain_google_genai import ChatGoogleGenerativeAI
 
-from config.settings import require_google_api_key, settings
+from agents.revision import EditError, apply_edits, request_edits
+from config.settings import settings
+from utils.cancellation import RunCancelled
+from utils.concurrency import ContextThreadPoolExecutor
 from utils.schemas import ExternalSignal, PositioningHooks, StrategyBrief
+from utils.llm import get_chat_model, invoke_llm
 from utils.logging import get_logger
 
+if TYPE_CHECKING:
+    from langchain_google_genai import ChatGoogleGenerativeAI
+
 logger = get_logger(__name__)
 
-_LLM: ChatGoogleGenerativeAI | None = None
+
+def _get_llm() -> "ChatGoogleGenerativeAI":
+    return get_chat_model(settings.llm_content, temperature=0.5)
+
+
+_TARGET_WORDS = 1000
+_TAIL_WORDS = 130  # ~13% of the post
+_COHERENCE_INSTRUCTION = (
+    "These sections were drafted independently from one outline. Smooth the transitions between them and remove "
+    "repeated points or re-introductions of the signal. Do not add new claims, do not change headings, and keep "
+    "the final (DataVex) section last. Return an empty edit list if nothing needs changing."
+)
 
 
-def _get_llm() -> ChatGoogleGenerativeAI:
-    global _LLM
-    if _LLM is None:
-        _LLM = ChatGoogleGenerativeAI(
-            model=settings.llm_content,
-            temperature=0.5,
-            google_api_key=require_google_api_key(),
-        )
-    return _LLM
+def _context(brief: StrategyBrief, signal: ExternalSignal) -> str:
+    return f"""Signal: {signal.title}
+Source: {signal.source}
+Summary: {signal.summary}
+
+Chosen angle: {brief.chosen_angle}
+Why this angle wins: {brief.why_this_angle_wins}
+Core thesis: {brief.core_thesis}
+"""
+
+
+def _parse_json(text: str) -> dict:
+    text = text.strip()
+    if "```" in text:
+        text = re.sub(r"^```(?:json)?\s*", "", text)
+        text = re.sub(r"\s*```$", "", text)
+    return json.loads(text)
+
+
+def _generate_outline(brief: StrategyBrief, signal: ExternalSignal, draft_instruction: str) -> dict:
+    """{"title": str, "sections": [{"heading": str, "points": str}, ...]} with blog_outline_sections body sections."""
+    n = max(2, settings.blog_outline_sections)
+    system = f"""You outline technical long-form blog posts for data/ML engineers. Tone: direct, contrarian, no hype.
+The post is problem-first, then signal, then argument, then implication. Plan exactly {n} body sections; a closing
+DataVex section is added separately, so do not plan one and do not mention DataVex.
+Output a JSON object: {{"title": "...", "sections": [{{"heading": "...", "points": "2–3 sentences on what this section argues and which evidence it uses"}}]}}.
+Output ONLY valid JSON."""
+    user = _context(brief, signal)
+    if draft_instruction:
+        user += f"\nRevision request (the outline must address this feedback):\n{draft_instruction}\n"
+    user += "\nWrite the outline now."
+
+    resp = invoke_llm(_get_llm(), [SystemMessage(content=system), HumanMessage(content=user)], stage="blog_outline")
+    data = _parse_json(resp.content or "")
+    sections = [s for s in data.get("sections", []) if isinstance(s, dict) and str(s.get("heading", "")).strip()]
+    if len(sections) < 2:
+        raise ValueError(f"outline has {len(sections)} usable sections")
+    return {"title": str(data.get("title", "")).strip(), "sections": sections}
+
+
+def _outline_text(outline: dict) -> str:
+    return "\n".join(f"{i}. {s['heading']}: {s.get('points', '')}" for i, s in enumerate(outline["sections"], start=1))
+
+
+def _generate_section(
+    brief: StrategyBrief,
+    signal: ExternalSignal,
+    outline: dict,
+    index: int,
+    words: int,
+    draft_instruction: str,
+) -> str:
+    section = outline["sections"][index]
+    heading = str(section["heading"]).strip()
+    system = """You write one section of a technical long-form blog post for data/ML engineers. Tone: direct, contrarian, no hype.
+- Write only the section you are given; other sections are written in parallel, so do not summarise them or repeat the intro
+- Cite the signal/source where this section uses it; no generic claims
+- Do not mention DataVex or any product; no "revolutionary", "game-changing", or sales CTAs"""
+    user = f"""{_context(brief, signal)}
+Post title: {outline["title"]}
+Outline:
+{_outline_text(outline)}
+
+Write section {index + 1} ("{heading}"), about {words} words, covering: {section.get("points", "")}
+"""
+    if draft_instruction:
+        user += f"\nRevision request (apply where it concerns this section):\n{draft_instruction}\n"
+    user += f"\nStart with the line '## {heading}'. Output only the section."
+
+    resp = invoke_llm(_get_llm(), [SystemMessage(content=system), HumanMessage(content=user)], stage="blog_section")
+    text = (resp.content or "").strip()
+    return text if text.startswith("#") else f"## {heading}\n\n{text}"
+
+
+def _generate_tail(brief: StrategyBrief, positioning: PositioningHooks, outline: dict, draft_instruction: str) -> str:
+    system = """You write the closing section of a technical blog post for data/ML engineers. Tone: direct, no hype.
+This is the only place DataVex appears: tie the post's argument to the DataVex insight as a philosophy, not a sales pitch.
+No "revolutionary", "game-changing", or sales CTAs."""
+    user = f"""Post title: {outline["title"]}
+Outline of the sections before this one:
+{_outline_text(outline)}
+
+Core thesis: {brief.core_thesis}
+DataVex insight to close on: {positioning.blog_tail_insight}
+"""
+    if draft_instruction:
+        user += f"\nRevision request (apply where it concerns the closing section):\n{draft_instruction}\n"
+    user += f"\nWrite the closing section, about {_TAIL_WORDS} words, starting with a '## ' heading line. Output only the section."
+
+    resp = invoke_llm(_get_llm(), [SystemMessage(content=system), HumanMessage(content=user)], stage="blog_tail")
+    text = (resp.content or "").strip()
+    return text if text.startswith("#") else f"## Where this leaves us\n\n{text}"
+
+
+def _coherence_pass(sections: list[str]) -> list[str]:
+    """Light transition/repetition edits over the stitched sections; the DataVex tail stays last. Best effort."""
+    last = len(sections)
+    try:
+        edits = request_edits(sections, "blog", _COHERENCE_INSTRUCTION, stage="blog_coherence", allow_empty=True)
+        if not edits:
+            logger.debug("blog_coherence_unchanged")
+            return sections
+        if any(e.get("section") == last and e.get("op") in ("delete", "insert_after") for e in edits if isinstance(e, dict)):
+            raise EditError("edits move the DataVex section")
+        return apply_edits(sections, edits, "blog")
+    except RunCancelled:
+        raise
+    except EditError as e:
+        logger.info("blog_coherence_skipped", reason=str(e))
+    except Exception as e:
+        logger.warning("blog_coherence_failed", error=str(e))
+    return sections
+
+
+def _generate_blog_in_sections(
+    brief: StrategyBrief,
+    signal: ExternalSignal,
+    positioning: PositioningHooks,
+    draft_instruction: str,
+) -> str:
+    """Outline → body sections + DataVex tail concurrently → stitched in outline order → coherence pass."""
+    t = time.perf_counter()
+    outline = _generate_outline(brief, signal, draft_instruction)
+    t_outline = time.perf_counter() - t
+
+    n = len(outline["sections"])
+    words = (_TARGET_WORDS - _TAIL_WORDS) // n
+    workers = settings.blog_section_concurrency or n + 1
+    with ContextThreadPoolExecutor(max_workers=max(1, min(workers, n + 1)), thread_name_prefix="blog-section") as pool:
+        body = [
+            pool.submit(_generate_section, brief, signal, outline, i, words, draft_instruction) for i in range(n)
+        ]
+        tail = pool.submit(_generate_tail, brief, positioning, outline, draft_instruction)
+        sections = [f.result() for f in body] + [tail.result()]
+    t_sections = time.perf_counter() - t - t_outline
+
+    if settings.blog_coherence_pass:
+        sections = _coherence_pass(sections)
+    title = f"# {outline['title']}\n\n" if outline["title"] else ""
+    logger.info(
+        "blog_sections_generated",
+        sections=n,
+        outline_seconds=round(t_outline, 2),
+        sections_seconds=round(t_sections, 2),
+        total_seconds=round(time.perf_counter() - t, 2),
+    )
+    return title + "\n\n".join(sections)
 
 
 def generate_blog_draft(
@@ -31,7 +196,16 @@ def generate_blog_draft(
     """
     Generate one blog draft. If draft_instruction is set, it's critique feedback for a revision.
     Blog: 800–1200 words, problem-first, data-backed. DataVex only in final 10–15%.
+    In sections mode, falls back to a single generation if the outline or a section cannot be produced.
     """
+    if settings.blog_generation_mode == "sections":
+        try:
+            return _generate_blog_in_sections(brief, signal, positioning, draft_instruction)
+        except RunCancelled:
+            raise
+        except Exception as e:
+            logger.warning("blog_sections_failed", error=str(e))
+
     system = """You write technical long-form blog posts for data/ML engineers. Tone: direct, contrarian, no hype.
 Requirements:
 - 800–1200 words
@@ -41,14 +215,7 @@ Requirements:
 - No "revolutionary", "game-changing", or sales CTAs
 - Clear structure: hook, context, signal, argument, implication, optional DataVex tie-in at end"""
 
-    base_user = f"""Signal: {signal.title}
-Source: {signal.source}
-Summary: {signal.summary}
-
-Chosen angle: {brief.chosen_angle}
-Why this angle wins: {brief.why_this_angle_wins}
-Core thesis: {brief.core_thesis}
-
+    base_user = _context(brief, signal) + f"""
 DataVex tail section (use only at end, in final 10–15%): {positioning.blog_tail_insight}
 """
 
@@ -57,5 +224,5 @@ DataVex tail section (use only at end, in final 10–15%): {positioning.blog_tai
 
     user = base_user + "\nWrite the full blog post now. Output only the post, no meta commentary."
 
-    resp = _get_llm().invoke([SystemMessage(content=system), HumanMessage(content=user)])
+    resp = invoke_llm(_get_llm(), [SystemMessage(content=system), HumanMessage(content=user)], stage="blog_draft")
     return (resp.content or "").strip()
@@ -1,3 +1,16 @@
-from .pipeline import run_pipeline
+from .admission import AdmissionController, AdmissionRejected, get_admission_controller
+from .pipeline import RERUN_TARGETS, rerun_pipeline, run_pipeline
+from .prewarm import is_fresh, live_traffic, start_prewarm, stop_prewarm
 
-__all__ = ["run_pipeline"]
+__all__ = [
+    "RERUN_TARGETS",
+    "AdmissionController",
+    "AdmissionRejected",
+    "get_admission_controller",
+    "is_fresh",
+    "live_traffic",
+    "rerun_pipeline",
+    "run_pipeline",
+    "start_prewarm",
+    "stop_prewarm",
+]
@@ -0,0 +1,198 @@
+"""
+Admission control in front of the orchestrator: a bounded number of pipeline runs in flight per lane.
+
+- interactive (API requests): up to MAX_IN_FLIGHT_RUNS at once; further requests wait in a bounded FIFO
+  queue. When the queue is full, or the expected wait (run-time EWMA × queue position / slots) exceeds
+  ADMISSION_MAX_WAIT_SECONDS, the request is rejected with a Retry-After estimate.
+- batch (prewarm and other bulk work): its own small cap (BATCH_MAX_IN_FLIGHT_RUNS), never queued, and
+  only admitted while no interactive request is waiting, so bulk work cannot delay interactive runs.
+"""
+import asyncio
+import math
+import threading
+import time
+from contextlib import asynccontextmanager
+from typing import AsyncIterator
+
+from config import settings
+from utils.logging import get_logger
+from utils.metrics import ADMISSION_DECISIONS, ADMISSION_QUEUE_WAIT, RUNS_IN_FLIGHT
+
+logger = get_logger(__name__)
+
+INTERACTIVE = "interactive"
+BATCH = "batch"
+
+_EWMA_ALPHA = 0.2
+
+
+class AdmissionRejected(Exception):
+    def __init__(self, reason: str, retry_after: int):
+        super().__init__(reason)
+        self.reason = reason
+        self.retry_after = retry_after
+
+
+class _Waiter:
+    __slots__ = ("loop", "future", "granted")
+
+    def __init__(self, loop: asyncio.AbstractEventLoop):
+        self.loop = loop
+        self.future: asyncio.Future = loop.create_future()
+        self.granted = False
+
+
+class InteractiveSlot:
+    """Handle for a held interactive slot; mark_full_run() lets its hold time feed the run-time EWMA."""
+
+    __slots__ = ("full_run",)
+
+    def __init__(self) -> None:
+        self.full_run = False
+
+    def mark_full_run(self) -> None:
+        """The slot ran a complete, non-aborted run_pipeline (not a rerun, cancellation or failure)."""
+        self.full_run = True
+
+
+def _wake(future: asyncio.Future) -> None:
+    if not future.done():
+        future.set_result(None)
+
+
+class AdmissionController:
+    def __init__(
+        self,
+        max_in_flight: int,
+        batch_max_in_flight: int,
+        queue_size: int,
+        max_wait_seconds: float,
+        initial_run_seconds: float,
+    ):
+        self.max_in_flight = max(1, max_in_flight)
+        self.batch_max_in_flight = max(0, batch_max_in_flight)
+        self.queue_size = max(0, queue_size)
+        self.max_wait_seconds = max_wait_seconds
+        self._run_seconds = initial_run_seconds
+        self._in_flight = {INTERACTIVE: 0, BATCH: 0}
+        self._waiters: list[_Waiter] = []
+        self._lock = threading.Lock()
+        if self.queue_size and self.max_wait_seconds < initial_run_seconds:
+            # The first queued request would be rejected up front, and time out if it were not.
+            logger.warning(
+                "admission_queue_unusable",
+                max_wait_seconds=max_wait_seconds,
+                initial_run_seconds=initial_run_seconds,
+            )
+
+    @property
+    def run_seconds_estimate(self) -> float:
+        return self._run_seconds
+
+    def _expected_wait(self, position: int) -> float:
+        """Seconds until the request at queue position (1-based) gets a slot, assuming EWMA-length runs."""
+        return self._run_seconds * math.ceil(position / self.max_in_flight)
+
+    def _reject(self, lane: str, reason: str, position: int) -> AdmissionRejected:
+        ADMISSION_DECISIONS.labels(lane=lane, outcome="rejected").inc()
+        retry_after = max(1, math.ceil(self._expected_wait(position)))
+        logger.info("admission_rejected", lane=lane, reason=reason, retry_after=retry_after)
+        return AdmissionRejected(reason, retry_after)
+
+    def _take(self, lane: str) -> None:
+        self._in_flight[lane] += 1
+        RUNS_IN_FLIGHT.labels(lane=lane).set(self._in_flight[lane])
+
+    def try_acquire_batch(self) -> bool:
+        """Non-blocking batch slot; False while interactive work is queued or the batch cap is reached."""
+        with self._lock:
+            if self._waiters or self._in_flight[BATCH] >= self.batch_max_in_flight:
+                ADMISSION_DECISIONS.labels(lane=BATCH, outcome="deferred").inc()
+                return False
+            self._take(BATCH)
+        ADMISSION_DECISIONS.labels(lane=BATCH, outcome="admitted").inc()
+        return True
+
+    async def acquire_interactive(self) -> None:
+        """Take an interactive slot, waiting in the queue if needed; raises AdmissionRejected on overload."""
+        t = time.perf_counter()
+        with self._lock:
+            if not self._waiters and self._in_flight[INTERACTIVE] < self.max_in_flight:
+                self._take(INTERACTIVE)
+                ADMISSION_DECISIONS.labels(lane=INTERACTIVE, outcome="admitted").inc()
+                return
+            position = len(self._waiters) + 1
+            if position > self.queue_size:
+                raise self._reject(INTERACTIVE, "queue full", position)
+            if self._expected_wait(position) > self.max_wait_seconds:
+                raise self._reject(INTERACTIVE, "expected wait too long", position)
+            waiter = _Waiter(asyncio.get_running_loop())
+            self._waiters.append(waiter)
+        ADMISSION_DECISIONS.labels(lane=INTERACTIVE, outcome="queued").inc()
+
+        try:
+            await asyncio.wait_for(asyncio.shield(waiter.future), timeout=self.max_wait_seconds)
+        except (asyncio.TimeoutError, asyncio.CancelledError) as e:
+            with self._lock:
+                if waiter.granted:
+                    if isinstance(e, asyncio.TimeoutError):
+                        return  # slot was handed over just as the wait expired
+                    self._release_locked(INTERACTIVE, None)
+                    raise
+                self._waiters.remove(waiter)
+                position = len(self._waiters) + 1
+            if isinstance(e, asyncio.CancelledError):
+                raise
+            raise self._reject(INTERACTIVE, "queue wait timed out", position) from None
+        finally:
+            ADMISSION_QUEUE_WAIT.labels(lane=INTERACTIVE).observe(time.perf_counter() - t)
+
+    def _release_locked(self, lane: str, run_seconds: float | None) -> None:
+        self._in_flight[lane] -= 1
+        if run_seconds is not None:
+            self._run_seconds = _EWMA_ALPHA * run_seconds + (1 - _EWMA_ALPHA) * self._run_seconds
+        while self._waiters and self._in_flight[INTERACTIVE] < self.max_in_flight:
+            waiter = self._waiters.pop(0)
+            waiter.granted = True
+            self._take(INTERACTIVE)
+            waiter.loop.call_soon_threadsafe(_wake, waiter.future)
+        RUNS_IN_FLIGHT.labels(lane=lane).set(self._in_flight[lane])
+
+    def release(self, lane: str, run_seconds: float | None = None) -> None:
+        """Free a slot; run_seconds (only for a completed full run) feeds the Retry-After estimate."""
+        with self._lock:
+            self._release_locked(lane, run_seconds)
+
+    @asynccontextmanager
+    async def interactive_slot(self) -> AsyncIterator[InteractiveSlot]:
+        """
+        Hold an interactive slot for the block. Its duration is learned only if the block exits normally after
+        calling mark_full_run(), so reruns, aborted, cancelled and failed runs do not skew the estimate.
+        """
+        await self.acquire_interactive()
+        slot = InteractiveSlot()
+        t = time.perf_counter()
+        completed = False
+        try:
+            yield slot
+            completed = slot.full_run
+        finally:
+            self.release(INTERACTIVE, time.perf_counter() - t if completed else None)
+
+
+_controller: AdmissionController | None = None
+_controller_lock = threading.Lock()
+
+
+def get_admission_controller() -> AdmissionController:
+    global _controller
+    with _controller_lock:
+        if _controller is None:
+            _controller = AdmissionController(
+                max_in_flight=settings.max_in_flight_runs,
+                batch_max_in_flight=settings.batch_max_in_flight_runs,
+                queue_size=settings.admission_queue_size,
+                max_wait_seconds=settings.admission_max_wait_seconds,
+                initial_run_seconds=settings.admission_initial_run_seconds,
+            )
+        return _controller
@@ -1,52 +1,191 @@
 """Single pipeline: keyword → signal → gap → brief → positioning → content (blog, LinkedIn, Twitter) → critique loops → final state."""
+import re
 import time
+import uuid
+from contextlib import contextmanager, nullcontext
+from functools import partial
+from typing import Callable, Iterator
+
+import structlog
 
 from agents.critique import critique_and_score
 from agents.long_form import generate_blog_draft
-from agents.positioning import run_positioning_engine
+from agents.positioning import retrieve_positioning_context, run_positioning_engine
+from agents.revision import revise_draft
 from agents.short_form import generate_linkedin_draft, generate_twitter_thread_draft
 from agents.signal import run_signal_discovery
 from agents.strategy import run_gap_analysis, run_strategy_brief
 from config import settings
+from config.tenants import get_tenant
+from memory.run_store import save_run
+from utils.cancellation import CancellationToken, RunCancelled, cancellation_scope, check_cancelled
+from utils.circuit import CircuitOpen, check_circuit, circuit_scope
+from utils.concurrency import ContextThreadPoolExecutor
 from utils.logging import get_logger
+from utils.llm import LLMCallCounter, count_llm_calls
+from utils.metrics import LLM_CALLS_SAVED, PIPELINE_DURATION, PIPELINE_RUNS, STAGE_DURATION
+from utils.profiling import profile_run
+from utils.routing import latency_budget
+from utils.tenancy import tenant_scope
+from utils.tokens import RunTokens, current_run_tokens, stage_scope, token_accounting
+from utils.tracing import span
 from utils.schemas import (
     ContentAssets,
     ContentWithCritiqueTrace,
+    CritiqueResult,
     PipelineState,
+    PositioningHooks,
+    StrategyBrief,
 )
 
 logger = get_logger(__name__)
 
 
+@contextmanager
+def _stage(name: str, stage_timings: dict[str, float]) -> Iterator[None]:
+    """
+    Time one pipeline stage: rounded entry in stage_timings, a stage.<name> span and a histogram sample.
+    Raises CircuitOpen before the stage, or after it if its LLM calls tripped or hit the open circuit
+    (its output would be agent fallbacks).
+    """
+    check_cancelled()
+    check_circuit()
+    t = time.perf_counter()
+    with span(f"stage.{name}", stage=name), stage_scope(name):
+        try:
+            yield
+            check_circuit()
+        finally:
+            elapsed = time.perf_counter() - t
+            stage_timings[name] = round(elapsed, 2)
+            STAGE_DURATION.labels(stage=name).observe(elapsed)
+
+
+def _critique_candidate(
+    generate: Callable[[str], str],
+    platform: str,
+    draft_number: int,
+    instruction: str,
+) -> tuple[str, CritiqueResult]:
+    draft = generate(instruction)
+    model = settings.llm_content if settings.best_of_n_scorer == "flash" else None
+    return draft, critique_and_score(draft, platform, draft_number, model=model)
+
+
+def _draft_round(
+    generate: Callable[[str], str],
+    platform: str,
+    draft_number: int,
+    instruction: str = "",
+    n: int | None = None,
+) -> tuple[str, CritiqueResult, list[float]]:
+    """
+    One draft + critique round. With best_of_n[platform] > 1 (or n), N candidates are drafted and scored
+    concurrently and only the highest-scoring one is returned, with every candidate's average score.
+    """
+    n = max(1, n if n is not None else settings.best_of_n.get(platform, 1))
+    if n == 1:
+        draft = generate(instruction)
+        return draft, critique_and_score(draft, platform, draft_number), []
+
+    workers = max(1, min(n, settings.best_of_n_concurrency.get(platform, n)))
+    with ContextThreadPoolExecutor(max_workers=workers, thread_name_prefix=f"best-of-{platform}") as pool:
+        futures = [pool.submit(_critique_candidate, generate, platform, draft_number, instruction) for _ in range(n)]
+        results, errors = [], []
+        for fut in futures:
+            try:
+                results.append(fut.result())
+            except RunCancelled:
+                for f in futures:
+                    f.cancel()  # queued candidates never start; running ones stop at their next LLM call
+                raise
+            except Exception as e:
+                errors.append(e)
+    if not results:
+        raise errors[0]
+    if errors:
+        logger.warning("best_of_n_candidates_failed", platform=platform, failed=len(errors), n=n)
+
+    averages = [c.scores.average() for _, c in results]
+    best = max(range(len(results)), key=averages.__getitem__)
+    draft, critique = results[best]
+    if settings.best_of_n_scorer == "flash":
+        critique = critique_and_score(draft, platform, draft_number)
+    logger.info("best_of_n_selected", platform=platform, round=draft_number, scores=averages, chosen=best)
+    return draft, critique, averages
+
+
+def _run_critique_loop(generate: Callable[[str], str], platform: str) -> ContentWithCritiqueTrace:
+    """
+    Draft 1 → Critique 1 → Draft 2 (with feedback) → Critique 2 → Final = Draft 2.
+    With revision_mode "edit", draft 2 is draft 1 with section-level edits (regenerated if they cannot be applied).
+    """
+    tokens = current_run_tokens()
+    budgeted = tokens is not None and tokens.budget is not None
+    n = max(1, settings.best_of_n.get(platform, 1))
+    if budgeted and n > 1 and not tokens.fits(0):
+        tokens.degrade(platform, "best_of_n_reduced", f"token budget exhausted before round 1; {n} -> 1 candidates")
+        n = 1
+
+    used_before = tokens.used() if budgeted else 0
+    d1, c1, s1 = _draft_round(generate, platform, 1, n=n)
+    if budgeted:
+        n, skip = _fit_second_round(tokens, platform, n, tokens.used() - used_before)
+        if skip:
+            return ContentWithCritiqueTrace(
+                final_content=d1,
+                drafts=[d1],
+                critiques=[c1],
+                score_evolution=[c1.scores],
+                candidate_scores=[s1] if s1 else [],
+            )
+
+    revise = generate
+    if settings.revision_mode == "edit":
+        revise = partial(revise_draft, d1, platform, regenerate=generate)
+    d2, c2, s2 = _draft_round(revise, platform, 2, c1.feedback, n=n)
+    return ContentWithCritiqueTrace(
+        final_content=d2,
+        drafts=[d1, d2],
+        critiques=[c1, c2],
+        score_evolution=[c1.scores, c2.scores],
+        candidate_scores=[s1, s2] if s1 or s2 else [],
+    )
+
+
+def _fit_second_round(tokens: RunTokens, platform: str, n: int, round_tokens: int) -> tuple[int, bool]:
+    """
+    Candidates for round 2 given round 1 cost round_tokens for n candidates: fewer candidates if all n would
+    not fit the remaining budget, and skip (True) if not even one would. Degradations are recorded on tokens.
+    """
+    per_candidate = round_tokens // n
+    if n > 1 and not tokens.fits(round_tokens):
+        if tokens.fits(per_candidate):
+            fitting = max(1, min(n - 1, tokens.remaining() // max(1, per_candidate)))
+            tokens.degrade(
+                platform,
+                "best_of_n_reduced",
+                f"round 2 of {n} candidates would exceed the token budget; {n} -> {fitting} candidates",
+            )
+            return fitting, False
+    if not tokens.fits(per_candidate):
+        tokens.degrade(
+            platform,
+            "second_round_skipped",
+            f"round 2 (~{per_candidate} tokens, as round 1) would exceed the token budget; draft 1 is final",
+        )
+        return n, True
+    return n, False
+
+
 def _run_blog_with_critique_loop(
     brief,
     signal,
     positioning,
 ) -> ContentWithCritiqueTrace:
-    """Draft 1 → Critique 1 → Draft 2 (with feedback) → Critique 2 → Final = Draft 2."""
-    drafts = []
-    critiques = []
-    score_evolution = []
-
-    # Draft 1
-    d1 = generate_blog_draft(brief, signal, positioning)
-    drafts.append(d1)
-    c1 = critique_and_score(d1, "blog", 1)
-    critiques.append(c1)
-    score_evolution.append(c1.scores)
-
-    # Draft 2 with feedback
-    d2 = generate_blog_draft(brief, signal, positioning, draft_instruction=c1.feedback)
-    drafts.append(d2)
-    c2 = critique_and_score(d2, "blog", 2)
-    critiques.append(c2)
-    score_evolution.append(c2.scores)
-
-    return ContentWithCritiqueTrace(
-        final_content=d2,
-        drafts=drafts,
-        critiques=[c1, c2],
-        score_evolution=score_evolution,
+    return _run_critique_loop(
+        lambda instruction: generate_blog_draft(brief, signal, positioning, draft_instruction=instruction),
+        "blog",
     )
 
 
@@ -55,15 +194,9 @@ def _run_linkedin_with_critique_loop(
     signal,
     positioning,
 ) -> ContentWithCritiqueTrace:
-    d1 = generate_linkedin_draft(brief, signal, positioning)
-    c1 = critique_and_score(d1, "linkedin", 1)
-    d2 = generate_linkedin_draft(brief, signal, positioning, draft_instruction=c1.feedback)
-    c2 = critique_and_score(d2, "linkedin", 2)
-    return ContentWithCritiqueTrace(
-        final_content=d2,
-        drafts=[d1, d2],
-        critiques=[c1, c2],
-        score_evolution=[c1.scores, c2.scores],
+    return _run_critique_loop(
+        lambda instruction: generate_linkedin_draft(brief, signal, positioning, draft_instruction=instruction),
+        "linkedin",
     )
 
 
@@ -72,32 +205,283 @@ def _run_twitter_with_critique_loop(
     signal,
     positioning,
 ) -> ContentWithCritiqueTrace:
-    d1 = generate_twitter_thread_draft(brief, signal, positioning)
-    c1 = critique_and_score(d1, "twitter", 1)
-    d2 = generate_twitter_thread_draft(brief, signal, positioning, draft_instruction=c1.feedback)
-    c2 = critique_and_score(d2, "twitter", 2)
-    return ContentWithCritiqueTrace(
-        final_content=d2,
-        drafts=[d1, d2],
-        critiques=[c1, c2],
-        score_evolution=[c1.scores, c2.scores],
+    return _run_critique_loop(
+        lambda instruction: generate_twitter_thread_draft(brief, signal, positioning, draft_instruction=instruction),
+        "twitter",
     )
 
 
-def run_pipeline(keyword: str) -> PipelineState:
+# Rerunnable stages in dependency order; each depends on everything before it (assets only on the brief + positioning).
+_STAGE_ORDER = ("gap_analysis", "strategy_brief", "positioning", "blog", "linkedin", "twitter")
+_ASSET_LOOPS = {
+    "blog": (_run_blog_with_critique_loop, "blog"),
+    "linkedin": (_run_linkedin_with_critique_loop, "linkedin"),
+    "twitter": (_run_twitter_with_critique_loop, "twitter_thread"),
+}
+RERUN_TARGETS = (*_STAGE_ORDER, "content")
+
+
+def _draft_calls(platform: str) -> int:
+    """LLM calls for one from-scratch draft: outline + body sections + DataVex tail + coherence in sections mode."""
+    if platform != "blog" or settings.blog_generation_mode != "sections":
+        return 1
+    return 1 + max(2, settings.blog_outline_sections) + 1 + (1 if settings.blog_coherence_pass else 0)
+
+
+def _planned_llm_calls(stages: list[str]) -> int:
+    """LLM calls the given stages are expected to make, for pacing the routing budget."""
+    calls = 0
+    for name in stages:
+        if name not in _ASSET_LOOPS:
+            calls += 1
+            continue
+        n = max(1, settings.best_of_n.get(name, 1))
+        extra_critique = 1 if n > 1 and settings.best_of_n_scorer == "flash" else 0
+        draft = _draft_calls(name)
+        revision = 1 if settings.revision_mode == "edit" else draft
+        calls += n * (draft + revision) + 2 * (n + extra_critique)  # two rounds of N drafts + N critiques
+    return calls
+
+
+def _budget_or_default(latency_budget_seconds: float | None) -> float | None:
+    if latency_budget_seconds is not None:
+        return latency_budget_seconds
+    return settings.latency_budget_seconds or None
+
+
+def _token_budget_or_default(token_budget: int | None) -> int | None:
+    if token_budget is not None:
+        return token_budget
+    return settings.run_token_budget or None
+
+
+def _record_tokens(state: PipelineState, tokens: RunTokens) -> None:
+    state.token_usage = tokens.total()
+    state.token_usage_by_stage = dict(tokens.by_stage)
+    state.token_budget = tokens.budget
+    state.degradations = list(tokens.degradations)
+
+
+def _record_cancelled(reason: str, planned_calls: int, counter: LLMCallCounter) -> None:
+    saved = max(0, planned_calls - counter.calls) + counter.abandoned
+    PIPELINE_RUNS.labels(outcome="cancelled").inc()
+    LLM_CALLS_SAVED.inc(saved)
+    logger.info(
+        "pipeline_cancelled",
+        reason=reason,
+        llm_calls_made=counter.calls,
+        llm_calls_abandoned=counter.abandoned,
+        llm_calls_saved=saved,
+    )
+
+
+def _record_circuit_open(e: CircuitOpen, counter: LLMCallCounter) -> None:
+    PIPELINE_RUNS.labels(outcome="circuit_open").inc()
+    logger.warning("pipeline_circuit_open", retry_after=round(e.retry_after, 1), llm_calls_made=counter.calls)
+
+
+def _profile_label(keyword: str) -> str:
+    slug = re.sub(r"[^a-z0-9]+", "-", keyword.lower()).strip("-")[:40] or "run"
+    return f"{time.strftime('%Y%m%d-%H%M%S')}-{slug}"
+
+
+def run_pipeline(
+    keyword: str,
+    profile: bool = False,
+    latency_budget_seconds: float | None = None,
+    cancel: CancellationToken | None = None,
+    token_budget: int | None = None,
+    tenant: str | None = None,
+) -> PipelineState:
     """
     Run full pipeline. Aborts if signal confidence below threshold.
-    Records stage timings and total latency.
+    Records stage timings and total latency. With profile=True, also writes a stack-sample
+    flamegraph and an allocation snapshot for this run and attaches their paths to state.profile.
+    With a latency budget (argument, else settings.latency_budget_seconds), Pro calls may be routed to
+    the content model; decisions are recorded in state.routing_decisions.
+    Cancelling `cancel` stops the run at the next stage or LLM call with RunCancelled; LLM calls in flight
+    are abandoned.
+    While the LLM circuit breaker is open the run stops with CircuitOpen (at once, or after the stage it opened in).
+    Token usage per stage and in total is recorded on the state; with a token budget (argument, else
+    settings.run_token_budget), optional work is dropped once it would not fit, listed in state.degradations.
+    Retrieval uses the corpus of tenant (None = DEFAULT_TENANT); an unknown tenant raises UnknownTenant.
     """
-    state = PipelineState(keyword=keyword)
     t0 = time.perf_counter()
-    stage_timings = {}
+    run_id = uuid.uuid4().hex[:12]
+    tenant = get_tenant(tenant).name
+    budget_seconds = _budget_or_default(latency_budget_seconds)
+    planned_calls = _planned_llm_calls(list(_STAGE_ORDER))
+    with (
+        structlog.contextvars.bound_contextvars(run_id=run_id, keyword=keyword, tenant=tenant),
+        tenant_scope(tenant),
+        profile_run(_profile_label(keyword)) if profile else nullcontext() as artifacts,
+        span("pipeline.run", run_id=run_id, keyword=keyword, tenant=tenant, profiled=profile) as root,
+        latency_budget(budget_seconds, planned_calls) as budget,
+        cancellation_scope(cancel),
+        count_llm_calls() as calls,
+        token_accounting(_token_budget_or_default(token_budget)) as tokens,
+        circuit_scope(),
+    ):
+        logger.info("pipeline_started", profiled=profile)
+        try:
+            state = _run_stages(keyword, run_id, t0, tenant)
+        except RunCancelled as e:
+            _record_cancelled(str(e), planned_calls, calls)
+            root.set_attribute("cancelled", True)
+            raise
+        except CircuitOpen as e:
+            _record_circuit_open(e, calls)
+            root.set_attribute("circuit_open", True)
+            raise
+        except Exception:
+            PIPELINE_RUNS.labels(outcome="error").inc()
+            logger.exception("pipeline_failed")
+            raise
+        root.set_attribute("aborted", state.aborted)
+        if budget is not None:
+            state.latency_budget_seconds = budget_seconds
+            state.routing_decisions = list(budget.decisions)
+        _record_tokens(state, tokens)
+        logger.info(
+            "pipeline_finished",
+            aborted=state.aborted,
+            total_latency_seconds=state.total_latency_seconds,
+            total_tokens=state.token_usage.total_tokens,
+            degradations=len(state.degradations),
+        )
+    if artifacts is not None:
+        state.profile = artifacts
+    PIPELINE_RUNS.labels(outcome="aborted" if state.aborted else "completed").inc()
+    PIPELINE_DURATION.observe(time.perf_counter() - t0)
+    save_run(state)
+    return state
+
+
+def rerun_pipeline(
+    previous: PipelineState,
+    target: str,
+    latency_budget_seconds: float | None = None,
+    cancel: CancellationToken | None = None,
+    token_budget: int | None = None,
+) -> PipelineState:
+    """
+    Re-execute one stage of a finished run plus the stages that depend on it, reusing everything upstream
+    (signal, and e.g. strategy_brief + positioning when only an asset is regenerated). target is one of
+    RERUN_TARGETS; "content" regenerates all three assets. Returns a new state with its own run_id and
+    parent_run_id pointing at the previous run; stage_timings_seconds and token usage cover only re-executed stages.
+    Cancelling `cancel` stops the rerun at the next stage or LLM call with RunCancelled.
+    """
+    if target not in RERUN_TARGETS:
+        raise ValueError(f"Unknown rerun target {target!r}; expected one of {', '.join(RERUN_TARGETS)}")
+    if previous.aborted or previous.signal_result is None:
+        raise ValueError("Cannot rerun stages of an aborted run; run the full pipeline instead.")
+    if target == "content":
+        stages = ["blog", "linkedin", "twitter"]
+    elif target in _ASSET_LOOPS:
+        stages = [target]
+    else:
+        stages = list(_STAGE_ORDER[_STAGE_ORDER.index(target):])
+    upstream = {"strategy_brief": ("gap_analysis",), "positioning": ("strategy_brief",)}
+    required = ("strategy_brief", "positioning") if stages[0] in _ASSET_LOOPS else upstream.get(stages[0], ())
+    missing = [r for r in required if getattr(previous, r) is None]
+    if missing:
+        raise ValueError(f"Run {previous.run_id or '(unsaved)'} has no {', '.join(missing)} to reuse for {target!r}.")
+    if len(stages) == 1 and previous.content_assets is None:
+        raise ValueError("Run has no content assets to patch; use target 'content'.")
+
+    tenant = get_tenant(previous.tenant).name
+    t0 = time.perf_counter()
+    run_id = uuid.uuid4().hex[:12]
+    state = previous.model_copy(
+        deep=True,
+        update={
+            "tenant": tenant,
+            "run_id": run_id,
+            "parent_run_id": previous.run_id or None,
+            "created_at": time.time(),
+            "stage_timings_seconds": {},
+            "profile": None,
+            "latency_budget_seconds": None,
+            "routing_decisions": [],
+        },
+    )
+    stage_timings: dict[str, float] = {}
+    keyword = state.keyword
+    planned_calls = _planned_llm_calls(stages)
+    with (
+        structlog.contextvars.bound_contextvars(run_id=run_id, keyword=keyword, tenant=tenant),
+        tenant_scope(tenant),
+        span("pipeline.rerun", run_id=run_id, parent_run_id=previous.run_id, target=target),
+        latency_budget(_budget_or_default(latency_budget_seconds), planned_calls) as budget,
+        cancellation_scope(cancel),
+        count_llm_calls() as calls,
+        token_accounting(_token_budget_or_default(token_budget)) as tokens,
+        circuit_scope(),
+    ):
+        logger.info("pipeline_rerun_started", parent_run_id=previous.run_id, target=target, stages=stages)
+        try:
+            _rerun_stages(state, stages, stage_timings)
+        except RunCancelled as e:
+            _record_cancelled(str(e), planned_calls, calls)
+            raise
+        except CircuitOpen as e:
+            _record_circuit_open(e, calls)
+            raise
+        if budget is not None:
+            state.latency_budget_seconds = budget.budget_seconds
+            state.routing_decisions = list(budget.decisions)
+        _record_tokens(state, tokens)
+
+    state.total_latency_seconds = round(time.perf_counter() - t0, 2)
+    state.stage_timings_seconds = stage_timings
+    PIPELINE_RUNS.labels(outcome="rerun").inc()
+    logger.info("pipeline_rerun_finished", total_latency_seconds=state.total_latency_seconds)
+    save_run(state)
+    return state
+
+
+def _run_positioning(state: PipelineState, brief: StrategyBrief, stage_timings: dict[str, float]) -> PositioningHooks:
+    """Positioning stage; its retrieval's latency is recorded as positioning_retrieval and its cache outcome on state."""
+    retrieval = retrieve_positioning_context(brief)
+    stage_timings["positioning_retrieval"] = round(retrieval.seconds, 4)
+    state.retrieval_cache = retrieval.cache
+    state.positioning = run_positioning_engine(brief, retrieval.docs)
+    return state.positioning
+
+
+def _rerun_stages(state: PipelineState, stages: list[str], stage_timings: dict[str, float]) -> None:
+    keyword = state.keyword
+    signal = state.signal_result.signal
+    if "gap_analysis" in stages:
+        with _stage("gap_analysis", stage_timings):
+            state.gap_analysis = run_gap_analysis(keyword, signal)
+    if "strategy_brief" in stages:
+        with _stage("strategy_brief", stage_timings):
+            state.strategy_brief = run_strategy_brief(keyword, signal, state.gap_analysis)
+    if "positioning" in stages:
+        with _stage("positioning", stage_timings):
+            _run_positioning(state, state.strategy_brief, stage_timings)
+
+    traces = {}
+    for name in (s for s in stages if s in _ASSET_LOOPS):
+        loop, _ = _ASSET_LOOPS[name]
+        with _stage(name, stage_timings):
+            traces[name] = loop(state.strategy_brief, signal, state.positioning)
+    if len(traces) == len(_ASSET_LOOPS):
+        state.content_assets = ContentAssets(**{field: traces[name] for name, (_, field) in _ASSET_LOOPS.items()})
+    else:
+        for name, trace in traces.items():
+            setattr(state.content_assets, _ASSET_LOOPS[name][1], trace)
+
+
+def _run_stages(keyword: str, run_id: str, t0: float, tenant: str) -> PipelineState:
+    state = PipelineState(keyword=keyword, tenant=tenant, run_id=run_id, created_at=time.time())
+    stage_timings: dict[str, float] = {}
 
     # 1) Signal discovery
-    t = time.perf_counter()
-    signal_result = run_signal_discovery(keyword)
-    state.signal_result = signal_result
-    stage_timings["signal"] = round(time.perf_counter() - t, 2)
+    with _stage("signal", stage_timings):
+        signal_result = run_signal_discovery(keyword)
+        state.signal_result = signal_result
 
     if signal_result.abort_reason or signal_result.confidence_score < settings.signal_confidence_threshold:
         state.aborted = True
@@ -111,35 +495,28 @@ def run_pipeline(keyword: str) -> PipelineState:
     signal = signal_result.signal
 
     # 2) Gap analysis
-    t = time.perf_counter()
-    gap = run_gap_analysis(keyword, signal)
-    state.gap_analysis = gap
-    stage_timings["gap_analysis"] = round(time.perf_counter() - t, 2)
+    with _stage("gap_analysis", stage_timings):
+        gap = run_gap_analysis(keyword, signal)
+        state.gap_analysis = gap
 
     # 3) Strategy brief
-    t = time.perf_counter()
-    brief = run_strategy_brief(keyword, signal, gap)
-    state.strategy_brief = brief
-    stage_timings["strategy_brief"] = round(time.perf_counter() - t, 2)
+    with _stage("strategy_brief", stage_timings):
+        brief = run_strategy_brief(keyword, signal, gap)
+        state.strategy_brief = brief
 
     # 4) Positioning
-    t = time.perf_counter()
-    positioning = run_positioning_engine(brief)
-    state.positioning = positioning
-    stage_timings["positioning"] = round(time.perf_counter() - t, 2)
+    with _stage("positioning", stage_timings):
+        positioning = _run_positioning(state, brief, stage_timings)
 
     # 5) Content + critique loops (all three assets)
-    t = time.perf_counter()
-    blog_trace = _run_blog_with_critique_loop(brief, signal, positioning)
-    stage_timings["blog"] = round(time.perf_counter() - t, 2)
+    with _stage("blog", stage_timings):
+        blog_trace = _run_blog_with_critique_loop(brief, signal, positioning)
 
-    t = time.perf_counter()
-    linkedin_trace = _run_linkedin_with_critique_loop(brief, signal, positioning)
-    stage_timings["linkedin"] = round(time.perf_counter() - t, 2)
+    with _stage("linkedin", stage_timings):
+        linkedin_trace = _run_linkedin_with_critique_loop(brief, signal, positioning)
 
-    t = time.perf_counter()
-    twitter_trace = _run_twitter_with_critique_loop(brief, signal, positioning)
-    stage_timings["twitter"] = round(time.perf_counter() - t, 2)
+    with _stage("twitter", stage_timings):
+        twitter_trace = _run_twitter_with_critique_loop(brief, signal, positioning)
 
     state.content_assets = ContentAssets(
         blog=blog_trace,
@@ -0,0 +1,268 @@
+"""
+Idle-time prewarming: run the pipeline for curated keywords whose stored result is missing or stale,
+so the first live request for them can be served from the run store.
+
+A background thread starts a prewarm run only when no live run is in flight and none has started for
+PREWARM_IDLE_SECONDS, and only while the rolling LLM-call budget lasts. A live request cancels the
+prewarm run in progress (it stops before its next stage or LLM call) and the keyword is retried later.
+With several worker processes, one of them (holding a lock in RUN_STORE_DIR) does the prewarming. Every
+worker publishes its live-run count to RUN_STORE_DIR/.traffic/<pid>.json, so the leader stays idle (and
+cancels its prewarm run) while any worker is serving live traffic.
+"""
+import json
+import os
+import threading
+import time
+from collections import deque
+from contextlib import contextmanager
+from pathlib import Path
+from typing import Iterator
+
+from agents.signal import curated_keywords
+from config import settings
+from memory.run_store import fresh_run_for_keyword
+from utils.cancellation import CancellationToken, RunCancelled
+from utils.circuit import CircuitOpen, get_circuit_breaker
+from utils.llm import count_llm_calls
+from utils.logging import get_logger
+from utils.metrics import PREWARM_LLM_CALLS, PREWARM_RUNS
+
+from .admission import BATCH, get_admission_controller
+from .pipeline import _STAGE_ORDER, _planned_llm_calls, run_pipeline
+
+try:
+    import fcntl
+except ImportError:  # pragma: no cover - non-POSIX
+    fcntl = None
+
+logger = get_logger(__name__)
+
+_traffic_lock = threading.Lock()
+_live_runs = 0
+_last_live = 0.0
+_scheduler: "PrewarmScheduler | None" = None
+
+
+def _traffic_dir() -> Path:
+    return Path(settings.run_store_dir) / ".traffic"
+
+
+def _publish_traffic_locked() -> None:
+    """Write this worker's live-run count and last live activity (wall clock) for the prewarm leader."""
+    if not settings.prewarm_enabled:
+        return
+    path = _traffic_dir() / f"{os.getpid()}.json"
+    try:
+        path.parent.mkdir(parents=True, exist_ok=True)
+        tmp = path.with_suffix(".tmp")
+        tmp.write_text(json.dumps({"live_runs": _live_runs, "last_live": _last_live}), encoding="utf-8")
+        tmp.replace(path)
+    except OSError as e:
+        logger.warning("prewarm_traffic_publish_failed", error=str(e))
+
+
+def _pid_alive(pid: int) -> bool:
+    if os.name != "posix":
+        return True
+    try:
+        os.kill(pid, 0)
+    except ProcessLookupError:
+        return False
+    except PermissionError:
+        pass
+    return True
+
+
+def _all_workers_traffic() -> tuple[int, float]:
+    """(live runs in flight, last live activity) summed over the workers sharing RUN_STORE_DIR."""
+    with _traffic_lock:
+        live, last = _live_runs, _last_live
+    for path in _traffic_dir().glob("*.json"):
+        try:
+            pid = int(path.stem)
+            if pid == os.getpid():
+                continue
+            if not _pid_alive(pid):
+                path.unlink(missing_ok=True)  # a worker that exited without cleaning up
+                continue
+            data = json.loads(path.read_text(encoding="utf-8"))
+        except (OSError, ValueError):
+            continue
+        live += int(data.get("live_runs", 0))
+        last = max(last, float(data.get("last_live", 0.0)))
+    return live, last
+
+
+@contextmanager
+def live_traffic() -> Iterator[None]:
+    """Mark a live (user-facing) run as in flight; cancels any prewarm run so it yields immediately."""
+    global _live_runs, _last_live
+    with _traffic_lock:
+        _live_runs += 1
+        _last_live = time.time()
+        _publish_traffic_locked()
+    if _scheduler is not None:
+        _scheduler.yield_to_live()
+    try:
+        yield
+    finally:
+        with _traffic_lock:
+            _live_runs -= 1
+            _last_live = time.time()
+            _publish_traffic_locked()
+
+
+def _has_live_runs() -> bool:
+    return _all_workers_traffic()[0] > 0
+
+
+def _is_idle() -> bool:
+    live, last = _all_workers_traffic()
+    return live == 0 and time.time() - last >= settings.prewarm_idle_seconds
+
+
+def is_fresh(keyword: str) -> bool:
+    """/api/run would serve the stored run for keyword (see memory.run_store.fresh_run_for_keyword)."""
+    return fresh_run_for_keyword(keyword) is not None
+
+
+class PrewarmScheduler:
+    def __init__(self) -> None:
+        self._halt = threading.Event()
+        self._thread = threading.Thread(target=self._loop, name="prewarm", daemon=True)
+        self._current: CancellationToken | None = None
+        self._current_lock = threading.Lock()
+        self._spent: deque[tuple[float, int]] = deque()  # (monotonic time, LLM calls) per prewarm run
+        self._retry_after: dict[str, float] = {}  # keyword -> monotonic time it may be tried again
+        self._leader_file = None
+
+    def start(self) -> None:
+        self._thread.start()
+
+    def stop(self) -> None:
+        self._halt.set()
+        self.yield_to_live()
+        self._thread.join(timeout=5)
+        if self._leader_file is not None:
+            self._leader_file.close()
+        (_traffic_dir() / f"{os.getpid()}.json").unlink(missing_ok=True)
+
+    def yield_to_live(self) -> None:
+        with self._current_lock:
+            if self._current is not None:
+                self._current.cancel("live traffic")
+
+    def _is_leader(self) -> bool:
+        if self._leader_file is not None or fcntl is None:
+            return True
+        path = Path(settings.run_store_dir) / ".prewarm.lock"
+        path.parent.mkdir(parents=True, exist_ok=True)
+        f = path.open("a")
+        try:
+            fcntl.flock(f.fileno(), fcntl.LOCK_EX | fcntl.LOCK_NB)
+        except OSError:
+            f.close()
+            return False
+        self._leader_file = f
+        return True
+
+    def _budget_left(self) -> int:
+        cutoff = time.monotonic() - settings.prewarm_budget_window_seconds
+        while self._spent and self._spent[0][0] < cutoff:
+            self._spent.popleft()
+        return settings.prewarm_llm_budget - sum(calls for _, calls in self._spent)
+
+    def _next_keyword(self) -> str | None:
+        now = time.monotonic()
+        keywords = dict.fromkeys(k.strip() for k in [*curated_keywords(), *settings.prewarm_keywords] if k.strip())
+        for keyword in keywords:
+            if self._retry_after.get(keyword, 0.0) > now:
+                continue
+            if not is_fresh(keyword):
+                return keyword
+        return None
+
+    def _loop(self) -> None:
+        while not self._halt.wait(settings.prewarm_poll_seconds):
+            try:
+                self._tick()
+            except Exception:
+                logger.exception("prewarm_tick_failed")
+
+    def _tick(self) -> None:
+        if not _is_idle() or get_circuit_breaker().is_open() or not self._is_leader():
+            return
+        if self._budget_left() < _planned_llm_calls(list(_STAGE_ORDER)):
+            return
+        keyword = self._next_keyword()
+        if keyword is None:
+            return
+        admission = get_admission_controller()
+        if not admission.try_acquire_batch():
+            return
+        try:
+            self._prewarm(keyword)
+        finally:
+            admission.release(BATCH)
+
+    def _yield_to_other_workers(self, token: CancellationToken, done: threading.Event) -> None:
+        """Live traffic in another worker does not reach yield_to_live here; poll for it while prewarming."""
+        while not done.wait(settings.prewarm_poll_seconds):
+            if _has_live_runs():
+                token.cancel("live traffic")
+                return
+
+    def _prewarm(self, keyword: str) -> None:
+        token = CancellationToken()
+        with self._current_lock:
+            self._current = token
+        outcome = "error"
+        logger.info("prewarm_started", prewarm_keyword=keyword)
+        done = threading.Event()
+        threading.Thread(
+            target=self._yield_to_other_workers, args=(token, done), name="prewarm-traffic", daemon=True
+        ).start()
+        with count_llm_calls() as counter:
+            try:
+                state = run_pipeline(keyword, cancel=token)
+                outcome = "aborted" if state.aborted else "completed"
+            except RunCancelled:
+                outcome = "cancelled"
+            except CircuitOpen:
+                outcome = "circuit_open"
+            except Exception:
+                logger.exception("prewarm_failed", prewarm_keyword=keyword)
+            finally:
+                done.set()
+                with self._current_lock:
+                    self._current = None
+        self._spent.append((time.monotonic(), counter.calls))
+        PREWARM_RUNS.labels(outcome=outcome).inc()
+        PREWARM_LLM_CALLS.inc(counter.calls)
+        if outcome in ("aborted", "error"):
+            self._retry_after[keyword] = time.monotonic() + settings.prewarm_retry_seconds
+        logger.info("prewarm_finished", prewarm_keyword=keyword, outcome=outcome, llm_calls=counter.calls)
+
+
+def start_prewarm() -> None:
+    """Start the background scheduler if PREWARM_ENABLED (requires the run store and CACHED_RESULT_MAX_AGE_SECONDS > 0)."""
+    global _scheduler
+    if not settings.prewarm_enabled or _scheduler is not None:
+        return
+    if not settings.run_store_enabled:
+        logger.warning("prewarm_disabled_without_run_store")
+        return
+    if settings.cached_result_max_age_seconds <= 0:
+        # /api/run would never serve what prewarming stores.
+        logger.warning("prewarm_disabled_without_cached_results")
+        return
+    _scheduler = PrewarmScheduler()
+    _scheduler.start()
+    logger.info("prewarm_scheduler_started", budget=settings.prewarm_llm_budget)
+
+
+def stop_prewarm() -> None:
+    global _scheduler
+    if _scheduler is not None:
+        _scheduler.stop()
+        _scheduler = None
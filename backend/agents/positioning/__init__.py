@@ -1,3 +1,3 @@
-from .engine import run_positioning_engine
+from .engine import retrieve_positioning_context, run_positioning_engine
 
-__all__ = ["run_positioning_engine"]
+__all__ = ["retrieve_positioning_context", "run_positioning_engine"]
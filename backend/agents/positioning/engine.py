@@ -1,38 +1,53 @@
 """DataVex positioning engine: RAG-grounded hooks for blog tail, LinkedIn, Twitter. Philosophy tie-in, not sales."""
 import json
 import re
+from typing import TYPE_CHECKING
 
+from langchain_core.documents import Document
 from langchain_core.messages import HumanMessage, SystemMessage
-from langchain_google_genai import ChatGoogleGenerativeAI
 
-from config.settings import require_google_api_key, settings
-from memory import get_datavex_retriever
+from config.settings import settings
+from memory.retrieval_cache import Retrieval, retrieve
 from utils.schemas import PositioningHooks, StrategyBrief
+from utils.llm import get_chat_model, invoke_llm
 from utils.logging import get_logger
+from utils.metrics import RETRIEVER_DURATION
+from utils.routing import route_model
+from utils.tracing import span
+
+if TYPE_CHECKING:
+    from langchain_google_genai import ChatGoogleGenerativeAI
 
 logger = get_logger(__name__)
 
-_LLM: ChatGoogleGenerativeAI | None = None
 
+def _get_llm(stage: str) -> "ChatGoogleGenerativeAI":
+    return get_chat_model(route_model(stage, settings.llm_strategy), temperature=0.2)
 
-def _get_llm() -> ChatGoogleGenerativeAI:
-    global _LLM
-    if _LLM is None:
-        _LLM = ChatGoogleGenerativeAI(
-            model=settings.llm_strategy,
-            temperature=0.2,
-            google_api_key=require_google_api_key(),
-        )
-    return _LLM
+
+def retrieve_positioning_context(brief: StrategyBrief, k: int = 4) -> Retrieval:
+    """DataVex context for the brief's thesis + angle, through the retrieval cache (see memory.retrieval_cache)."""
+    query = brief.core_thesis + " " + brief.chosen_angle
+    with span("retriever.query", **{"retriever.k": k, "retriever.query_chars": len(query)}) as s:
+        result = retrieve(query, k=k)
+        RETRIEVER_DURATION.observe(result.seconds)
+        s.set_attributes(**{"retriever.num_docs": len(result.docs), "retriever.cache": result.cache})
+    logger.info(
+        "positioning_retrieval",
+        cache=result.cache,
+        similarity=result.similarity,
+        seconds=round(result.seconds, 4),
+    )
+    return result
 
 
-def run_positioning_engine(brief: StrategyBrief) -> PositioningHooks:
+def run_positioning_engine(brief: StrategyBrief, docs: list[Document] | None = None) -> PositioningHooks:
     """
-    Retrieve DataVex context via RAG, then generate positioning hooks.
+    Retrieve DataVex context via RAG (unless docs were already retrieved), then generate positioning hooks.
     DataVex appears as philosophy/capability, not sales pitch. Blog gets a tail insight (final 10–15%).
     """
-    retriever = get_datavex_retriever(k=4)
-    docs = retriever.invoke(brief.core_thesis + " " + brief.chosen_angle)
+    if docs is None:
+        docs = retrieve_positioning_context(brief).docs
     context = "\n\n".join(d.page_content for d in docs)
 
     system = """You are aligning content to DataVex's positioning. DataVex: AI-powered data integration with built-in RAG pipelines. Official website: https://datavex.ai. Audience: data engineers, ML engineers, AI product managers. Tone: technical, direct, slightly contrarian.
@@ -52,7 +67,7 @@ DataVex context (from our corpus):
 Generate positioning hooks. Output ONLY valid JSON, no markdown."""
 
     try:
-        resp = _get_llm().invoke([SystemMessage(content=system), HumanMessage(content=user)])
+        resp = invoke_llm(_get_llm("positioning"), [SystemMessage(content=system), HumanMessage(content=user)], stage="positioning")
         text = resp.content.strip()
         if "```" in text:
             text = re.sub(r"^```(?:json)?\s*", "", text)
@@ -0,0 +1,3 @@
+from .editor import EditError, apply_edits, request_edits, revise_draft, split_sections
+
+__all__ = ["EditError", "apply_edits", "request_edits", "revise_draft", "split_sections"]
@@ -0,0 +1,179 @@
+"""
+Edit-based revisions for round 2 of the critique loop.
+
+Instead of rewriting the whole asset, the model sees draft 1 split into numbered sections (blog: heading
+sections, else paragraphs; LinkedIn: paragraphs; Twitter: tweets) plus the critique, and returns JSON edits
+that replace, delete or insert sections. The edits are applied locally, so output tokens scale with what
+changes rather than with the length of the asset. If the reply cannot be parsed or applied, the caller's
+full regeneration is used instead.
+"""
+import json
+import re
+from typing import TYPE_CHECKING, Callable
+
+from langchain_core.messages import HumanMessage, SystemMessage
+
+from config.settings import settings
+from utils.cancellation import RunCancelled
+from utils.llm import get_chat_model, invoke_llm
+from utils.logging import get_logger
+from utils.metrics import REVISIONS
+
+if TYPE_CHECKING:
+    from langchain_google_genai import ChatGoogleGenerativeAI
+
+logger = get_logger(__name__)
+
+_HEADING = re.compile(r"^#{1,6}\s", re.M)
+_PARAGRAPH_BREAK = re.compile(r"\n\s*\n")
+
+# platform -> (asset name, section unit, constraints the edits must keep)
+_PLATFORMS = {
+    "blog": ("blog post", "section", "800–1200 words; DataVex only in the final 10–15%; no hype words or sales CTAs"),
+    "linkedin": ("LinkedIn post", "paragraph", "200–300 words; strong opening hook; at most one short DataVex mention"),
+    "twitter": (
+        "Twitter/X thread",
+        "tweet",
+        "5–8 tweets, one per line, each at most 280 characters; DataVex only in the final tweet",
+    ),
+}
+
+
+class EditError(ValueError):
+    """The model's edits cannot be applied to the draft."""
+
+
+def _get_llm() -> "ChatGoogleGenerativeAI":
+    return get_chat_model(settings.llm_content, temperature=0.3)
+
+
+def split_sections(draft: str, platform: str) -> list[str]:
+    """Units edits address: tweets (lines), blog heading sections (if it has 2+ headings), else paragraphs."""
+    text = draft.strip()
+    if platform == "twitter":
+        return [line.strip() for line in text.splitlines() if line.strip()]
+    if platform == "blog":
+        starts = [m.start() for m in _HEADING.finditer(text)]
+        if len(starts) >= 2:
+            bounds = ([0] if starts[0] > 0 else []) + starts + [len(text)]
+            return [s for s in (text[a:b].strip() for a, b in zip(bounds, bounds[1:])) if s]
+    return [p.strip() for p in _PARAGRAPH_BREAK.split(text) if p.strip()]
+
+
+def _join(sections: list[str], platform: str) -> str:
+    return ("\n" if platform == "twitter" else "\n\n").join(sections)
+
+
+def _edit_text(edit: dict, platform: str) -> str:
+    text = edit.get("text")
+    if not isinstance(text, str) or not text.strip():
+        raise EditError(f"{edit.get('op')} edit without text")
+    return " ".join(text.split()) if platform == "twitter" else text.strip()
+
+
+def apply_edits(sections: list[str], edits: list[dict], platform: str) -> list[str]:
+    """
+    Apply replace / delete / insert_after edits (1-based section numbers of the original draft; insert_after 0
+    inserts at the start). Raises EditError for unknown ops, out-of-range sections, or two replace/delete edits
+    on the same section.
+    """
+    replaced: dict[int, str | None] = {}  # section -> new text, None = deleted
+    inserted: dict[int, list[str]] = {}
+    for edit in edits:
+        if not isinstance(edit, dict):
+            raise EditError("edit is not an object")
+        op, section = edit.get("op"), edit.get("section")
+        if not isinstance(section, int) or isinstance(section, bool):
+            raise EditError(f"section must be an integer, got {section!r}")
+        if op in ("replace", "delete"):
+            if not 1 <= section <= len(sections):
+                raise EditError(f"{op} of section {section}; draft has {len(sections)}")
+            if section in replaced:
+                raise EditError(f"section {section} edited twice")
+            replaced[section] = _edit_text(edit, platform) if op == "replace" else None
+        elif op == "insert_after":
+            if not 0 <= section <= len(sections):
+                raise EditError(f"insert after section {section}; draft has {len(sections)}")
+            inserted.setdefault(section, []).append(_edit_text(edit, platform))
+        else:
+            raise EditError(f"unknown op {op!r}")
+
+    out = list(inserted.get(0, []))
+    for i, original in enumerate(sections, start=1):
+        new = replaced.get(i, original)
+        if new is not None:
+            out.append(new)
+        out.extend(inserted.get(i, []))
+    if not out:
+        raise EditError("edits delete the whole draft")
+    return out
+
+
+def _parse_edits(text: str, allow_empty: bool = False) -> list[dict]:
+    text = text.strip()
+    if "```" in text:
+        text = re.sub(r"^```(?:json)?\s*", "", text)
+        text = re.sub(r"\s*```$", "", text)
+    try:
+        data = json.loads(text)
+    except json.JSONDecodeError as e:
+        raise EditError(f"reply is not JSON: {e}") from None
+    edits = data.get("edits") if isinstance(data, dict) else None
+    if not isinstance(edits, list) or (not edits and not allow_empty):
+        raise EditError("reply has no edits")
+    return edits
+
+
+def request_edits(
+    sections: list[str],
+    platform: str,
+    instruction: str,
+    stage: str | None = None,
+    allow_empty: bool = False,
+) -> list[dict]:
+    """
+    Ask the content model for edits to sections that address instruction; raises EditError if unusable.
+    An empty edit list is unusable unless allow_empty (for passes where "nothing to change" is a valid answer).
+    """
+    asset, unit, constraints = _PLATFORMS[platform]
+    system = f"""You revise a {asset} using editorial feedback. Change only what the feedback asks for; keep every other {unit} exactly as it is.
+Constraints the revised {asset} must meet: {constraints}.
+The draft is given as numbered {unit}s ([1], [2], ...). Reply with a JSON object listing the edits:
+{{"edits": [{{"op": "replace", "section": <n>, "text": "<new {unit}>"}}, {{"op": "delete", "section": <n>}}, {{"op": "insert_after", "section": <n, or 0 for the start>, "text": "<new {unit}>"}}]}}
+Section numbers refer to the draft as given. At most one replace or delete per {unit}. Output ONLY valid JSON."""
+
+    numbered = "\n\n".join(f"[{i}]\n{s}" for i, s in enumerate(sections, start=1))
+    user = f"""Feedback to address:
+{instruction}
+
+Draft ({len(sections)} {unit}s):
+{numbered}
+
+Return the edits as JSON."""
+
+    messages = [SystemMessage(content=system), HumanMessage(content=user)]
+    resp = invoke_llm(_get_llm(), messages, stage=stage or f"{platform}_revision")
+    return _parse_edits(resp.content or "", allow_empty)
+
+
+def revise_draft(draft: str, platform: str, instruction: str, regenerate: Callable[[str], str]) -> str:
+    """
+    Draft 2 as draft 1 plus model-proposed section edits addressing instruction (the round-1 critique).
+    Falls back to regenerate(instruction) when the draft has a single section or the edits are unusable.
+    """
+    sections = split_sections(draft, platform)
+    if len(sections) < 2:
+        REVISIONS.labels(platform=platform, method="fallback").inc()
+        return regenerate(instruction)
+    try:
+        edits = request_edits(sections, platform, instruction)
+        revised = apply_edits(sections, edits, platform)
+    except RunCancelled:
+        raise
+    except Exception as e:
+        REVISIONS.labels(platform=platform, method="fallback").inc()
+        logger.warning("revision_edits_unusable", platform=platform, error=str(e))
+        return regenerate(instruction)
+    REVISIONS.labels(platform=platform, method="edit").inc()
+    logger.info("revision_edits_applied", platform=platform, edits=len(edits), sections=len(sections))
+    return _join(revised, platform)
@@ -1,25 +1,21 @@
 """Short-form: LinkedIn (200–300 words) and Twitter thread (5–8 tweets). Platform-native, same signal/angle."""
+from typing import TYPE_CHECKING
+
 from langchain_core.messages import HumanMessage, SystemMessage
-from langchain_google_genai import ChatGoogleGenerativeAI
 
-from config.settings import require_google_api_key, settings
+from config.settings import settings
 from utils.schemas import ExternalSignal, PositioningHooks, StrategyBrief
+from utils.llm import get_chat_model, invoke_llm
 from utils.logging import get_logger
 
-logger = get_logger(__name__)
+if TYPE_CHECKING:
+    from langchain_google_genai import ChatGoogleGenerativeAI
 
-_LLM: ChatGoogleGenerativeAI | None = None
+logger = get_logger(__name__)
 
 
-def _get_llm() -> ChatGoogleGenerativeAI:
-    global _LLM
-    if _LLM is None:
-        _LLM = ChatGoogleGenerativeAI(
-            model=settings.llm_content,
-            temperature=0.5,
-            google_api_key=require_google_api_key(),
-        )
-    return _LLM
+def _get_llm() -> "ChatGoogleGenerativeAI":
+    return get_chat_model(settings.llm_content, temperature=0.5)
 
 
 def generate_linkedin_draft(
@@ -45,7 +41,7 @@ Optional DataVex mention: {positioning.linkedin_mention}
         base += f"\nRevision: {draft_instruction}\n"
     user = base + "\nWrite the LinkedIn post. Output only the post."
 
-    resp = _get_llm().invoke([SystemMessage(content=system), HumanMessage(content=user)])
+    resp = invoke_llm(_get_llm(), [SystemMessage(content=system), HumanMessage(content=user)], stage="linkedin_draft")
     return (resp.content or "").strip()
 
 
@@ -74,5 +70,5 @@ Optional DataVex: {positioning.twitter_mention}
         base += f"\nRevision: {draft_instruction}\n"
     user = base + "\nWrite the thread. One tweet per line."
 
-    resp = _get_llm().invoke([SystemMessage(content=system), HumanMessage(content=user)])
+    resp = invoke_llm(_get_llm(), [SystemMessage(content=system), HumanMessage(content=user)], stage="twitter_draft")
     return (resp.content or "").strip()
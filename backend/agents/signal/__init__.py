@@ -1,3 +1,3 @@
-from .discovery import run_signal_discovery
+from .discovery import curated_keywords, load_signal_cache, run_signal_discovery
 
-__all__ = ["run_signal_discovery"]
+__all__ = ["curated_keywords", "load_signal_cache", "run_signal_discovery"]
@@ -12,8 +12,8 @@ logger = get_logger(__name__)
 DEFAULT_CACHE_PATH = Path(__file__).resolve().parent.parent.parent / "data" / "signal_cache.json"
 
 
-def _load_signal_cache() -> dict:
-    """Load static signal cache from JSON."""
+def load_signal_cache() -> dict:
+    """Static signal cache (keyword -> curated signal entry) from SIGNAL_CACHE_PATH; {} if missing or invalid."""
     path = Path(settings.signal_cache_path)
     if not path.exists():
         path = DEFAULT_CACHE_PATH
@@ -26,6 +26,11 @@ def _load_signal_cache() -> dict:
         return {}
 
 
+def curated_keywords() -> list[str]:
+    """Keywords with a curated signal in the static cache."""
+    return list(load_signal_cache())
+
+
 def _cache_entry_to_signal(keyword: str, entry: dict) -> ExternalSignal:
     """Convert cache entry to ExternalSignal."""
     return ExternalSignal(
@@ -57,14 +62,21 @@ def _compute_confidence_from_cache(entry: dict, keyword: str) -> tuple[float, di
 
 def _try_live_signal_search(keyword: str) -> SignalResult | None:
     """
-    Try to get a signal from live web search.
-    Uses LLM + optional search API. For hackathon without Tavily, we return None and fall back to cache.
+    Best signal from the live sources in SIGNAL_SOURCES (searched concurrently, see agents.signal.search).
+    None — fall back to the cache — when live search is off, finds nothing in time or is below threshold.
     """
-    if not settings.use_live_signal_search:
+    if not settings.use_live_signal_search or not settings.signal_sources:
+        return None
+    from .search import search_signals  # httpx + numpy; only when live sources are configured
+
+    try:
+        result = search_signals(keyword)
+    except Exception as e:
+        logger.warning("live_signal_search_failed", error=str(e))
+        return None
+    if result is None or result.confidence_score < settings.signal_confidence_threshold:
         return None
-    # Optional: integrate Tavily or SerpAPI here. For now we rely on cache.
-    # If you add TAVILY_API_KEY, we could call Tavily and then use LLM to extract one signal + scores.
-    return None
+    return result
 
 
 def run_signal_discovery(keyword: str) -> SignalResult:
@@ -87,7 +99,7 @@ def run_signal_discovery(keyword: str) -> SignalResult:
         return live_result
 
     # 2) Fallback: static cache
-    cache = _load_signal_cache()
+    cache = {k.strip().lower(): v for k, v in load_signal_cache().items()}
     # Try exact key first, then any key that contains the keyword
     entry = cache.get(keyword_lower)
     if entry is None:
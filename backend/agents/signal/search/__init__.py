@@ -0,0 +1,15 @@
+from .adapters import ADAPTERS, ArxivAdapter, RssAdapter, WebSearchAdapter
+from .base import SignalCandidate, SourceAdapter
+from .engine import search_signals
+from .ranking import score_candidates
+
+__all__ = [
+    "ADAPTERS",
+    "ArxivAdapter",
+    "RssAdapter",
+    "SignalCandidate",
+    "SourceAdapter",
+    "WebSearchAdapter",
+    "score_candidates",
+    "search_signals",
+]
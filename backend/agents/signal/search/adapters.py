@@ -0,0 +1,143 @@
+"""Search source adapters: web search (Tavily-compatible JSON API), arXiv Atom API and RSS/Atom feeds."""
+import re
+import xml.etree.ElementTree as ET
+from datetime import datetime
+from email.utils import parsedate_to_datetime
+from urllib.parse import urlparse
+
+import httpx
+
+from config import settings
+
+from .base import SignalCandidate, SourceAdapter
+
+_ATOM = "{http://www.w3.org/2005/Atom}"
+_TAGS = re.compile(r"<[^>]+>")
+_SPACE = re.compile(r"\s+")
+
+
+def _clean(text: str | None) -> str:
+    return _SPACE.sub(" ", _TAGS.sub(" ", text or "")).strip()
+
+
+def _fractional_year(value: str | None) -> float | None:
+    """Parse ISO 8601 or RFC 822 dates (and bare years) into a fractional year."""
+    if not value:
+        return None
+    value = value.strip()
+    try:
+        dt = datetime.fromisoformat(value.replace("Z", "+00:00"))
+    except ValueError:
+        try:
+            dt = parsedate_to_datetime(value)
+        except (TypeError, ValueError):
+            match = re.match(r"(\d{4})", value)
+            return float(match.group(1)) if match else None
+    return dt.year + (dt.timetuple().tm_yday - 1) / 365.25
+
+
+class WebSearchAdapter(SourceAdapter):
+    """Tavily-style search API: POST {query, max_results} → {"results": [{title, url, content, score, ...}]}."""
+
+    name = "web"
+
+    def search(self, client: httpx.Client, keyword: str, limit: int) -> list[SignalCandidate]:
+        payload = {"query": keyword, "max_results": limit, "search_depth": "basic"}
+        if settings.tavily_api_key:
+            payload["api_key"] = settings.tavily_api_key
+        resp = client.post(settings.signal_web_search_url, json=payload, timeout=self.timeout)
+        resp.raise_for_status()
+        out = []
+        for item in resp.json().get("results", [])[:limit]:
+            url = item.get("url")
+            out.append(
+                SignalCandidate(
+                    title=_clean(item.get("title")),
+                    summary=_clean(item.get("content")),
+                    source=urlparse(url).netloc if url else "web",
+                    source_type="blog",
+                    url=url,
+                    year=_fractional_year(item.get("published_date")),
+                    relevance_hint=item.get("score"),
+                    adapter=self.name,
+                )
+            )
+        return out
+
+
+class ArxivAdapter(SourceAdapter):
+    """arXiv export API (Atom feed of papers matching the keyword, most relevant first)."""
+
+    name = "arxiv"
+
+    def search(self, client: httpx.Client, keyword: str, limit: int) -> list[SignalCandidate]:
+        params = {"search_query": f'all:"{keyword}"', "start": 0, "max_results": limit, "sortBy": "relevance"}
+        resp = client.get(settings.signal_arxiv_url, params=params, timeout=self.timeout)
+        resp.raise_for_status()
+        root = ET.fromstring(resp.content)
+        out = []
+        for entry in root.iter(f"{_ATOM}entry"):
+            out.append(
+                SignalCandidate(
+                    title=_clean(entry.findtext(f"{_ATOM}title")),
+                    summary=_clean(entry.findtext(f"{_ATOM}summary")),
+                    source="arXiv",
+                    source_type="paper",
+                    url=(entry.findtext(f"{_ATOM}id") or "").strip() or None,
+                    year=_fractional_year(entry.findtext(f"{_ATOM}published")),
+                    adapter=self.name,
+                )
+            )
+        return out[:limit]
+
+
+class RssAdapter(SourceAdapter):
+    """Configured RSS 2.0 / Atom feeds; items mentioning any keyword term are candidates."""
+
+    name = "rss"
+
+    def search(self, client: httpx.Client, keyword: str, limit: int) -> list[SignalCandidate]:
+        terms = [t for t in re.findall(r"[a-z0-9]+", keyword.lower()) if len(t) > 2] or [keyword.lower()]
+        out = []
+        for feed_url in settings.signal_rss_feeds:
+            try:
+                resp = client.get(feed_url, timeout=self.timeout)
+                resp.raise_for_status()
+                root = ET.fromstring(resp.content)
+            except (httpx.HTTPError, ET.ParseError):
+                continue
+            feed_title = _clean(root.findtext("channel/title") or root.findtext(f"{_ATOM}title"))
+            feed_title = feed_title or urlparse(feed_url).netloc
+            items = root.findall("channel/item") or root.findall(f"{_ATOM}entry")
+            for item in items:
+                title = _clean(item.findtext("title") or item.findtext(f"{_ATOM}title"))
+                summary = _clean(item.findtext("description") or item.findtext(f"{_ATOM}summary"))
+                text = f"{title} {summary}".lower()
+                if not any(t in text for t in terms):
+                    continue
+                link = item.findtext("link") or ""
+                atom_link = item.find(f"{_ATOM}link")
+                if not link.strip() and atom_link is not None:
+                    link = atom_link.get("href", "")
+                published = (
+                    item.findtext("pubDate") or item.findtext(f"{_ATOM}published") or item.findtext(f"{_ATOM}updated")
+                )
+                out.append(
+                    SignalCandidate(
+                        title=title,
+                        summary=summary,
+                        source=feed_title,
+                        source_type="blog",
+                        url=link.strip() or None,
+                        year=_fractional_year(published),
+                        adapter=self.name,
+                    )
+                )
+        return out[:limit]
+
+
+ADAPTERS: dict[str, type[SourceAdapter]] = {
+    WebSearchAdapter.name: WebSearchAdapter,
+    ArxivAdapter.name: ArxivAdapter,
+    RssAdapter.name: RssAdapter,
+}
@@ -0,0 +1,45 @@
+"""Candidate signals and the adapter interface every search source implements."""
+from abc import ABC, abstractmethod
+from dataclasses import dataclass
+
+import httpx
+
+from utils.schemas import ExternalSignal
+
+
+@dataclass
+class SignalCandidate:
+    title: str
+    summary: str
+    source: str
+    source_type: str  # paper | blog | survey | incident | other
+    url: str | None = None
+    year: float | None = None  # fractional year of publication (2024.5 = mid-2024)
+    citation_count: int | None = None
+    relevance_hint: float | None = None  # 0..1 relevance reported by the source itself, if any
+    adapter: str = ""
+
+    def to_signal(self) -> ExternalSignal:
+        return ExternalSignal(
+            title=self.title,
+            source=self.source,
+            source_type=self.source_type,
+            summary=self.summary,
+            url=self.url,
+            citation_count=self.citation_count,
+            year=int(self.year) if self.year else None,
+            raw_snippet=self.summary[:280] or None,
+        )
+
+
+class SourceAdapter(ABC):
+    """One search source. Subclasses set name and implement search(); base URLs come from settings."""
+
+    name = ""
+
+    def __init__(self, timeout: float):
+        self.timeout = timeout
+
+    @abstractmethod
+    def search(self, client: httpx.Client, keyword: str, limit: int) -> list[SignalCandidate]:
+        """Up to limit candidates for keyword; raise on failure (the engine records it per source)."""
@@ -0,0 +1,101 @@
+"""
+Concurrent multi-source signal search: fan out to the configured adapters, each under its own timeout,
+stop waiting at the overall deadline, then rank every candidate gathered so far and keep the best.
+"""
+import time
+from concurrent.futures import FIRST_COMPLETED, wait
+
+import httpx
+
+from config import settings
+from utils.concurrency import ContextThreadPoolExecutor
+from utils.logging import get_logger
+from utils.metrics import SIGNAL_SOURCE_DURATION
+from utils.schemas import SignalResult
+from utils.tracing import span
+
+from .adapters import ADAPTERS
+from .base import SignalCandidate, SourceAdapter
+from .ranking import score_candidates
+
+logger = get_logger(__name__)
+
+HEADERS = {"User-Agent": "DataVexGrowthEngine/1.0 (signal discovery; datavex.ai)"}
+
+
+def _adapters() -> list[SourceAdapter]:
+    out = []
+    for name in settings.signal_sources:
+        cls = ADAPTERS.get(name)
+        if cls is None:
+            logger.warning("signal_source_unknown", source=name, known=sorted(ADAPTERS))
+            continue
+        out.append(cls(timeout=settings.signal_source_timeouts.get(name, settings.signal_search_deadline_seconds)))
+    return out
+
+
+def _run_adapter(adapter: SourceAdapter, keyword: str) -> list[SignalCandidate]:
+    """Run one adapter on its own client, so a straggler outliving the search deadline never sees a closed one."""
+    with span("signal.source", source=adapter.name) as s:
+        t = time.perf_counter()
+        try:
+            with httpx.Client(headers=HEADERS, follow_redirects=True) as client:
+                found = adapter.search(client, keyword, settings.signal_search_max_results)
+        except Exception:
+            SIGNAL_SOURCE_DURATION.labels(source=adapter.name, outcome="error").observe(time.perf_counter() - t)
+            raise
+        SIGNAL_SOURCE_DURATION.labels(source=adapter.name, outcome="ok").observe(time.perf_counter() - t)
+        s.set_attribute("signal.candidates", len(found))
+        return found
+
+
+def search_signals(keyword: str) -> SignalResult | None:
+    """Best live signal for keyword across SIGNAL_SOURCES, or None if no source returned a candidate in time."""
+    adapters = _adapters()
+    if not adapters:
+        return None
+
+    candidates: list[SignalCandidate] = []
+    deadline = time.monotonic() + settings.signal_search_deadline_seconds
+    pool = ContextThreadPoolExecutor(max_workers=len(adapters), thread_name_prefix="signal-search")
+    pending = {pool.submit(_run_adapter, a, keyword): a.name for a in adapters}
+    try:
+        while pending:
+            remaining = deadline - time.monotonic()
+            if remaining <= 0:
+                break
+            done, _ = wait(pending, timeout=remaining, return_when=FIRST_COMPLETED)
+            for fut in done:
+                name = pending.pop(fut)
+                try:
+                    candidates.extend(fut.result())
+                except Exception as e:
+                    logger.warning("signal_source_failed", source=name, error=str(e))
+        for name in pending.values():
+            SIGNAL_SOURCE_DURATION.labels(source=name, outcome="deadline").observe(
+                settings.signal_search_deadline_seconds
+            )
+            logger.warning("signal_source_deadline_exceeded", source=name)
+    finally:
+        # Stragglers are bounded by their own adapter timeout and close their own client; don't hold the request.
+        pool.shutdown(wait=False, cancel_futures=True)
+
+    by_url = {c.url or f"{c.adapter}:{c.title}": c for c in candidates if c.title}
+    candidates = list(by_url.values())
+    if not candidates:
+        return None
+    scores = score_candidates(keyword, candidates)
+    best = int(scores[:, 3].argmax())
+    authority, recency, relevance, confidence = (round(float(v), 3) for v in scores[best])
+    logger.info(
+        "signal_search_ranked",
+        candidates=len(candidates),
+        best_source=candidates[best].adapter,
+        confidence=confidence,
+    )
+    return SignalResult(
+        signal=candidates[best].to_signal(),
+        confidence_score=confidence,
+        confidence_breakdown={"source_authority": authority, "recency": recency, "keyword_relevance": relevance},
+        from_cache=False,
+    )
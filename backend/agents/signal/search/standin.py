@@ -0,0 +1,114 @@
+"""
+Local stand-in for the live signal sources, so the search path runs offline.
+
+Serves a Tavily-style POST /search, an arXiv-style GET /arxiv (Atom) and GET /rss.xml, all built from the
+curated signal cache. --delay source=seconds slows one source down to exercise timeouts and the deadline.
+
+Usage (from backend/):
+    python -m agents.signal.search.standin [--port 8765] [--delay arxiv=10]
+    SIGNAL_SOURCES='["web","arxiv","rss"]' SIGNAL_WEB_SEARCH_URL=http://127.0.0.1:8765/search \\
+    SIGNAL_ARXIV_URL=http://127.0.0.1:8765/arxiv SIGNAL_RSS_FEEDS='["http://127.0.0.1:8765/rss.xml"]' uvicorn main:app
+"""
+import argparse
+import json
+import time
+from email.utils import formatdate
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from urllib.parse import parse_qs, urlparse
+from xml.sax.saxutils import escape
+
+from ..discovery import load_signal_cache
+
+
+def _entries(query: str) -> list[dict]:
+    q = query.lower().strip('"').removeprefix("all:").strip('"')
+    cache = load_signal_cache()
+    matched = [v for k, v in cache.items() if q in k.lower() or k.lower() in q or q in v.get("title", "").lower()]
+    return matched or list(cache.values())
+
+
+def _published(entry: dict) -> float:
+    return time.mktime((int(entry.get("year") or 2024), 6, 1, 0, 0, 0, 0, 0, -1))
+
+
+def _web(query: str) -> bytes:
+    results = [
+        {
+            "title": e.get("title", ""),
+            "url": e.get("url") or f"https://standin.local/web/{i}",
+            "content": e.get("summary", ""),
+            "score": e.get("relevance_score", 0.5),
+            "published_date": time.strftime("%Y-%m-%d", time.gmtime(_published(e))),
+        }
+        for i, e in enumerate(_entries(query))
+    ]
+    return json.dumps({"query": query, "results": results}).encode()
+
+
+def _arxiv(query: str) -> bytes:
+    items = "".join(
+        f"<entry><id>https://arxiv.org/abs/standin.{i:05d}</id><title>{escape(e.get('title', ''))}</title>"
+        f"<summary>{escape(e.get('summary', ''))}</summary>"
+        f"<published>{time.strftime('%Y-%m-%dT%H:%M:%SZ', time.gmtime(_published(e)))}</published></entry>"
+        for i, e in enumerate(_entries(query))
+    )
+    return f'<?xml version="1.0"?><feed xmlns="http://www.w3.org/2005/Atom">{items}</feed>'.encode()
+
+
+def _rss() -> bytes:
+    items = "".join(
+        f"<item><title>{escape(e.get('title', ''))}</title><link>https://standin.local/rss/{i}</link>"
+        f"<description>{escape(e.get('summary', ''))}</description>"
+        f"<pubDate>{formatdate(_published(e))}</pubDate></item>"
+        for i, e in enumerate(load_signal_cache().values())
+    )
+    return f'<?xml version="1.0"?><rss version="2.0"><channel><title>Stand-in feed</title>{items}</channel></rss>'.encode()
+
+
+def make_handler(delays: dict[str, float]) -> type[BaseHTTPRequestHandler]:
+    class Handler(BaseHTTPRequestHandler):
+        def _send(self, source: str, body: bytes, content_type: str) -> None:
+            time.sleep(delays.get(source, 0.0))
+            self.send_response(200)
+            self.send_header("Content-Type", content_type)
+            self.send_header("Content-Length", str(len(body)))
+            self.end_headers()
+            self.wfile.write(body)
+
+        def do_POST(self) -> None:
+            if urlparse(self.path).path != "/search":
+                self.send_error(404)
+                return
+            payload = json.loads(self.rfile.read(int(self.headers.get("Content-Length") or 0)) or b"{}")
+            self._send("web", _web(payload.get("query", "")), "application/json")
+
+        def do_GET(self) -> None:
+            url = urlparse(self.path)
+            if url.path == "/arxiv":
+                query = parse_qs(url.query).get("search_query", [""])[0]
+                self._send("arxiv", _arxiv(query), "application/atom+xml")
+            elif url.path == "/rss.xml":
+                self._send("rss", _rss(), "application/rss+xml")
+            else:
+                self.send_error(404)
+
+        def log_message(self, format: str, *args) -> None:
+            pass
+
+    return Handler
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--host", default="127.0.0.1")
+    parser.add_argument("--port", type=int, default=8765)
+    parser.add_argument("--delay", action="append", default=[], help="source=seconds (web | arxiv | rss)")
+    args = parser.parse_args()
+    delays = {k: float(v) for k, v in (d.split("=", 1) for d in args.delay)}
+    server = ThreadingHTTPServer((args.host, args.port), make_handler(delays))
+    print(f"signal stand-in on http://{args.host}:{args.port} (/search, /arxiv, /rss.xml)")
+    server.serve_forever()
+
+
+if __name__ == "__main__":
+    main()
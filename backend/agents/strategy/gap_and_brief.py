@@ -1,33 +1,29 @@
 """Competitive gap analysis and strategy brief (editorial judgment). Uses LLM only; no RAG for decisions."""
 import json
 import re
+from typing import TYPE_CHECKING
 
 from langchain_core.messages import HumanMessage, SystemMessage
-from langchain_google_genai import ChatGoogleGenerativeAI
 
-from config.settings import require_google_api_key, settings
+from config.settings import settings
 from utils.schemas import (
     ExternalSignal,
     GapAnalysis,
     RejectedAngle,
     StrategyBrief,
 )
+from utils.llm import get_chat_model, invoke_llm
 from utils.logging import get_logger
+from utils.routing import route_model
 
-logger = get_logger(__name__)
+if TYPE_CHECKING:
+    from langchain_google_genai import ChatGoogleGenerativeAI
 
-_LLM: ChatGoogleGenerativeAI | None = None
+logger = get_logger(__name__)
 
 
-def _get_llm() -> ChatGoogleGenerativeAI:
-    global _LLM
-    if _LLM is None:
-        _LLM = ChatGoogleGenerativeAI(
-            model=settings.llm_strategy,
-            temperature=0.3,
-            google_api_key=require_google_api_key(),
-        )
-    return _LLM
+def _get_llm(stage: str) -> "ChatGoogleGenerativeAI":
+    return get_chat_model(route_model(stage, settings.llm_strategy), temperature=0.3)
 
 
 def run_gap_analysis(keyword: str, signal: ExternalSignal) -> GapAnalysis:
@@ -51,7 +47,7 @@ Summary: {signal.summary}
 Analyze the content landscape for "{keyword}". What angles are saturated? What should we avoid? Output ONLY valid JSON, no markdown."""
 
     try:
-        resp = _get_llm().invoke([SystemMessage(content=system), HumanMessage(content=user)])
+        resp = invoke_llm(_get_llm("gap_analysis"), [SystemMessage(content=system), HumanMessage(content=user)], stage="gap_analysis")
         text = resp.content.strip()
         # Strip markdown code block if present
         if "```" in text:
@@ -106,7 +102,7 @@ Summary: {gap.summary}
 Generate the strategy brief. Output ONLY valid JSON, no markdown."""
 
     try:
-        resp = _get_llm().invoke([SystemMessage(content=system), HumanMessage(content=user)])
+        resp = invoke_llm(_get_llm("strategy_brief"), [SystemMessage(content=system), HumanMessage(content=user)], stage="strategy_brief")
         text = resp.content.strip()
         if "```" in text:
             text = re.sub(r"^```(?:json)?\s*", "", text)
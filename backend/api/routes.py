@@ -1,18 +1,54 @@
 """API routes: run pipeline, health."""
 import asyncio
+import math
+import time
+from pathlib import Path
 from typing import Any
 
-from fastapi import APIRouter, HTTPException
+from fastapi import APIRouter, HTTPException, Query, Request
+from fastapi.responses import FileResponse
 from pydantic import BaseModel
 
-from agents.orchestration import run_pipeline
+from agents.orchestration import (
+    RERUN_TARGETS,
+    AdmissionRejected,
+    get_admission_controller,
+    live_traffic,
+    rerun_pipeline,
+    run_pipeline,
+)
+from api.serialization import json_response, parse_fields, state_to_dict
+from config import settings
+from config.tenants import UnknownTenant, get_tenant
+from memory import fresh_run_for_keyword, latest_run_for_keyword, load_run
+from utils.cancellation import CancellationToken, RunCancelled
+from utils.circuit import CircuitOpen, get_circuit_breaker
+from utils.logging import get_logger
 from utils.schemas import PipelineState
 
+logger = get_logger(__name__)
+
 router = APIRouter()
 
+# Non-standard "client closed request" status; only logged, since nobody is left to read the response.
+_CLIENT_CLOSED_REQUEST = 499
+
 
 class RunRequest(BaseModel):
     keyword: str
+    profile: bool = False  # capture a flamegraph + allocation snapshot for this run
+    latency_budget_seconds: float | None = None  # route Pro calls to Flash as needed to fit; 0 disables
+    token_budget: int | None = None  # drop optional LLM work past this many tokens; 0 disables
+    use_cached: bool = True  # serve a recent stored run (see CACHED_RESULT_MAX_AGE_SECONDS) instead of running
+    tenant: str | None = None  # brand corpus to ground in (config.tenants); None = DEFAULT_TENANT
+
+
+class RerunRequest(BaseModel):
+    target: str  # gap_analysis | strategy_brief | positioning | blog | linkedin | twitter | content
+    run_id: str | None = None  # a stored run ...
+    state: PipelineState | None = None  # ... or a full previous PipelineState
+    latency_budget_seconds: float | None = None
+    token_budget: int | None = None
 
 
 class RunResponse(BaseModel):
@@ -22,29 +58,205 @@ class RunResponse(BaseModel):
     total_latency_seconds: float
     stage_timings_seconds: dict[str, float]
     result: dict[str, Any] | None  # full PipelineState as dict for flexibility
+    cached: bool = False  # served from the run store (e.g. prewarmed) rather than run for this request
+    stale: bool = False  # served from the run store because the LLM circuit is open (result.stale_reason says why)
+
+
+async def _run_until_disconnect(request: Request, fn, *args, **kwargs) -> PipelineState:
+    """
+    Run fn(*args, **kwargs, cancel=token) in a worker thread while polling for client disconnect. On disconnect the
+    token is cancelled so the run stops at its next stage or LLM call instead of finishing unread.
+    """
+    token = CancellationToken()
+    task = asyncio.ensure_future(asyncio.to_thread(fn, *args, **kwargs, cancel=token))
+    try:
+        while True:
+            done, _ = await asyncio.wait({task}, timeout=settings.disconnect_poll_seconds)
+            if done:
+                return task.result()
+            if await request.is_disconnected():
+                logger.info("client_disconnected", path=request.url.path)
+                token.cancel("client disconnected")
+                return await task
+    except RunCancelled:
+        raise HTTPException(status_code=_CLIENT_CLOSED_REQUEST, detail="client disconnected; run cancelled")
+    except asyncio.CancelledError:
+        # Server shutdown or the ASGI task itself being cancelled: stop the worker too.
+        token.cancel("request cancelled")
+        raise
+
+
+def _llm_unavailable(retry_after: float) -> HTTPException:
+    return HTTPException(
+        status_code=503,
+        detail="LLM provider unavailable (circuit open) and no stored run to fall back to; retry later.",
+        headers={"Retry-After": str(max(1, math.ceil(retry_after)))},
+    )
+
+
+def _stale_response(keyword: str, tenant: str, e: CircuitOpen, paths: list[str], compact: bool):
+    """Last stored run for keyword and tenant flagged stale, or 503 if there is none."""
+    stored = latest_run_for_keyword(keyword, tenant)
+    if stored is None:
+        raise _llm_unavailable(e.retry_after)
+    age = time.time() - stored.created_at
+    logger.info("stale_run_served", served_run_id=stored.run_id, age_seconds=round(age))
+    stored.stale = True
+    stored.stale_reason = f"LLM circuit open; showing run {stored.run_id} from {age / 3600:.1f}h ago"
+    return _run_response(stored, paths, compact, cached=True)
+
+
+def _too_busy(e: AdmissionRejected) -> HTTPException:
+    return HTTPException(
+        status_code=429,
+        detail=f"Too many runs in progress ({e.reason}); retry later.",
+        headers={"Retry-After": str(e.retry_after)},
+    )
 
 
 @router.post("/run", response_model=RunResponse)
-async def run_growth_pipeline(body: RunRequest):
+async def run_growth_pipeline(
+    request: Request,
+    body: RunRequest,
+    fields: str | None = Query(
+        None,
+        description="Comma-separated dotted paths to keep in result, e.g. content_assets.blog.final_content,strategy_brief",
+    ),
+    compact: bool = Query(False, description="Omit intermediate drafts from content_assets"),
+):
     """
     Run the Growth Intelligence pipeline for the given keyword.
     Returns full state: signal, strategy brief, rejected angles, content assets, critique trace, latency.
+    Use `fields` and/or `compact` to shrink the result.
     """
     keyword = (body.keyword or "").strip()
     if not keyword:
         raise HTTPException(status_code=400, detail="keyword is required")
+    try:
+        tenant = get_tenant(body.tenant).name
+    except UnknownTenant as e:
+        raise HTTPException(status_code=400, detail=str(e))
+    paths = _parse_fields(fields)
+
+    if body.use_cached and not body.profile:
+        stored = fresh_run_for_keyword(keyword, tenant)
+        if stored is not None:
+            return _run_response(stored, paths, compact, cached=True)
+
+    breaker = get_circuit_breaker()
+    if breaker.is_open():
+        return _stale_response(keyword, tenant, CircuitOpen(breaker.retry_after()), paths, compact)
 
     # Run CPU/IO-heavy pipeline in thread so we don't block the event loop
-    state: PipelineState = await asyncio.to_thread(run_pipeline, keyword)
+    try:
+        async with get_admission_controller().interactive_slot() as slot:
+            with live_traffic():
+                state = await _run_until_disconnect(
+                    request,
+                    run_pipeline,
+                    keyword,
+                    body.profile,
+                    body.latency_budget_seconds,
+                    token_budget=body.token_budget,
+                    tenant=tenant,
+                )
+            if not state.aborted:
+                slot.mark_full_run()
+    except AdmissionRejected as e:
+        raise _too_busy(e)
+    except CircuitOpen as e:
+        return _stale_response(keyword, tenant, e, paths, compact)
+
+    return _run_response(state, paths, compact)
+
+
+@router.post("/rerun", response_model=RunResponse)
+async def rerun_growth_pipeline(
+    request: Request,
+    body: RerunRequest,
+    fields: str | None = Query(None, description="Same as /run"),
+    compact: bool = Query(False, description="Same as /run"),
+):
+    """
+    Re-execute one stage of a previous run (by stored run_id or full state) and only the stages that depend on it.
+    E.g. target=twitter regenerates just the thread and its critique loop, reusing brief and positioning.
+    """
+    if body.target not in RERUN_TARGETS:
+        raise HTTPException(status_code=400, detail=f"target must be one of: {', '.join(RERUN_TARGETS)}")
+    paths = _parse_fields(fields)
+    previous = body.state
+    if previous is None:
+        if not body.run_id:
+            raise HTTPException(status_code=400, detail="run_id or state is required")
+        previous = load_run(body.run_id)
+        if previous is None:
+            raise HTTPException(status_code=404, detail=f"run {body.run_id} not found")
+
+    try:
+        async with get_admission_controller().interactive_slot():
+            with live_traffic():
+                state = await _run_until_disconnect(
+                    request,
+                    rerun_pipeline,
+                    previous,
+                    body.target,
+                    body.latency_budget_seconds,
+                    token_budget=body.token_budget,
+                )
+    except AdmissionRejected as e:
+        raise _too_busy(e)
+    except CircuitOpen as e:
+        raise _llm_unavailable(e.retry_after)
+    except ValueError as e:
+        raise HTTPException(status_code=400, detail=str(e))
+    return _run_response(state, paths, compact)
 
-    return RunResponse(
+
+@router.get("/runs/{run_id}", response_model=RunResponse)
+def get_run(
+    run_id: str,
+    fields: str | None = Query(None, description="Same as /run"),
+    compact: bool = Query(False, description="Same as /run"),
+):
+    """Fetch a stored run."""
+    paths = _parse_fields(fields)
+    state = load_run(run_id)
+    if state is None:
+        raise HTTPException(status_code=404, detail=f"run {run_id} not found")
+    return _run_response(state, paths, compact)
+
+
+def _parse_fields(raw: str | None) -> list[str]:
+    try:
+        return parse_fields(raw)
+    except ValueError as e:
+        raise HTTPException(status_code=400, detail=str(e))
+
+
+def _run_response(state: PipelineState, paths: list[str], compact: bool, cached: bool = False):
+    result = state_to_dict(state, paths, compact)
+
+    response = RunResponse(
         success=not state.aborted,
         aborted=state.aborted,
         abort_reason=state.abort_reason,
         total_latency_seconds=state.total_latency_seconds,
         stage_timings_seconds=state.stage_timings_seconds,
-        result=state.model_dump() if state else None,
+        result=result,
+        cached=cached,
+        stale=state.stale,
     )
+    return json_response(response.model_dump(), endpoint="run")
+
+
+@router.get("/profiles/{name}")
+def get_profile_artifact(name: str):
+    """Download a profiling artifact (.folded stacks or .alloc.txt) written by a profiled run."""
+    base = Path(settings.profile_dir).resolve()
+    path = (base / name).resolve()
+    if path.parent != base or not path.is_file():
+        raise HTTPException(status_code=404, detail="profile artifact not found")
+    return FileResponse(path, media_type="text/plain")
 
 
 @router.get("/health")
@@ -0,0 +1,99 @@
+"""Response shaping for pipeline results: field projection, compact mode, and orjson serialization with size/timing metrics."""
+import time
+import types
+import typing
+from typing import Any
+
+import orjson
+from fastapi import Response
+from pydantic import BaseModel
+
+from utils.metrics import RESPONSE_BYTES, RESPONSE_SERIALIZE_SECONDS
+from utils.schemas import PipelineState
+
+# Intermediate drafts dominate the payload; compact mode keeps only final content, critiques and scores.
+_COMPACT_EXCLUDE = {
+    "content_assets": {
+        "blog": {"drafts"},
+        "linkedin": {"drafts"},
+        "twitter_thread": {"drafts"},
+    }
+}
+
+
+def parse_fields(raw: str | None) -> list[str]:
+    """
+    Split ?fields=a.b,c into dotted paths; empty means no projection.
+    Raises ValueError naming the first path that is not in the PipelineState schema, so a typo fails
+    before a run is started.
+    """
+    if not raw:
+        return []
+    paths = [p.strip() for p in raw.split(",") if p.strip()]
+    for path in paths:
+        if not _in_schema(PipelineState, path.split(".")):
+            raise ValueError(f"unknown field: {path}")
+    return paths
+
+
+def _in_schema(tp: Any, keys: list[str]) -> bool:
+    """Whether keys name a path through tp: model fields by name, dict values by any key."""
+    if not keys:
+        return True
+    origin = typing.get_origin(tp)
+    if origin in (typing.Union, types.UnionType):  # X | None
+        return any(_in_schema(arg, keys) for arg in typing.get_args(tp) if arg is not type(None))
+    if origin is dict:
+        return _in_schema(typing.get_args(tp)[1], keys[1:])
+    if origin is None and isinstance(tp, type) and issubclass(tp, BaseModel):
+        field = tp.model_fields.get(keys[0])
+        return field is not None and _in_schema(field.annotation, keys[1:])
+    return False
+
+
+def project(data: dict[str, Any], paths: list[str]) -> dict[str, Any]:
+    """
+    Keep only the requested dotted paths, preserving nesting:
+    project(d, ["content_assets.blog.final_content"]) -> {"content_assets": {"blog": {"final_content": ...}}}.
+    Paths are validated by parse_fields; one that runs into a None (e.g. strategy_brief of an aborted run),
+    a missing dict key or a field left out by compact mode projects to None.
+    """
+    out: dict[str, Any] = {}
+    for path in paths:
+        keys = path.split(".")
+        src: Any = data
+        for key in keys:
+            if not isinstance(src, dict) or key not in src:
+                src = None
+                break
+            src = src[key]
+        dst = out
+        for key in keys[:-1]:
+            dst = dst.setdefault(key, {})
+            if not isinstance(dst, dict):
+                break
+        else:
+            dst[keys[-1]] = src
+    return out
+
+
+def state_to_dict(state: PipelineState, fields: list[str], compact: bool) -> dict[str, Any]:
+    data = state.model_dump(exclude=_COMPACT_EXCLUDE if compact else None)
+    return project(data, fields) if fields else data
+
+
+def json_response(payload: dict[str, Any], endpoint: str) -> Response:
+    """Serialize with orjson; payload size and encode time go to metrics and response headers."""
+    t = time.perf_counter()
+    body = orjson.dumps(payload, option=orjson.OPT_NON_STR_KEYS)
+    elapsed = time.perf_counter() - t
+    RESPONSE_BYTES.labels(endpoint=endpoint).observe(len(body))
+    RESPONSE_SERIALIZE_SECONDS.labels(endpoint=endpoint).observe(elapsed)
+    return Response(
+        content=body,
+        media_type="application/json",
+        headers={
+            "X-Payload-Bytes": str(len(body)),  # before compression
+            "Server-Timing": f"serialize;dur={elapsed * 1000:.2f}",
+        },
+    )
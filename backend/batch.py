@@ -0,0 +1,202 @@
+"""
+Offline batch runs: `python -m batch keywords.txt --output results.jsonl [--workers 4]` (from backend/).
+
+Keywords are read one per line from a file or stdin (`-`); blank lines and `#` comments are skipped.
+Each finished PipelineState is appended to the output as one JSON line as soon as its run ends, then
+its keyword is appended to the checkpoint file (default <output>.checkpoint). Re-running the same
+command skips checkpointed keywords, so an interrupted batch resumes where it stopped. The result line
+is fsynced before the checkpoint line, so a crash between the two repeats that keyword on resume rather
+than losing it; key on run_id if duplicates matter.
+
+Keywords are read lazily and at most 2 × workers runs are pending at once, so memory does not grow with
+the number of keywords beyond one short string per distinct keyword seen. Ctrl-C cancels in-flight runs
+at their next stage or LLM call; they are not checkpointed and run again on resume. Failed runs are
+logged, not checkpointed, and make the exit code 1.
+"""
+import argparse
+import os
+import sys
+from concurrent.futures import FIRST_COMPLETED, Future, wait
+from dataclasses import asdict, dataclass
+from pathlib import Path
+from typing import BinaryIO, Iterable, Iterator, TextIO
+
+import orjson
+
+from agents.orchestration import run_pipeline
+from api.serialization import state_to_dict
+from config.tenants import UnknownTenant, get_tenant
+from utils.cancellation import CancellationToken, RunCancelled
+from utils.concurrency import ContextThreadPoolExecutor
+from utils.logging import configure_logging, get_logger, shutdown_logging
+
+logger = get_logger(__name__)
+
+_TAIL_BLOCK = 64 * 1024
+
+
+@dataclass
+class BatchSummary:
+    completed: int = 0
+    aborted: int = 0  # finished below the signal confidence threshold (still written and checkpointed)
+    skipped: int = 0  # already checkpointed, or repeated in the input
+    failed: int = 0
+    cancelled: int = 0
+
+
+def read_keywords(src: TextIO) -> Iterator[str]:
+    for line in src:
+        keyword = line.strip()
+        if keyword and not keyword.startswith("#"):
+            yield keyword
+
+
+def _key(keyword: str) -> str:
+    return keyword.strip().lower()
+
+
+def load_checkpoint(path: Path) -> set[str]:
+    if not path.exists():
+        return set()
+    with path.open(encoding="utf-8") as f:
+        return {line.rstrip("\n") for line in f if line.strip()}
+
+
+def _trim_partial_line(path: Path) -> None:
+    """Drop a trailing line cut short by a crash mid-write; its keyword was never checkpointed."""
+    if not path.exists():
+        return
+    with path.open("rb+") as f:
+        end = f.seek(0, os.SEEK_END)
+        pos = end
+        while pos > 0:
+            start = max(0, pos - _TAIL_BLOCK)
+            f.seek(start)
+            block = f.read(pos - start)
+            if pos == end and block.endswith(b"\n"):
+                return
+            nl = block.rfind(b"\n")
+            if nl >= 0:
+                f.truncate(start + nl + 1)
+                return
+            pos = start
+        f.truncate(0)
+
+
+class _Writer:
+    """Appends results and checkpoint entries; only called from the batch's main thread."""
+
+    def __init__(self, out: BinaryIO, checkpoint: TextIO, compact: bool):
+        self._out = out
+        self._checkpoint = checkpoint
+        self._compact = compact
+
+    def write(self, keyword: str, state) -> None:
+        self._out.write(orjson.dumps(state_to_dict(state, [], self._compact), option=orjson.OPT_NON_STR_KEYS) + b"\n")
+        self._out.flush()
+        os.fsync(self._out.fileno())
+        self._checkpoint.write(_key(keyword) + "\n")
+        self._checkpoint.flush()
+
+
+def run_batch(
+    keywords: Iterable[str],
+    output: Path,
+    checkpoint: Path,
+    workers: int = 4,
+    compact: bool = False,
+    cancel: CancellationToken | None = None,
+    tenant: str | None = None,
+) -> BatchSummary:
+    """Run the pipeline for each keyword not yet in the checkpoint, streaming results to output."""
+    cancel = cancel or CancellationToken()
+    workers = max(1, workers)
+    summary = BatchSummary()
+    claimed = load_checkpoint(checkpoint)
+    resumed = len(claimed)
+    _trim_partial_line(output)
+    output.parent.mkdir(parents=True, exist_ok=True)
+    logger.info("batch_started", workers=workers, output=str(output), checkpointed=resumed, tenant=tenant)
+
+    pending: dict[Future, str] = {}
+
+    def collect(fut: Future, keyword: str) -> None:
+        try:
+            state = fut.result()
+        except RunCancelled:
+            summary.cancelled += 1
+            return
+        except Exception as e:
+            summary.failed += 1
+            logger.error("batch_run_failed", batch_keyword=keyword, error=str(e))
+            return
+        writer.write(keyword, state)
+        if state.aborted:
+            summary.aborted += 1
+        else:
+            summary.completed += 1
+
+    def drain(max_pending: int) -> None:
+        while len(pending) > max_pending:
+            finished, _ = wait(pending, return_when=FIRST_COMPLETED)
+            for fut in finished:
+                collect(fut, pending.pop(fut))
+
+    with (
+        output.open("ab") as out,
+        checkpoint.open("a", encoding="utf-8") as ckpt,
+        ContextThreadPoolExecutor(max_workers=workers, thread_name_prefix="batch") as pool,
+    ):
+        writer = _Writer(out, ckpt, compact)
+        try:
+            for keyword in keywords:
+                if cancel.cancelled:
+                    break
+                key = _key(keyword)
+                if key in claimed:
+                    summary.skipped += 1
+                    continue
+                claimed.add(key)
+                pending[pool.submit(run_pipeline, keyword, cancel=cancel, tenant=tenant)] = keyword
+                drain(2 * workers - 1)
+            drain(0)
+        except KeyboardInterrupt:
+            cancel.cancel("batch interrupted")
+            logger.warning("batch_interrupted", in_flight=len(pending))
+            drain(0)
+
+    logger.info("batch_finished", **asdict(summary))
+    return summary
+
+
+def main(argv: list[str] | None = None) -> int:
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("keywords", help="file with one keyword per line, or - for stdin")
+    parser.add_argument("-o", "--output", required=True, type=Path, help="JSONL file results are appended to")
+    parser.add_argument("--checkpoint", type=Path, help="completed-keyword file (default: <output>.checkpoint)")
+    parser.add_argument("-w", "--workers", type=int, default=4, help="pipeline runs in parallel")
+    parser.add_argument("--compact", action="store_true", help="omit intermediate drafts, as ?compact=true does")
+    parser.add_argument("--tenant", help="brand corpus to ground in (default: DEFAULT_TENANT)")
+    args = parser.parse_args(argv)
+    try:
+        get_tenant(args.tenant)
+    except UnknownTenant as e:
+        parser.error(str(e))
+
+    configure_logging()
+    checkpoint = args.checkpoint or args.output.with_name(args.output.name + ".checkpoint")
+    cancel = CancellationToken()
+    src = sys.stdin if args.keywords == "-" else open(args.keywords, encoding="utf-8")
+    try:
+        summary = run_batch(read_keywords(src), args.output, checkpoint, args.workers, args.compact, cancel, args.tenant)
+    finally:
+        if src is not sys.stdin:
+            src.close()
+        shutdown_logging()
+    if cancel.cancelled:
+        return 130
+    return 1 if summary.failed else 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1 @@
+# Standalone benchmark scripts; run from backend/ with python -m benchmarks.<name>
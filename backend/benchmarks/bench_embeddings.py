@@ -0,0 +1,102 @@
+"""
+Compare embedding backends: load time, indexing throughput (docs/sec), query latency and RSS.
+
+Each backend runs in its own subprocess so peak RSS reflects only that backend.
+Documents are the local DataVex corpus + LinkedIn posts (no network), repeated up to --docs.
+
+Usage (from backend/):
+    python -m benchmarks.bench_embeddings [--backends huggingface,onnx] [--docs 512] [--queries 50]
+ONNX settings (ONNX_MODEL_PATH, EMBEDDING_THREADS, EMBEDDING_BATCH_SIZE, ...) come from the environment.
+"""
+import argparse
+import json
+import os
+import resource
+import statistics
+import subprocess
+import sys
+import time
+
+QUERIES = [
+    "retrieval quality is where RAG systems fail",
+    "data integration pipelines schema lineage",
+    "chunking strategy and embedding choice",
+    "observability for siloed data pipelines",
+    "fine-tuning versus retrieval augmented generation",
+]
+
+
+def _rss_mb() -> float:
+    with open("/proc/self/statm") as f:
+        return int(f.read().split()[1]) * os.sysconf("SC_PAGE_SIZE") / 2**20
+
+
+def _worker(n_docs: int, n_queries: int) -> dict:
+    from memory.chroma_store import _load_corpus_documents
+    from memory.embeddings import get_embeddings
+    from memory.linkedin_loader import load_linkedin_posts
+
+    base = [d.page_content for d in _load_corpus_documents() + load_linkedin_posts()]
+    docs = (base * (n_docs // max(1, len(base)) + 1))[:n_docs]
+    rss_before = _rss_mb()
+
+    t = time.perf_counter()
+    emb = get_embeddings()
+    emb.embed_query("warmup")
+    load_s = time.perf_counter() - t
+
+    t = time.perf_counter()
+    emb.embed_documents(docs)
+    index_s = time.perf_counter() - t
+
+    latencies = []
+    for i in range(n_queries):
+        t = time.perf_counter()
+        emb.embed_query(QUERIES[i % len(QUERIES)])
+        latencies.append(time.perf_counter() - t)
+    latencies.sort()
+
+    return {
+        "load_s": round(load_s, 2),
+        "docs_per_s": round(len(docs) / index_s, 1),
+        "query_p50_ms": round(statistics.median(latencies) * 1000, 2),
+        "query_p95_ms": round(latencies[int(len(latencies) * 0.95) - 1] * 1000, 2),
+        "rss_mb": round(_rss_mb(), 1),
+        "rss_delta_mb": round(_rss_mb() - rss_before, 1),
+        "peak_rss_mb": round(resource.getrusage(resource.RUSAGE_SELF).ru_maxrss / 1024, 1),
+    }
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--backends", default="huggingface,onnx")
+    parser.add_argument("--docs", type=int, default=512)
+    parser.add_argument("--queries", type=int, default=50)
+    parser.add_argument("--_worker", action="store_true", help=argparse.SUPPRESS)
+    args = parser.parse_args()
+
+    if args._worker:
+        print(json.dumps(_worker(args.docs, args.queries)))
+        return
+
+    backend_dir = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+    cols = ["load_s", "docs_per_s", "query_p50_ms", "query_p95_ms", "rss_mb", "rss_delta_mb", "peak_rss_mb"]
+    print(f"{'backend':<14}" + "".join(f"{c:>14}" for c in cols))
+    for backend in [b.strip() for b in args.backends.split(",") if b.strip()]:
+        proc = subprocess.run(
+            [sys.executable, "-m", "benchmarks.bench_embeddings", "--_worker",
+             "--docs", str(args.docs), "--queries", str(args.queries)],
+            cwd=backend_dir,
+            env={**os.environ, "EMBEDDING_BACKEND": backend, "LOG_LEVEL": "WARNING"},
+            capture_output=True,
+            text=True,
+        )
+        if proc.returncode != 0:
+            print(f"{backend:<14}failed: {proc.stderr.strip().splitlines()[-1] if proc.stderr else proc.returncode}")
+            continue
+        r = json.loads(proc.stdout.strip().splitlines()[-1])
+        print(f"{backend:<14}" + "".join(f"{r[c]:>14}" for c in cols))
+
+
+if __name__ == "__main__":
+    main()
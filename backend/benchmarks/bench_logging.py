@@ -0,0 +1,101 @@
+"""
+Logging overhead under load: per-call latency seen by the caller and total throughput,
+for the synchronous sink, the queue-backed async sink, and the async sink with sampling.
+
+Each mode runs in a fresh subprocess (logging is configured once per process) with stdout
+redirected to a real file, so sink I/O cost is included.
+
+Usage (from backend/):  python -m benchmarks.bench_logging [--threads 8] [--events 5000]
+"""
+import argparse
+import json
+import os
+import statistics
+import subprocess
+import sys
+import tempfile
+import threading
+import time
+
+MODES = {
+    "sync": {"LOG_ASYNC": "false"},
+    "async": {"LOG_ASYNC": "true"},
+    "async+sampled(10%)": {"LOG_ASYNC": "true", "LOG_SAMPLE_RATES": json.dumps({"bench_event": 0.1})},
+}
+
+
+def _worker(threads: int, events: int) -> dict:
+    """Runs inside the subprocess: hammer the logger from N threads with run context bound."""
+    import structlog
+
+    from utils.logging import get_logger, shutdown_logging
+
+    logger = get_logger("bench")
+    latencies: list[float] = []
+    lock = threading.Lock()
+
+    def hammer(i: int) -> None:
+        local = []
+        with structlog.contextvars.bound_contextvars(run_id=f"bench-{i}", keyword="bench"):
+            for n in range(events):
+                t = time.perf_counter()
+                logger.info("bench_event", n=n, stage="critique", model="gemini-2.5-flash")
+                local.append(time.perf_counter() - t)
+        with lock:
+            latencies.extend(local)
+
+    t0 = time.perf_counter()
+    pool = [threading.Thread(target=hammer, args=(i,)) for i in range(threads)]
+    for t in pool:
+        t.start()
+    for t in pool:
+        t.join()
+    caller_wall = time.perf_counter() - t0
+    shutdown_logging()  # drain the queue so total time includes the sink
+    total_wall = time.perf_counter() - t0
+
+    latencies.sort()
+    return {
+        "events": len(latencies),
+        "caller_wall_s": round(caller_wall, 3),
+        "drained_wall_s": round(total_wall, 3),
+        "events_per_s": round(len(latencies) / caller_wall),
+        "p50_us": round(statistics.median(latencies) * 1e6, 1),
+        "p99_us": round(latencies[int(len(latencies) * 0.99)] * 1e6, 1),
+    }
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--threads", type=int, default=8)
+    parser.add_argument("--events", type=int, default=5000, help="events per thread")
+    parser.add_argument("--_worker", action="store_true", help=argparse.SUPPRESS)
+    args = parser.parse_args()
+
+    if args._worker:
+        print(json.dumps(_worker(args.threads, args.events)), file=sys.stderr)
+        return
+
+    backend_dir = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+    print(f"{'mode':<22}{'events/s':>10}{'p50 µs':>10}{'p99 µs':>10}{'caller s':>10}{'drained s':>11}")
+    for mode, env in MODES.items():
+        with tempfile.TemporaryFile() as sink:
+            proc = subprocess.run(
+                [sys.executable, "-m", "benchmarks.bench_logging", "--_worker",
+                 "--threads", str(args.threads), "--events", str(args.events)],
+                cwd=backend_dir,
+                env={**os.environ, **env, "LOG_LEVEL": "INFO"},
+                stdout=sink,
+                stderr=subprocess.PIPE,
+                text=True,
+                check=True,
+            )
+        r = json.loads(proc.stderr.strip().splitlines()[-1])
+        print(
+            f"{mode:<22}{r['events_per_s']:>10}{r['p50_us']:>10}{r['p99_us']:>10}"
+            f"{r['caller_wall_s']:>10}{r['drained_wall_s']:>11}"
+        )
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,119 @@
+"""
+Startup cost: per-module import time for `import main` (from `python -X importtime`) and the
+time from spawning uvicorn to the first 200 from /health.
+
+Each measurement runs in a fresh interpreter so nothing is already imported. With --budget-seconds
+(or STARTUP_BUDGET_SECONDS) the script exits non-zero when time-to-first-/health exceeds the budget,
+so a deploy can fail on a startup regression (see render.yaml).
+
+Usage (from backend/):  python -m benchmarks.bench_startup [--runs 3] [--top 15] [--budget-seconds 5]
+"""
+import argparse
+import os
+import socket
+import statistics
+import subprocess
+import sys
+import time
+import urllib.request
+
+BACKEND_DIR = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+
+
+def _import_times() -> tuple[float, dict[str, tuple[int, int]]]:
+    """Wall seconds for `import main` and {module: (self µs, cumulative µs)}."""
+    t = time.perf_counter()
+    proc = subprocess.run(
+        [sys.executable, "-X", "importtime", "-c", "import main"],
+        cwd=BACKEND_DIR,
+        capture_output=True,
+        text=True,
+        check=True,
+    )
+    wall = time.perf_counter() - t
+    modules: dict[str, tuple[int, int]] = {}
+    for line in proc.stderr.splitlines():
+        if not line.startswith("import time:") or "self [us]" in line:
+            continue
+        self_us, cumulative_us, name = line.removeprefix("import time:").split("|")
+        modules[name.strip()] = (int(self_us), int(cumulative_us))
+    return wall, modules
+
+
+def _free_port() -> int:
+    with socket.socket() as s:
+        s.bind(("127.0.0.1", 0))
+        return s.getsockname()[1]
+
+
+def _time_to_health(timeout: float) -> float:
+    """Seconds from spawning uvicorn until /health first answers 200."""
+    port = _free_port()
+    url = f"http://127.0.0.1:{port}/health"
+    t = time.perf_counter()
+    proc = subprocess.Popen(
+        [sys.executable, "-m", "uvicorn", "main:app", "--host", "127.0.0.1", "--port", str(port)],
+        cwd=BACKEND_DIR,
+        env={**os.environ, "PREWARM_ENABLED": "false"},
+        stdout=subprocess.DEVNULL,
+        stderr=subprocess.DEVNULL,
+    )
+    try:
+        while time.perf_counter() - t < timeout:
+            if proc.poll() is not None:
+                raise RuntimeError(f"uvicorn exited with code {proc.returncode} before /health answered")
+            try:
+                with urllib.request.urlopen(url, timeout=1) as resp:
+                    if resp.status == 200:
+                        return time.perf_counter() - t
+            except OSError:
+                time.sleep(0.02)
+        raise TimeoutError(f"/health did not answer within {timeout}s")
+    finally:
+        proc.terminate()
+        try:
+            proc.wait(timeout=10)
+        except subprocess.TimeoutExpired:
+            proc.kill()
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--runs", type=int, default=3, help="fresh-process runs per measurement (median reported)")
+    parser.add_argument("--top", type=int, default=15, help="slowest top-level packages to list")
+    parser.add_argument(
+        "--budget-seconds",
+        type=float,
+        default=float(os.environ.get("STARTUP_BUDGET_SECONDS") or 0),
+        help="fail if median time to first /health exceeds this (0 = report only)",
+    )
+    parser.add_argument("--timeout", type=float, default=120.0, help="give up waiting for /health after this")
+    args = parser.parse_args()
+
+    import_walls = []
+    modules: dict[str, tuple[int, int]] = {}
+    for _ in range(args.runs):
+        wall, modules = _import_times()
+        import_walls.append(wall)
+
+    # Top-level packages only, by cumulative time (children are included in their parent).
+    packages = {name: cum for name, (_, cum) in modules.items() if "." not in name and name != "main"}
+    print(f"{'package':<36}{'cumulative ms':>14}")
+    for name, cum in sorted(packages.items(), key=lambda kv: kv[1], reverse=True)[: args.top]:
+        print(f"{name:<36}{cum / 1000:>14.1f}")
+    main_ms = modules.get("main", (0, 0))[1] / 1000
+    print(f"\n{'import main (importtime)':<36}{main_ms:>14.1f}")
+    print(f"{'import main (process wall, median)':<36}{statistics.median(import_walls) * 1000:>14.1f}")
+
+    health = statistics.median(_time_to_health(args.timeout) for _ in range(args.runs))
+    print(f"{'first /health (median)':<36}{health * 1000:>14.1f}")
+
+    if args.budget_seconds > 0:
+        if health > args.budget_seconds:
+            print(f"\nFAIL: startup {health:.2f}s exceeds budget {args.budget_seconds:.2f}s", file=sys.stderr)
+            sys.exit(1)
+        print(f"\nOK: startup {health:.2f}s within budget {args.budget_seconds:.2f}s")
+
+
+if __name__ == "__main__":
+    main()
@@ -21,19 +21,149 @@ class Settings(BaseSettings):
     datavex_corpus_dir: str = "./data/datavex_corpus"
     signal_cache_path: str = "./data/signal_cache.json"
 
+    # Vector index: "chroma" (per-process Chroma) or "prebuilt" (shared read-only mmap artifact for multi-worker)
+    vector_index_mode: str = "chroma"
+    index_artifact_dir: str = "./data/index"
+    index_build_on_startup: bool = True  # prebuilt mode: if no artifact, one worker builds it under a file lock
+    # When the index is loaded: "background" (thread at startup; /health answers at once, first retrieval waits),
+    # "startup" (lifespan blocks until indexed) or "lazy" (on first retrieval)
+    index_warmup: str = "background"
+    # Brand tenants (config.tenants): DEFAULT_TENANT uses the corpus/LinkedIn/fetch settings here, others TENANTS_FILE
+    default_tenant: str = "datavex"
+    tenants_file: str = ""  # JSON object: tenant name -> {corpus_dir, linkedin_posts_path, fetch_urls, ...}
+    tenants_data_dir: str = "./data/tenants"  # default corpus/, linkedin_posts.json, chroma/, index/ of other tenants
+    tenant_index_memory_mb: float = 512  # loaded tenant indexes beyond this are evicted LRU (the active one stays); 0 = no limit
+    # Positioning retrieval results cached per (tenant, index version, normalized query); see memory.retrieval_cache
+    retrieval_cache_enabled: bool = True
+    retrieval_cache_size: int = 512  # entries (LRU)
+    retrieval_cache_similarity: float = 0.97  # reuse results of a cached query this close (cosine); 1 = exact matches only
+    # Poll the corpus dir and LinkedIn export and apply changes to the live index (memory.watcher)
+    corpus_watch_enabled: bool = False
+    corpus_watch_poll_seconds: float = 2.0
+    corpus_watch_debounce_seconds: float = 5.0  # changes must settle this long before the index is refreshed
+
+    # Near-duplicate collapsing before embedding (MinHash + LSH over word 5-gram shingles)
+    dedup_enabled: bool = True
+    dedup_similarity_threshold: float = 0.85  # estimated Jaccard similarity at/above which docs collapse
+    dedup_num_perm: int = 128
+
+    # Embeddings: "huggingface" (PyTorch sentence-transformers) or "onnx" (ONNX Runtime, CPU, optionally int8)
+    embedding_backend: str = "huggingface"
+    onnx_model_path: str = "./models/all-MiniLM-L6-v2/model_int8.onnx"
+    onnx_tokenizer_path: str = "./models/all-MiniLM-L6-v2/tokenizer.json"
+    embedding_threads: int = 0  # intra-op threads; 0 = runtime default (all cores)
+    embedding_batch_size: int = 32
+    embedding_max_length: int = 256  # tokens; MiniLM was trained at 256
+
     # DataVex website — official site and URLs to fetch for RAG context
     datavex_website_url: str = "https://datavex.ai"
     datavex_fetch_urls: str = "https://datavex.ai"  # comma-separated; fetched and indexed at Chroma init
 
     # LinkedIn posts for RAG context (all DataVex LinkedIn posts)
-    linkedin_posts_path: str = "./data/linkedin_posts.json"  # JSON array of { "content": "...", "date": "...", "url": "..." }
+    linkedin_posts_path: str = "./data/linkedin_posts.json"  # JSON array (or .jsonl, one per line) of { "content": "...", "date": "...", "url": "..." }
+
+    # Finished runs (for partial re-runs and per-keyword latest results)
+    run_store_enabled: bool = True
+    run_store_dir: str = "./data/runs"
+    # Admission control: interactive (API) runs in flight / queued; batch (prewarm) runs get their own cap
+    max_in_flight_runs: int = 4
+    admission_queue_size: int = 16
+    # Queue longer than this (expected or actual) → 429 + Retry-After. Runs take minutes, so this must be several
+    # run lengths: 600s lets a full default queue (16 ÷ 4 slots × 120s = 480s) wait its turn.
+    admission_max_wait_seconds: float = 600.0
+    batch_max_in_flight_runs: int = 1
+    admission_initial_run_seconds: float = 120.0  # run-time estimate until runs have been observed
+
+    # /api/run serves a stored completed run for the keyword when younger than this (0 = always run fresh)
+    cached_result_max_age_seconds: float = 0.0
+
+    # Idle-time prewarming of curated keywords (signal cache keys + prewarm_keywords)
+    prewarm_enabled: bool = False
+    prewarm_keywords: list[str] = []
+    prewarm_idle_seconds: float = 60.0  # no live run for this long before prewarming starts
+    prewarm_poll_seconds: float = 15.0
+    prewarm_llm_budget: int = 100  # LLM calls prewarming may spend per window
+    prewarm_budget_window_seconds: float = 86400.0
+    prewarm_retry_seconds: float = 3600.0  # back-off for keywords whose prewarm run aborted or failed
+
+    # Best-of-N drafting: per platform (blog | linkedin | twitter), N candidates per round generated concurrently;
+    # the best-scored one is kept. Missing platforms default to 1 (single draft).
+    best_of_n: dict[str, int] = {}
+    best_of_n_concurrency: dict[str, int] = {}  # max candidates in flight per platform (default: N)
+    best_of_n_scorer: str = "critique"  # critique (llm_strategy; winner's critique is reused) | flash (llm_content)
+
+    # Rule-based pre-critic (agents/critique/rules.py): hard failures skip the LLM critique
+    precritic_enabled: bool = True
+    precritic_length_tolerance: float = 0.1  # word counts within this fraction outside the range are soft failures
+    precritic_banned_phrases: list[str] = ["revolutionary", "game-changing", "game changer", "groundbreaking"]
+    datavex_tail_fraction: float = 0.15  # blog: first DataVex mention must fall in this final fraction
+
+    # Long-form generation: "single" (one call) or "sections" (outline, then body sections and the DataVex tail
+    # drafted concurrently, stitched in order with a light edit-based coherence pass)
+    blog_generation_mode: str = "single"
+    blog_outline_sections: int = 4  # body sections planned by the outline (the DataVex tail comes after them)
+    blog_section_concurrency: int = 0  # sections drafted at once; 0 = all
+    blog_coherence_pass: bool = True
+
+    # Round-2 revisions: "edit" (model returns section-level edits to draft 1, applied locally; full regeneration
+    # if they cannot be applied) or "regenerate" (whole asset rewritten with the critique feedback)
+    revision_mode: str = "edit"
+
+    # Latency-budget routing: Pro calls fall back to llm_content when they would not fit the run's budget.
+    latency_budget_seconds: float = 0.0  # default per-run budget; 0 = static models (requests may set their own)
+    # Token budget per run (prompt + response tokens; requests may set their own). When the critique loops
+    # project past it, they drop optional work (best-of-N candidates, then the second round) and record it.
+    run_token_budget: int = 0  # 0 = unlimited (usage is still recorded)
+    routing_latency_priors: dict[str, float] = {"gemini-2.5-pro": 25.0, "gemini-2.5-flash": 6.0}  # until observed
+    # 0..1 (>= 1 keeps Pro whenever it fits the remaining budget); critique_1 / critique_2 = per critique round
+    routing_stage_importance: dict[str, float] = {
+        "gap_analysis": 0.3,
+        "strategy_brief": 1.0,
+        "positioning": 0.5,
+        "critique_1": 0.0,
+        "critique_2": 0.8,
+    }
 
     # Thresholds
     signal_confidence_threshold: float = 0.5  # abort if below
 
     # External signal (hybrid)
     use_live_signal_search: bool = True
-    signal_search_max_results: int = 5
+    signal_search_max_results: int = 5  # per source
+    signal_sources: list[str] = []  # live search adapters: web | arxiv | rss (empty = static cache only)
+    signal_search_deadline_seconds: float = 8.0  # overall; sources still running are dropped
+    signal_source_timeouts: dict[str, float] = {"web": 5.0, "arxiv": 6.0, "rss": 4.0}
+    signal_recency_half_life_years: float = 2.0
+    tavily_api_key: str = ""
+    signal_web_search_url: str = "https://api.tavily.com/search"
+    signal_arxiv_url: str = "http://export.arxiv.org/api/query"
+    signal_rss_feeds: list[str] = []
+
+    # LLM call handling
+    llm_max_concurrency: int = 8  # in-process cap on concurrent Gemini calls; waiting time is traced as queue wait
+    llm_max_retries: int = 2  # retries per call after the first attempt (counted in metrics)
+    # Circuit breaker: after this many consecutive failed or slow attempts, LLM calls fail fast for
+    # circuit_open_seconds (then one probe), and /api/run serves the keyword's last stored run flagged stale
+    circuit_breaker_enabled: bool = True
+    circuit_failure_threshold: int = 5
+    circuit_slow_call_seconds: float = 120.0  # a response slower than this counts as a failure; 0 = never
+    circuit_open_seconds: float = 30.0
+    disconnect_poll_seconds: float = 0.5  # how often /api/run checks whether the client has gone away
+
+    # Observability
+    tracing_exporter: str = "none"  # none | file | otlp
+    tracing_file_path: str = "./data/traces.jsonl"  # JSON lines, one span per line (exporter=file)
+    otlp_endpoint: str = "http://localhost:4318"  # OTLP/HTTP collector base URL (exporter=otlp)
+
+    # Logging
+    log_level: str = "INFO"
+    log_async: bool = True  # render + write logs on a background thread instead of the request path
+    log_sample_rates: dict[str, float] = {}  # event name -> fraction kept, e.g. {"llm_retry": 0.1}
+
+    # Profiling (opt-in per run via /api/run {"profile": true})
+    profile_dir: str = "./data/profiles"
+    profile_sample_interval_ms: float = 5.0
+    profile_tracemalloc_frames: int = 1  # stack depth kept per allocation; higher is slower
 
     # API
     api_host: str = "0.0.0.0"
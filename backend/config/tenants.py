@@ -0,0 +1,112 @@
+"""
+Brand tenants: each has its own corpus dir, LinkedIn export, fetch URLs, Chroma collection and index
+artifact dir, so one deployment can ground content for several brands.
+
+DEFAULT_TENANT is built from the top-level settings, so a single-brand deployment needs no tenants file
+and keeps its existing paths. Other tenants come from TENANTS_FILE, a JSON object of name -> overrides:
+
+  {"acme": {"corpus_dir": "./data/tenants/acme/corpus", "fetch_urls": ["https://acme.io"]}}
+
+Fields a tenant leaves out default to locations under TENANTS_DATA_DIR/<name>/ (see _tenant_defaults).
+"""
+import json
+import re
+import threading
+from pathlib import Path
+
+from pydantic import BaseModel
+
+from .settings import settings
+
+_NAME = re.compile(r"^[A-Za-z0-9][A-Za-z0-9_-]{0,62}$")
+
+
+class UnknownTenant(ValueError):
+    """The tenant is not DEFAULT_TENANT and not defined in TENANTS_FILE."""
+
+
+class TenantConfig(BaseModel):
+    name: str
+    corpus_dir: str
+    linkedin_posts_path: str
+    fetch_urls: list[str] = []
+    collection_name: str
+    chroma_persist_dir: str
+    index_artifact_dir: str
+
+    def corpus_path(self) -> Path:
+        return Path(self.corpus_dir)
+
+    def chroma_path(self) -> Path:
+        return Path(self.chroma_persist_dir)
+
+    @property
+    def is_default(self) -> bool:
+        return self.name == settings.default_tenant
+
+
+_tenants: dict[str, TenantConfig] | None = None
+_tenants_lock = threading.Lock()
+
+
+def _default_tenant() -> TenantConfig:
+    urls = [u.strip() for u in (settings.datavex_fetch_urls or "").split(",") if u.strip()]
+    return TenantConfig(
+        name=settings.default_tenant,
+        corpus_dir=settings.datavex_corpus_dir,
+        linkedin_posts_path=settings.linkedin_posts_path,
+        fetch_urls=list(dict.fromkeys(urls)) or [settings.datavex_website_url],
+        collection_name="datavex_corpus",
+        chroma_persist_dir=settings.chroma_persist_dir,
+        index_artifact_dir=settings.index_artifact_dir,
+    )
+
+
+def _tenant_defaults(name: str) -> dict:
+    root = Path(settings.tenants_data_dir) / name
+    return {
+        "name": name,
+        "corpus_dir": str(root / "corpus"),
+        "linkedin_posts_path": str(root / "linkedin_posts.json"),
+        "collection_name": f"{name}_corpus",
+        "chroma_persist_dir": str(root / "chroma"),
+        "index_artifact_dir": str(root / "index"),
+    }
+
+
+def _load_tenants() -> dict[str, TenantConfig]:
+    tenants = {settings.default_tenant: _default_tenant()}
+    if not settings.tenants_file:
+        return tenants
+    raw = json.loads(Path(settings.tenants_file).read_text(encoding="utf-8"))
+    if not isinstance(raw, dict):
+        raise ValueError(f"{settings.tenants_file}: expected a JSON object of tenant name -> settings")
+    for name, overrides in raw.items():
+        if not _NAME.match(name):
+            raise ValueError(f"{settings.tenants_file}: invalid tenant name {name!r}")
+        if name == settings.default_tenant:
+            raise ValueError(f"{settings.tenants_file}: {name!r} is DEFAULT_TENANT; configure it with the top-level settings")
+        tenants[name] = TenantConfig(**{**_tenant_defaults(name), **(overrides or {}), "name": name})
+    return tenants
+
+
+def _all_tenants() -> dict[str, TenantConfig]:
+    global _tenants
+    if _tenants is None:
+        with _tenants_lock:
+            if _tenants is None:
+                _tenants = _load_tenants()
+    return _tenants
+
+
+def tenant_names() -> list[str]:
+    return list(_all_tenants())
+
+
+def get_tenant(name: str | None = None) -> TenantConfig:
+    """Config for name (None or "" = DEFAULT_TENANT); raises UnknownTenant."""
+    tenants = _all_tenants()
+    tenant = tenants.get(name or settings.default_tenant)
+    if tenant is None:
+        raise UnknownTenant(f"unknown tenant {name!r}; expected one of: {', '.join(tenants)}")
+    return tenant
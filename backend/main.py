@@ -1,21 +1,48 @@
 """DataVex Growth Intelligence Engine — FastAPI entrypoint."""
+import threading
 import time
 from contextlib import asynccontextmanager
 
-from fastapi import FastAPI
+from fastapi import FastAPI, Response
 from fastapi.middleware.cors import CORSMiddleware
+from fastapi.middleware.gzip import GZipMiddleware
 
+from agents.orchestration import start_prewarm, stop_prewarm
 from api.routes import router as api_router
 from config import settings
-from memory import init_chroma
+from memory import init_chroma, start_corpus_watcher, stop_corpus_watcher
+from utils.logging import configure_logging, get_logger
+from utils.metrics import render_metrics
+from utils.tracing import init_tracing, shutdown_tracing
+
+configure_logging()
+logger = get_logger(__name__)
+
+
+def _warm_index() -> None:
+    try:
+        init_chroma()
+    except Exception:
+        logger.exception("index_warmup_failed")  # retried by the first retrieval
 
 
 @asynccontextmanager
 async def lifespan(app: FastAPI):
-    """Initialize Chroma and ensure DataVex corpus is indexed."""
-    init_chroma()
+    """
+    Initialize tracing, load or index the DataVex corpus (per INDEX_WARMUP), watch it for changes
+    (CORPUS_WATCH_ENABLED), and start idle-time prewarming.
+    """
+    init_tracing()
+    if settings.index_warmup == "startup":
+        init_chroma()
+    elif settings.index_warmup == "background":
+        threading.Thread(target=_warm_index, name="index-warmup", daemon=True).start()
+    start_corpus_watcher()
+    start_prewarm()
     yield
-    # Teardown if needed
+    stop_prewarm()
+    stop_corpus_watcher()
+    shutdown_tracing()
 
 
 app = FastAPI(
@@ -33,6 +60,8 @@ app.add_middleware(
     allow_headers=["*"],
 )
 
+app.add_middleware(GZipMiddleware, minimum_size=1024)
+
 app.include_router(api_router, prefix="/api", tags=["api"])
 
 
@@ -44,3 +73,9 @@ def root():
 @app.get("/health")
 def health():
     return {"status": "ok", "timestamp": time.time()}
+
+
+@app.get("/metrics", include_in_schema=False)
+def metrics():
+    body, content_type = render_metrics()
+    return Response(content=body, media_type=content_type)
@@ -1,3 +1,17 @@
-from .chroma_store import get_datavex_retriever, init_chroma
+from .chroma_store import get_datavex_retriever, index_version, init_chroma, loaded_tenants, refresh_index
+from .run_store import fresh_run_for_keyword, latest_run_for_keyword, load_run, save_run
+from .watcher import start_corpus_watcher, stop_corpus_watcher
 
-__all__ = ["get_datavex_retriever", "init_chroma"]
+__all__ = [
+    "fresh_run_for_keyword",
+    "get_datavex_retriever",
+    "index_version",
+    "init_chroma",
+    "loaded_tenants",
+    "latest_run_for_keyword",
+    "load_run",
+    "refresh_index",
+    "save_run",
+    "start_corpus_watcher",
+    "stop_corpus_watcher",
+]
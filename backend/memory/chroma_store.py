@@ -2,43 +2,110 @@
 Chroma vector store for DataVex corpus.
 RAG for grounding only.
 Includes static corpus + fetched datavex.ai pages.
+With VECTOR_INDEX_MODE=prebuilt, serves a read-only mmap index artifact instead (see memory.index_artifact).
+refresh_index() applies corpus edits to the live index without a restart (driven by memory.watcher).
+Either way the refreshed index is built on the side and swapped in, so a retrieval sees it before or after.
+
+Each tenant (config.tenants) has its own index, loaded on first use. Loaded indexes are kept in LRU order;
+once their estimated size exceeds TENANT_INDEX_MEMORY_MB the least recently used are dropped (never the one
+just requested) and reload on their next use.
 """
 
+import itertools
+import re
+import threading
+import time
+import weakref
+from collections import OrderedDict
 from pathlib import Path
-from typing import Optional
+from typing import TYPE_CHECKING, Callable
 
-from langchain_community.vectorstores import Chroma
-from langchain_community.embeddings import HuggingFaceEmbeddings
 from langchain_core.documents import Document
 
 from config.settings import settings
+from config.tenants import get_tenant
 from memory.datavex_fetcher import fetch_datavex_web_documents
-from memory.linkedin_loader import load_linkedin_posts
+from memory.dedup import DedupReport, NearDuplicateIndex, dedupe_documents
+from memory.embeddings import embedding_model_id, get_embeddings
+from memory.index_artifact import MmapVectorIndex, ensure_index_artifact, file_lock, update_index_artifact
+from memory.linkedin_loader import (
+    LinkedInWatermark,
+    content_fingerprint,
+    iter_linkedin_posts,
+    load_linkedin_posts,
+    load_watermark,
+    save_watermark,
+)
 from utils.logging import get_logger
+from utils.metrics import (
+    CORPUS_DOCS_EMBEDDED,
+    CORPUS_DUPLICATES_COLLAPSED,
+    CORPUS_REFRESHES,
+    TENANT_INDEX_BYTES,
+    TENANT_INDEX_EVICTIONS,
+)
+from utils.tenancy import current_tenant, tenant_scope
+
+if TYPE_CHECKING:
+    from chromadb.api import ClientAPI
+    from chromadb.config import System
+    from langchain_community.vectorstores import Chroma
 
 logger = get_logger(__name__)
 
-_collection_name = "datavex_corpus"
-_vector_store: Optional[Chroma] = None
+_LINKEDIN_BATCH = 256  # posts embedded per add; bounds memory for large exports
+_POSITIONAL_POST_ID = re.compile(r"^linkedin_post_\d+$")  # ids before posts were keyed by url/content
+# A Chroma refresh edits a copy named <collection>__refresh, then renames it over the live collection, which
+# becomes <collection>__retired_<n> until the last retrieval using it lets go.
+_REFRESH_SUFFIX = "__refresh"
+_RETIRED_SUFFIX = "__retired_"
 
 
-def _load_corpus_documents() -> list[Document]:
-    """Load markdown/text files from DataVex corpus dir into LangChain Documents."""
-    corpus_path = settings.datavex_path()
-    if not corpus_path.exists():
+class _TenantIndex:
+    """One tenant's loaded index plus what refreshes need; readers only ever take the `store` reference."""
+
+    def __init__(self, tenant: str):
+        self.tenant = tenant
+        self.store: "Chroma | MmapVectorIndex | None" = None
+        self.lock = threading.Lock()  # lifespan warm-up, first retrieval and refreshes may race to initialize
+        self.generation = 0  # Chroma mode: set from _generations on load and whenever the live index changes
+        self.fingerprints: dict[str, str] = {}  # Chroma mode: source -> content hash of indexed corpus files
+        self.post_fingerprints: dict[str, str] = {}  # Chroma mode: post id -> content hash of indexed LinkedIn posts
+        self.web_sources: list[str] = []  # Chroma mode: ids of indexed web pages, seeded into refresh dedup
+        self.nbytes = 0  # estimated resident size, for the LRU budget
+
+
+_indexes: "OrderedDict[str, _TenantIndex]" = OrderedDict()  # least recently used first
+_indexes_lock = threading.Lock()
+_generations = itertools.count(1)  # process-wide, so a tenant reloaded after eviction never reuses a version
+
+
+def corpus_dir() -> Path:
+    """The current tenant's corpus dir; for DEFAULT_TENANT, the bundled corpus if DATAVEX_CORPUS_DIR does not exist."""
+    tenant = current_tenant()
+    corpus_path = tenant.corpus_path()
+    if not corpus_path.exists() and tenant.is_default:
         corpus_path = (
             Path(__file__).resolve().parent.parent / "data" / "datavex_corpus"
         )
+    return corpus_path
+
 
+def _load_corpus_documents() -> list[Document]:
+    """
+    Load markdown/text files from DataVex corpus dir into LangChain Documents. `source` (the upsert id) is
+    the path relative to the corpus dir, so same-named files in different subdirectories stay distinct.
+    """
     docs: list[Document] = []
-    for path in sorted(corpus_path.glob("**/*.md")):
+    root = corpus_dir()
+    for path in sorted(root.glob("**/*.md")):
         try:
             text = path.read_text(encoding="utf-8")
             docs.append(
                 Document(
                     page_content=text,
                     metadata={
-                        "source": path.name,
+                        "source": path.relative_to(root).as_posix(),
                         "path": str(path),
                     },
                 )
@@ -52,8 +119,32 @@ def _load_corpus_documents() -> list[Document]:
     return docs
 
 
+def _web_documents() -> list[Document]:
+    try:
+        return fetch_datavex_web_documents()
+    except Exception as e:
+        logger.warning("datavex_web_fetch_error", error=str(e))
+        return []
+
+
+def _new_dedup_index() -> NearDuplicateIndex | None:
+    if not settings.dedup_enabled:
+        return None
+    return NearDuplicateIndex(settings.dedup_similarity_threshold, settings.dedup_num_perm)
+
+
+def _dedupe(docs: list[Document], index: NearDuplicateIndex | None) -> tuple[list[Document], DedupReport]:
+    if index is None:
+        return docs, DedupReport(input_docs=len(docs), kept_docs=len(docs))
+    kept, report = dedupe_documents(docs, index=index)
+    if report.collapsed:
+        CORPUS_DUPLICATES_COLLAPSED.inc(report.collapsed)
+        logger.info("corpus_duplicates_collapsed", collapsed=report.collapsed, groups=report.groups)
+    return kept, report
+
+
 def _all_documents() -> list[Document]:
-    """Static corpus + LinkedIn posts + fetched DataVex AI web pages."""
+    """Static corpus + fetched DataVex AI web pages + LinkedIn posts, near-duplicates collapsed."""
     static_docs = _load_corpus_documents()
 
     try:
@@ -62,65 +153,479 @@ def _all_documents() -> list[Document]:
         logger.warning("linkedin_posts_load_error", error=str(e))
         linkedin_docs = []
 
+    # Order sets dedup priority: curated corpus wins over scraped pages and reposts.
+    docs, _ = _dedupe(static_docs + _web_documents() + linkedin_docs, _new_dedup_index())
+    return docs
+
+
+def _index_new_linkedin_posts(
+    store: "Chroma", dedup: NearDuplicateIndex | None, indexed: dict[str, str]
+) -> tuple[int, int]:
+    """
+    Stream LinkedIn posts that are new or edited relative to `indexed` (post id -> content fingerprint, kept
+    up to date as posts are added) into the collection in fixed-size batches, saving the watermark (the
+    .jsonl resume point) after each batch. Posts that near-duplicate already-seen documents are skipped.
+    Returns (posts added, duplicates collapsed).
+    """
+    wm = load_watermark() or LinkedInWatermark()
+    added = collapsed = 0
+    batch: list[Document] = []
+
+    def flush() -> None:
+        nonlocal added, batch
+        if batch:
+            unique = list({d.metadata["source"]: d for d in batch}.values())  # the same post exported twice
+            store.add_documents(unique, ids=[d.metadata["source"] for d in unique])
+            indexed.update(_fingerprints(unique))
+            added += len(unique)
+            batch = []
+        save_watermark(wm)
+
     try:
-        web_docs = fetch_datavex_web_documents()
+        for doc in iter_linkedin_posts(since=wm, indexed=indexed):
+            if dedup is not None and dedup.add_if_new(doc.metadata["source"], doc.page_content) is not None:
+                collapsed += 1
+                continue
+            batch.append(doc)
+            if len(batch) >= _LINKEDIN_BATCH:
+                flush()
+        flush()
     except Exception as e:
-        logger.warning("datavex_web_fetch_error", error=str(e))
-        web_docs = []
+        logger.warning("linkedin_posts_load_error", error=str(e), indexed=added)
+    if collapsed:
+        CORPUS_DUPLICATES_COLLAPSED.inc(collapsed)
+    return added, collapsed
+
+
+def _entry(tenant: str) -> _TenantIndex:
+    with _indexes_lock:
+        entry = _indexes.get(tenant)
+        if entry is None:
+            entry = _indexes[tenant] = _TenantIndex(tenant)
+        _indexes.move_to_end(tenant)
+        return entry
+
+
+def _estimate_bytes(store: "Chroma | MmapVectorIndex") -> int:
+    if isinstance(store, MmapVectorIndex):
+        return int(store.vectors.nbytes) + sum(len(d.page_content) for d in store.documents)
+    count = store._collection.count()
+    sample = store._collection.get(limit=1, include=["embeddings"])["embeddings"]
+    dim = len(sample[0]) if sample is not None and len(sample) else 0
+    return count * dim * 4  # the HNSW vectors Chroma holds in memory; documents stay in SQLite
+
+
+def _open_chroma_client(persist_dir: Path) -> tuple["ClientAPI", "System"]:
+    """
+    A client on a Chroma System this module owns, so an evicted tenant's system can be stopped
+    (System.stop frees its segments and SQLite connections) instead of living in Chroma's per-path cache.
+    """
+    from chromadb.api import ServerAPI
+    from chromadb.api.client import Client
+    from chromadb.config import Settings as ChromaSettings
+    from chromadb.config import System
+
+    system = System(ChromaSettings(is_persistent=True, persist_directory=str(persist_dir)))
+    system.instance(ServerAPI)
+    system.start()
+    return Client.from_system(system), system
+
+
+def _chroma_store(client: "ClientAPI", name: str) -> "Chroma":
+    from langchain_community.vectorstores import Chroma  # heavy; only needed once the index is built
+
+    return Chroma(client=client, collection_name=name, embedding_function=get_embeddings())
+
+
+def _drop_collection(client: "ClientAPI", name: str) -> None:
+    try:
+        client.delete_collection(name)
+    except ValueError:
+        pass  # already gone
+    except Exception as e:
+        logger.warning("chroma_collection_drop_failed", collection=name, error=str(e))
+
+
+def _drop_leftover_collections(client: "ClientAPI", base: str) -> None:
+    """Delete refresh copies and retired collections of `base` left behind by a process that stopped early."""
+    for c in client.list_collections():
+        name = getattr(c, "name", c)
+        if name.startswith((base + _REFRESH_SUFFIX, base + _RETIRED_SUFFIX)):
+            _drop_collection(client, name)
+
+
+def _stop_chroma_system(system: "System", tenant: str) -> None:
+    try:
+        system.stop()
+        logger.debug("chroma_system_stopped", tenant=tenant)
+    except Exception as e:
+        logger.warning("chroma_system_stop_failed", tenant=tenant, error=str(e))
 
-    return static_docs + linkedin_docs + web_docs
 
+def _evict_over_budget(keep: str) -> None:
+    """Drop least recently used loaded indexes, never `keep` or one being built, until under the budget."""
+    budget = settings.tenant_index_memory_mb * 1024 * 1024
+    evicted: list[tuple[str, "Chroma | MmapVectorIndex"]] = []
+    with _indexes_lock:
+        total = sum(e.nbytes for e in _indexes.values() if e.store is not None)
+        if budget > 0:
+            for name, entry in list(_indexes.items()):
+                if total <= budget:
+                    break
+                if name == keep or entry.store is None or not entry.lock.acquire(blocking=False):
+                    continue
+                try:
+                    evicted.append((name, entry.store))
+                    total -= entry.nbytes
+                    entry.store = None
+                    del _indexes[name]
+                finally:
+                    entry.lock.release()
+        TENANT_INDEX_BYTES.set(total)
+    for name, store in evicted:
+        # A Chroma store's system stops once retrievals still holding it finish (see _init_vector_store).
+        TENANT_INDEX_EVICTIONS.inc()
+        logger.info("tenant_index_evicted", tenant=name, loaded_bytes=total)
 
-def init_chroma() -> Chroma:
+
+def init_chroma(tenant: str | None = None) -> "Chroma | MmapVectorIndex":
     """
-    Create or load Chroma collection with DataVex corpus.
-    Idempotent: safe to call multiple times.
+    Create or load the Chroma collection with the corpus of tenant (default: the current tenant).
+    Idempotent and thread-safe: concurrent callers wait for the first one to finish.
+    In prebuilt mode, load the shared index artifact read-only (building it once if missing).
     """
-    global _vector_store
+    name = current_tenant().name if tenant is None else get_tenant(tenant).name
+    while True:
+        entry = _entry(name)
+        store = entry.store
+        if store is not None:
+            return store
+        with entry.lock:
+            # Eviction needs this lock, so once the entry is confirmed still listed it stays listed while it
+            # builds. One evicted between _entry() and here is left alone; the next pass gets a fresh entry.
+            with _indexes_lock:
+                if _indexes.get(name) is not entry:
+                    continue
+            if entry.store is None:
+                with tenant_scope(name):
+                    _init_vector_store(entry)
+                entry.nbytes = _estimate_bytes(entry.store)
+            store = entry.store
+        _evict_over_budget(keep=name)
+        return store
+
 
-    if _vector_store is not None:
-        return _vector_store
+def _init_vector_store(entry: _TenantIndex) -> None:
+    if settings.vector_index_mode == "prebuilt":
+        entry.store = ensure_index_artifact(_all_documents, get_embeddings(), embedding_model_id())
+        return
 
-    persist_dir = settings.chroma_path()
+    tenant = current_tenant()
+    persist_dir = tenant.chroma_path()
     persist_dir.mkdir(parents=True, exist_ok=True)
 
-    # ✅ LOCAL, STABLE EMBEDDINGS (NO API, NO NETWORK)
-    embeddings = HuggingFaceEmbeddings(
-        model_name="sentence-transformers/all-MiniLM-L6-v2"
-    )
+    # Workers sharing a persist dir write one at a time.
+    with file_lock(persist_dir / ".init.lock"):
+        client, system = _open_chroma_client(persist_dir)
+        # Stop the system when the client is garbage: after eviction, once in-flight retrievals drop every
+        # store opened on it (refreshes swap in stores on the same client).
+        weakref.finalize(client, _stop_chroma_system, system, tenant.name)
+        _drop_leftover_collections(client, tenant.collection_name)
+        store = _chroma_store(client, tenant.collection_name)
+        indexed_posts = _indexed_post_fingerprints(store)
+        legacy = [i for i in indexed_posts if _POSITIONAL_POST_ID.match(i)]
+        if legacy:
+            store.delete(ids=legacy)  # posts are re-added below under stable ids
+            for i in legacy:
+                del indexed_posts[i]
+            logger.info("linkedin_positional_ids_dropped", count=len(legacy))
+        if legacy or store._collection.count() == 0:
+            save_watermark(LinkedInWatermark())  # fresh collection: re-index every post
+
+        # Small, frequently edited sources are upserted by stable id on every start.
+        static_docs = _load_corpus_documents()
+        web_docs = _web_documents()
+        dedup = _new_dedup_index()
+        base_docs, report = _dedupe(static_docs + web_docs, dedup)
+        if base_docs:
+            store.add_documents(base_docs, ids=[d.metadata["source"] for d in base_docs])
+        dropped = [src for group in report.groups for src in group[1:]]
+        if dropped:
+            store.delete(ids=dropped)  # may have been indexed before they became duplicates
+        linkedin_added, linkedin_collapsed = _index_new_linkedin_posts(store, dedup, indexed_posts)
+        entry.fingerprints = _fingerprints([d for d in base_docs if "path" in d.metadata])
+        entry.post_fingerprints = indexed_posts
+        entry.web_sources = [d.metadata["source"] for d in base_docs if "path" not in d.metadata]
+        entry.generation = next(_generations)
+        entry.store = store
 
-    docs = _all_documents()
-    if not docs:
+    num_docs = store._collection.count()
+    if not num_docs:
         logger.warning(
             "no_corpus_documents",
-            dir=str(settings.datavex_path()),
+            dir=str(corpus_dir()),
         )
 
-    _vector_store = Chroma.from_documents(
-        documents=docs,
-        embedding=embeddings,
-        collection_name=_collection_name,
-        persist_directory=str(persist_dir),
-    )
-
-    static_count = len(_load_corpus_documents())
-    linkedin_count = len(load_linkedin_posts())
-    web_count = len(docs) - static_count - linkedin_count
-
     logger.info(
         "chroma_initialized",
-        num_docs=len(docs),
-        static_docs=static_count,
-        linkedin_posts=linkedin_count,
-        web_docs=web_count,
+        tenant=tenant.name,
+        num_docs=num_docs,
+        static_docs=len(static_docs),
+        linkedin_posts_added=linkedin_added,
+        web_docs=len(web_docs),
+        duplicates_collapsed=report.collapsed + linkedin_collapsed,
         persist_dir=str(persist_dir),
     )
 
-    return _vector_store
+
+def _fingerprints(docs: list[Document]) -> dict[str, str]:
+    return {d.metadata["source"]: content_fingerprint(d.page_content) for d in docs}
+
+
+def _indexed_post_fingerprints(store: "Chroma") -> dict[str, str]:
+    """Post id -> content hash of every LinkedIn post in the collection, read a page at a time."""
+    out: dict[str, str] = {}
+    offset = 0
+    while True:
+        page = store._collection.get(
+            where={"origin": "linkedin"}, include=["documents"], limit=_LINKEDIN_BATCH, offset=offset
+        )
+        for post_id, text in zip(page["ids"], page["documents"]):
+            out[post_id] = content_fingerprint(text or "")
+        if len(page["ids"]) < _LINKEDIN_BATCH:
+            return out
+        offset += len(page["ids"])
+
+
+def _dedupe_quietly(docs: list[Document], index: NearDuplicateIndex | None) -> list[Document]:
+    """Like _dedupe, but for re-deriving the document set on refresh: collapses are not counted again."""
+    return docs if index is None else dedupe_documents(docs, index=index)[0]
+
+
+def _refresh_artifact(index: MmapVectorIndex) -> tuple[MmapVectorIndex, int, int]:
+    """
+    The document set a full build would produce now (corpus files and LinkedIn posts re-read, web pages
+    kept from the loaded index), written as a new artifact version that reuses the loaded vectors of every
+    unchanged document. Returns (index, docs embedded, docs removed).
+    """
+    static_docs = _load_corpus_documents()
+    web_docs = [
+        Document(page_content=d.page_content, metadata={k: v for k, v in d.metadata.items() if k != "duplicates_collapsed"})
+        for d in index.documents
+        if "path" not in d.metadata and d.metadata.get("origin") != "linkedin"
+    ]
+    try:
+        linkedin_docs = load_linkedin_posts()
+    except Exception as e:
+        logger.warning("linkedin_posts_load_error", error=str(e))
+        linkedin_docs = [d for d in index.documents if d.metadata.get("origin") == "linkedin"]
+    docs = _dedupe_quietly(static_docs + web_docs + linkedin_docs, _new_dedup_index())
+
+    new_index, embedded = update_index_artifact(index, docs, get_embeddings(), embedding_model_id())
+    kept = {d.page_content for d in docs}
+    return new_index, embedded, sum(d.page_content not in kept for d in index.documents)
+
+
+def _sync_linkedin_posts(
+    target: "Callable[[], Chroma]", indexed: dict[str, str], dedup: NearDuplicateIndex | None
+) -> tuple[dict[str, str], LinkedInWatermark, int, int]:
+    """
+    Diff the whole LinkedIn export against `indexed` (post id -> content hash) by stable id: upsert new and
+    edited posts in batches and delete posts no longer exported (or now near-duplicates), both into target(),
+    which is only called once there is something to write. Returns the new post fingerprints, the watermark
+    at the end of the export (so the next start does not re-add anything), posts embedded and posts removed.
+    """
+    wm = LinkedInWatermark()  # fresh: filters nothing, advanced to the newest post as the export is read
+    fingerprints: dict[str, str] = {}
+    embedded = 0
+    batch: list[Document] = []
+
+    def flush() -> None:
+        nonlocal embedded, batch
+        if batch:
+            target().add_documents(batch, ids=[d.metadata["source"] for d in batch])
+            embedded += len(batch)
+            batch = []
+
+    for doc in iter_linkedin_posts(since=wm):
+        post_id = doc.metadata["source"]
+        if post_id in fingerprints:
+            continue  # the same post exported twice
+        if dedup is not None and dedup.add_if_new(post_id, doc.page_content) is not None:
+            continue
+        fingerprints[post_id] = content_fingerprint(doc.page_content)
+        if indexed.get(post_id) != fingerprints[post_id]:
+            batch.append(doc)
+            if len(batch) >= _LINKEDIN_BATCH:
+                flush()
+    flush()
+    removed = [post_id for post_id in indexed if post_id not in fingerprints]
+    if removed:
+        target().delete(ids=removed)
+    return fingerprints, wm, embedded, len(removed)
+
+
+def _copy_collection(store: "Chroma", name: str) -> "Chroma":
+    """A copy of store's collection named `name`, stored vectors included, so nothing is re-embedded."""
+    client = store._client
+    _drop_collection(client, name)
+    collection = client.create_collection(name, metadata=store._collection.metadata)
+    offset = 0
+    while True:
+        page = store._collection.get(
+            include=["embeddings", "documents", "metadatas"], limit=_LINKEDIN_BATCH, offset=offset
+        )
+        if not len(page["ids"]):
+            break
+        collection.add(
+            ids=page["ids"], embeddings=page["embeddings"], documents=page["documents"], metadatas=page["metadatas"]
+        )
+        offset += len(page["ids"])
+    return _chroma_store(client, name)
+
+
+def _promote(live: "Chroma", side: "Chroma", base: str) -> "Chroma":
+    """
+    Rename side over the live collection `base`. The live one is renamed aside and deleted once the last
+    retrieval holding it lets go; collections are addressed by id, so those retrievals are unaffected.
+    """
+    client = live._client
+    retired = f"{base}{_RETIRED_SUFFIX}{next(_generations)}"
+    live._collection.modify(name=retired)
+    side._collection.modify(name=base)
+    weakref.finalize(live, _drop_collection, client, retired)
+    return _chroma_store(client, base)
+
+
+def _refresh_chroma(entry: _TenantIndex) -> tuple["Chroma", int, int]:
+    """
+    Upsert corpus files and LinkedIn posts whose content changed and delete removed ones, both keyed by
+    stable id. Web pages are not re-fetched; the indexed ones keep their place in dedup order. Changes go
+    into a copy of the live collection, made once the first change is found and renamed over the live one
+    when all are applied. Returns (store, docs embedded, docs removed); store is entry.store if nothing changed.
+    """
+    live = entry.store
+    base = current_tenant().collection_name
+    dedup = _new_dedup_index()
+    static_docs = _dedupe_quietly(_load_corpus_documents(), dedup)
+    fingerprints = _fingerprints(static_docs)
+    changed = [d for d in static_docs if entry.fingerprints.get(d.metadata["source"]) != fingerprints[d.metadata["source"]]]
+    removed = [src for src in entry.fingerprints if src not in fingerprints]
+    side: "Chroma | None" = None
+
+    def target() -> "Chroma":
+        nonlocal side
+        if side is None:
+            side = _copy_collection(live, base + _REFRESH_SUFFIX)
+        return side
+
+    with file_lock(current_tenant().chroma_path() / ".init.lock"):
+        try:
+            if dedup is not None and entry.web_sources:
+                web = live._collection.get(ids=entry.web_sources, include=["documents"])
+                for source, text in zip(web["ids"], web["documents"]):
+                    dedup.add_if_new(source, text or "")
+            if changed:
+                target().add_documents(changed, ids=[d.metadata["source"] for d in changed])
+            if removed:
+                target().delete(ids=removed)
+            post_fingerprints, wm, posts_embedded, posts_removed = _sync_linkedin_posts(
+                target, entry.post_fingerprints, dedup
+            )
+            store = live if side is None else _promote(live, side, base)
+        except Exception:
+            if side is not None:
+                _drop_collection(live._client, base + _REFRESH_SUFFIX)
+            raise
+        save_watermark(wm)
+    entry.fingerprints = fingerprints
+    entry.post_fingerprints = post_fingerprints
+    return store, len(changed) + posts_embedded, len(removed) + posts_removed
+
+
+def loaded_tenants() -> list[str]:
+    """Tenants whose index is currently loaded, least recently used first."""
+    with _indexes_lock:
+        return [name for name, entry in _indexes.items() if entry.store is not None]
+
+
+def refresh_index(tenant: str | None = None) -> bool:
+    """
+    Bring tenant's loaded index (default: the current tenant's) up to date with its corpus dir and LinkedIn
+    export, embedding only new or changed documents. Prebuilt mode swaps in a new artifact version, Chroma mode
+    a refreshed copy of the collection; retrievals already running finish on the index they started with, so
+    none sees a refresh half-applied, and none is blocked. No-op (False) if the index is not loaded; returns
+    True if the index changed.
+    """
+    name = current_tenant().name if tenant is None else get_tenant(tenant).name
+    with _indexes_lock:
+        entry = _indexes.get(name)
+    if entry is None:
+        return False
+    with entry.lock, tenant_scope(name):
+        store = entry.store
+        if store is None:
+            return False
+        t = time.perf_counter()
+        try:
+            if isinstance(store, MmapVectorIndex):
+                new_store, embedded, removed = _refresh_artifact(store)
+            else:
+                new_store, embedded, removed = _refresh_chroma(entry)
+        except Exception:
+            CORPUS_REFRESHES.labels(outcome="error").inc()
+            raise
+        changed = new_store is not store or embedded > 0 or removed > 0
+        entry.store = new_store
+        if changed:
+            entry.generation = next(_generations)
+            entry.nbytes = _estimate_bytes(new_store)
+        CORPUS_REFRESHES.labels(outcome="updated" if changed else "unchanged").inc()
+        CORPUS_DOCS_EMBEDDED.inc(embedded)
+        logger.info(
+            "corpus_index_refreshed",
+            tenant=name,
+            changed=changed,
+            embedded=embedded,
+            removed=removed,
+            index_version=index_version(name),
+            seconds=round(time.perf_counter() - t, 2),
+        )
+        return changed
+
+
+def index_version(tenant: str | None = None) -> str | None:
+    """
+    Identifies the contents of tenant's live index (default: the current tenant's); changes on every refresh
+    that alters it. None if the index is not loaded.
+    """
+    name = current_tenant().name if tenant is None else get_tenant(tenant).name
+    with _indexes_lock:
+        entry = _indexes.get(name)
+    store = entry.store if entry is not None else None
+    if store is None:
+        return None
+    if isinstance(store, MmapVectorIndex):
+        return store.version
+    return f"chroma-{entry.generation}"
+
+
+def current_index(tenant: str | None = None) -> tuple["Chroma | MmapVectorIndex", str | None]:
+    """
+    Tenant's index (loaded on demand) and a version safe to key cached results on: read before the caller
+    searches, so it is never newer than what the search sees. None if the index was evicted meanwhile.
+    """
+    name = current_tenant().name if tenant is None else get_tenant(tenant).name
+    store = init_chroma(name)
+    if isinstance(store, MmapVectorIndex):
+        return store, store.version
+    with _indexes_lock:
+        entry = _indexes.get(name)
+    if entry is None or entry.store is not store:
+        return store, None
+    return store, f"chroma-{entry.generation}"
 
 
-def get_datavex_retriever(k: int = 4):
-    """Return a LangChain retriever over DataVex corpus."""
-    if _vector_store is None:
-        init_chroma()
-    return _vector_store.as_retriever(search_kwargs={"k": k})
\ No newline at end of file
+def get_datavex_retriever(k: int = 4, tenant: str | None = None):
+    """Return a LangChain retriever over the corpus of tenant (default: the current tenant, see utils.tenancy)."""
+    return init_chroma(tenant).as_retriever(search_kwargs={"k": k})
@@ -1,13 +1,14 @@
-"""Fetch DataVex website and other configured URLs for RAG context. All DataVex AI posts/pages are searched and indexed."""
+"""Fetch DataVex website and other configured URLs (per tenant) for RAG context. All DataVex AI posts/pages are searched and indexed."""
 import re
+import time
 from urllib.parse import urlparse
 
-import httpx
-from bs4 import BeautifulSoup
 from langchain_core.documents import Document
 
-from config import settings
 from utils.logging import get_logger
+from utils.metrics import WEB_FETCH_DURATION
+from utils.tenancy import current_tenant
+from utils.tracing import span
 
 logger = get_logger(__name__)
 
@@ -20,18 +21,14 @@ HEADERS = {
 
 
 def _urls_to_fetch() -> list[str]:
-    """Normalize and deduplicate URLs from settings."""
-    raw = (settings.datavex_fetch_urls or "").strip()
-    if not raw:
-        return [settings.datavex_website_url]
-    urls = [u.strip() for u in raw.split(",") if u.strip()]
-    if not urls:
-        return [settings.datavex_website_url]
-    return list(dict.fromkeys(urls))
+    """The current tenant's fetch URLs (DEFAULT_TENANT: DATAVEX_FETCH_URLS, else DATAVEX_WEBSITE_URL)."""
+    return current_tenant().fetch_urls
 
 
 def _html_to_text(html: str, url: str) -> str:
     """Extract readable text from HTML."""
+    from bs4 import BeautifulSoup  # only needed while (re)indexing
+
     soup = BeautifulSoup(html, "html.parser")
     # Drop script/style
     for tag in soup(["script", "style"]):
@@ -44,21 +41,31 @@ def _html_to_text(html: str, url: str) -> str:
 
 def fetch_url(url: str) -> str | None:
     """Fetch one URL and return response text, or None on failure."""
-    try:
-        with httpx.Client(timeout=FETCH_TIMEOUT, follow_redirects=True, headers=HEADERS) as client:
-            resp = client.get(url)
-            resp.raise_for_status()
+    import httpx
+
+    with span("web.fetch", **{"http.url": url}) as s:
+        t = time.perf_counter()
+        try:
+            with httpx.Client(timeout=FETCH_TIMEOUT, follow_redirects=True, headers=HEADERS) as client:
+                resp = client.get(url)
+                resp.raise_for_status()
+            s.set_attributes(**{"http.status_code": resp.status_code, "http.response_bytes": len(resp.content)})
+            WEB_FETCH_DURATION.labels(outcome="ok").observe(time.perf_counter() - t)
             return resp.text
-    except Exception as e:
-        logger.warning("datavex_fetch_failed", url=url, error=str(e))
-        return None
+        except Exception as e:
+            WEB_FETCH_DURATION.labels(outcome="error").observe(time.perf_counter() - t)
+            s.status = "error"
+            s.status_message = str(e)[:500]
+            logger.warning("datavex_fetch_failed", url=url, error=str(e))
+            return None
 
 
 def fetch_datavex_web_documents() -> list[Document]:
     """
-    Fetch all configured DataVex URLs (e.g. datavex.ai and any blog/posts paths),
+    Fetch all of the current tenant's URLs (for DataVex: datavex.ai and any blog/posts paths),
     extract text, and return LangChain Documents for RAG indexing.
     """
+    tenant = current_tenant()
     docs: list[Document] = []
     for url in _urls_to_fetch():
         html = fetch_url(url)
@@ -78,7 +85,7 @@ def fetch_datavex_web_documents() -> list[Document]:
                 metadata={
                     "source": f"datavex_web_{name}",
                     "url": url,
-                    "origin": "datavex.ai",
+                    "origin": "datavex.ai" if tenant.is_default else urlparse(url).netloc,
                 },
             )
         )
@@ -0,0 +1,136 @@
+"""
+Near-duplicate elimination for corpus ingestion (MinHash signatures + LSH banding).
+
+The same philosophy text shows up in the static corpus, reposted LinkedIn posts and scraped datavex.ai
+pages. Collapsing near-duplicates before embedding saves embedding work and index space, and keeps
+duplicates from crowding the k retrieval slots. Earlier documents win, so ingestion order sets priority
+(static corpus, then web pages, then LinkedIn).
+"""
+import hashlib
+import re
+from collections import defaultdict
+from dataclasses import dataclass, field
+
+import numpy as np
+from langchain_core.documents import Document
+
+_MERSENNE_PRIME = np.uint64((1 << 61) - 1)
+_MAX_HASH = np.uint64((1 << 32) - 1)
+_SHINGLE_WORDS = 5
+_SEED = 1
+
+
+def _shingle_hashes(text: str) -> np.ndarray:
+    """32-bit hashes of overlapping word 5-grams of normalized text (whole text if shorter)."""
+    words = re.findall(r"[a-z0-9]+", text.lower())
+    n = max(1, len(words) - _SHINGLE_WORDS + 1)
+    shingles = {" ".join(words[i : i + _SHINGLE_WORDS]) for i in range(n)}
+    return np.fromiter(
+        (int.from_bytes(hashlib.blake2b(s.encode(), digest_size=4).digest(), "little") for s in shingles),
+        dtype=np.uint64,
+        count=len(shingles),
+    )
+
+
+def _lsh_params(threshold: float, num_perm: int) -> tuple[int, int]:
+    """(bands, rows) with bands*rows <= num_perm whose S-curve midpoint (1/b)^(1/r) is closest to threshold."""
+    best = (num_perm, 1)
+    best_err = float("inf")
+    for rows in range(1, num_perm + 1):
+        bands = num_perm // rows
+        err = abs((1.0 / bands) ** (1.0 / rows) - threshold)
+        if err < best_err:
+            best, best_err = (bands, rows), err
+    return best
+
+
+@dataclass
+class DedupReport:
+    input_docs: int = 0
+    kept_docs: int = 0
+    collapsed: int = 0
+    groups: list[list[str]] = field(default_factory=list)  # [kept source, *dropped sources]
+
+
+class NearDuplicateIndex:
+    """Incremental MinHash-LSH index: check a document against everything inserted so far."""
+
+    def __init__(self, threshold: float = 0.85, num_perm: int = 128):
+        self.threshold = threshold
+        self.num_perm = num_perm
+        self.bands, self.rows = _lsh_params(threshold, num_perm)
+        rng = np.random.RandomState(_SEED)
+        self._a = rng.randint(1, int(_MERSENNE_PRIME), size=num_perm, dtype=np.uint64)
+        self._b = rng.randint(0, int(_MERSENNE_PRIME), size=num_perm, dtype=np.uint64)
+        self._buckets: list[dict[bytes, list[str]]] = [defaultdict(list) for _ in range(self.bands)]
+        self._signatures: dict[str, np.ndarray] = {}
+
+    def signature(self, text: str) -> np.ndarray:
+        hv = _shingle_hashes(text)
+        if hv.size == 0:
+            return np.full(self.num_perm, _MAX_HASH, dtype=np.uint64)
+        # (a*x + b) mod p, truncated to 32 bits; one row per shingle, min over shingles per permutation.
+        with np.errstate(over="ignore"):
+            phv = ((np.outer(hv, self._a) + self._b) % _MERSENNE_PRIME) & _MAX_HASH
+        return phv.min(axis=0)
+
+    def _band_keys(self, sig: np.ndarray) -> list[bytes]:
+        return [sig[i * self.rows : (i + 1) * self.rows].tobytes() for i in range(self.bands)]
+
+    def find_duplicate(self, sig: np.ndarray) -> str | None:
+        """Key of an inserted document whose estimated Jaccard similarity >= threshold, if any."""
+        seen: set[str] = set()
+        for band, key in zip(self._buckets, self._band_keys(sig)):
+            for candidate in band.get(key, ()):
+                if candidate in seen:
+                    continue
+                seen.add(candidate)
+                if float(np.mean(self._signatures[candidate] == sig)) >= self.threshold:
+                    return candidate
+        return None
+
+    def insert(self, key: str, sig: np.ndarray) -> None:
+        self._signatures[key] = sig
+        for band, k in zip(self._buckets, self._band_keys(sig)):
+            band[k].append(key)
+
+    def add_if_new(self, key: str, text: str) -> str | None:
+        """Insert and return None if text is new; otherwise return the key it duplicates (not inserted)."""
+        sig = self.signature(text)
+        dup = self.find_duplicate(sig)
+        if dup is None:
+            self.insert(key, sig)
+        return dup
+
+
+def dedupe_documents(
+    docs: list[Document],
+    threshold: float = 0.85,
+    num_perm: int = 128,
+    index: NearDuplicateIndex | None = None,
+) -> tuple[list[Document], DedupReport]:
+    """
+    Drop documents that near-duplicate an earlier one (or one already in `index`). Kept documents get a
+    `duplicates_collapsed` count in metadata. Pass the same index across calls to dedupe incrementally.
+    """
+    index = index or NearDuplicateIndex(threshold, num_perm)
+    kept: list[Document] = []
+    by_key: dict[str, Document] = {}
+    groups: dict[str, list[str]] = {}
+    for i, doc in enumerate(docs):
+        key = str(doc.metadata.get("source") or f"doc_{i}")
+        dup = index.add_if_new(key, doc.page_content)
+        if dup is None:
+            kept.append(doc)
+            by_key[key] = doc
+            continue
+        groups.setdefault(dup, [dup]).append(key)
+        if dup in by_key:
+            by_key[dup].metadata["duplicates_collapsed"] = by_key[dup].metadata.get("duplicates_collapsed", 0) + 1
+    report = DedupReport(
+        input_docs=len(docs),
+        kept_docs=len(kept),
+        collapsed=len(docs) - len(kept),
+        groups=list(groups.values()),
+    )
+    return kept, report
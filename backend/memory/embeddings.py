@@ -0,0 +1,150 @@
+"""
+Embedding backends shared by indexing and retrieval.
+
+- huggingface (default): sentence-transformers all-MiniLM-L6-v2 through PyTorch.
+- onnx: the same model exported to ONNX and (optionally) int8-quantized, run with ONNX Runtime on CPU.
+  Loads model + tokenizer.json from local disk; no PyTorch import, explicit thread count and batch size.
+
+Get the ONNX files from the model repo (onnx/model.onnx, tokenizer.json), then quantize once:
+    python -m memory.embeddings quantize models/all-MiniLM-L6-v2/model.onnx models/all-MiniLM-L6-v2/model_int8.onnx
+"""
+import sys
+import threading
+from pathlib import Path
+
+from langchain_core.embeddings import Embeddings
+
+from config.settings import settings
+from utils.logging import get_logger
+
+logger = get_logger(__name__)
+
+HF_MODEL_NAME = "sentence-transformers/all-MiniLM-L6-v2"
+
+_embeddings: Embeddings | None = None
+_EMBEDDINGS_LOCK = threading.Lock()  # warm-up, prewarm and request threads may all ask first
+
+
+class OnnxEmbeddings(Embeddings):
+    """Mean-pooled, L2-normalized sentence embeddings from an ONNX transformer encoder."""
+
+    def __init__(
+        self,
+        model_path: str,
+        tokenizer_path: str,
+        threads: int = 0,
+        batch_size: int = 32,
+        max_length: int = 256,
+    ):
+        try:
+            import numpy as np
+            import onnxruntime as ort
+            from tokenizers import Tokenizer
+        except ImportError as e:
+            raise ImportError(
+                "EMBEDDING_BACKEND=onnx requires onnxruntime and tokenizers (see requirements.txt)."
+            ) from e
+        for p in (model_path, tokenizer_path):
+            if not Path(p).exists():
+                raise FileNotFoundError(f"ONNX embedding file not found: {p}")
+
+        self._np = np
+        opts = ort.SessionOptions()
+        opts.graph_optimization_level = ort.GraphOptimizationLevel.ORT_ENABLE_ALL
+        opts.execution_mode = ort.ExecutionMode.ORT_SEQUENTIAL
+        opts.inter_op_num_threads = 1
+        if threads > 0:
+            opts.intra_op_num_threads = threads
+        self._session = ort.InferenceSession(model_path, sess_options=opts, providers=["CPUExecutionProvider"])
+        self._input_names = {i.name for i in self._session.get_inputs()}
+
+        self._tokenizer = Tokenizer.from_file(tokenizer_path)
+        self._tokenizer.enable_truncation(max_length=max_length)
+        self._tokenizer.enable_padding()
+        self.batch_size = max(1, batch_size)
+
+    def _embed_batch(self, texts: list[str]):
+        np = self._np
+        encoded = self._tokenizer.encode_batch(texts)
+        ids = np.asarray([e.ids for e in encoded], dtype=np.int64)
+        mask = np.asarray([e.attention_mask for e in encoded], dtype=np.int64)
+        feeds = {"input_ids": ids, "attention_mask": mask}
+        if "token_type_ids" in self._input_names:
+            feeds["token_type_ids"] = np.zeros_like(ids)
+        hidden = self._session.run(None, feeds)[0]  # (batch, seq, dim)
+        m = mask[..., None].astype(np.float32)
+        pooled = (hidden * m).sum(axis=1) / m.sum(axis=1).clip(min=1e-9)
+        return pooled / np.linalg.norm(pooled, axis=1, keepdims=True).clip(min=1e-12)
+
+    def embed_documents(self, texts: list[str]) -> list[list[float]]:
+        out: list[list[float]] = []
+        for i in range(0, len(texts), self.batch_size):
+            out.extend(self._embed_batch(texts[i : i + self.batch_size]).tolist())
+        return out
+
+    def embed_query(self, text: str) -> list[float]:
+        return self._embed_batch([text])[0].tolist()
+
+
+def embedding_model_id() -> str:
+    """Identifier of the active embedding model; part of the prebuilt index version."""
+    if settings.embedding_backend == "onnx":
+        return f"onnx:{Path(settings.onnx_model_path).name}"
+    return HF_MODEL_NAME
+
+
+def _build_embeddings() -> Embeddings:
+    backend = settings.embedding_backend
+    if backend == "onnx":
+        return OnnxEmbeddings(
+            model_path=settings.onnx_model_path,
+            tokenizer_path=settings.onnx_tokenizer_path,
+            threads=settings.embedding_threads,
+            batch_size=settings.embedding_batch_size,
+            max_length=settings.embedding_max_length,
+        )
+    if backend != "huggingface":
+        raise ValueError(f"Unknown EMBEDDING_BACKEND: {backend!r} (expected huggingface | onnx)")
+
+    from langchain_community.embeddings import HuggingFaceEmbeddings
+
+    if settings.embedding_threads > 0:
+        import torch
+
+        torch.set_num_threads(settings.embedding_threads)
+    # ✅ LOCAL, STABLE EMBEDDINGS (NO API, NO NETWORK)
+    return HuggingFaceEmbeddings(
+        model_name=HF_MODEL_NAME,
+        encode_kwargs={"batch_size": settings.embedding_batch_size},
+    )
+
+
+def get_embeddings() -> Embeddings:
+    """Process-wide embedding model for the configured backend."""
+    global _embeddings
+    if _embeddings is None:
+        with _EMBEDDINGS_LOCK:
+            if _embeddings is None:
+                _embeddings = _build_embeddings()
+                logger.info("embeddings_loaded", backend=settings.embedding_backend, model=embedding_model_id())
+    return _embeddings
+
+
+def quantize_onnx_model(src: str, dst: str) -> None:
+    """Dynamic int8 weight quantization of an fp32 ONNX encoder."""
+    from onnxruntime.quantization import QuantType, quantize_dynamic
+
+    quantize_dynamic(src, dst, weight_type=QuantType.QInt8)
+
+
+def main(argv: list[str]) -> int:
+    if len(argv) != 3 or argv[0] != "quantize":
+        print("usage: python -m memory.embeddings quantize <model.onnx> <model_int8.onnx>", file=sys.stderr)
+        return 2
+    quantize_onnx_model(argv[1], argv[2])
+    print(argv[2])
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main(sys.argv[1:]))
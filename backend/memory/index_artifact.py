@@ -0,0 +1,270 @@
+"""
+Prebuilt, versioned vector index for multi-worker deployments.
+
+The corpus is embedded once (offline via `python -m memory.index_artifact build`, or by whichever
+worker wins the build lock) into the tenant's <index_artifact_dir>/<version>/:
+  embeddings.npy   float32, L2-normalized, one row per document
+  documents.json   page_content + metadata per row
+  manifest.json    version, embedding model, counts
+and <index_artifact_dir>/CURRENT names the live version. Versions are written to a temp dir and
+renamed into place, so readers never see a partial artifact. Workers np.load the matrix with
+mmap_mode="r": the pages live in the OS page cache and are shared by every process on the host.
+"""
+import hashlib
+import json
+import os
+import shutil
+import sys
+import tempfile
+import time
+from contextlib import contextmanager
+from pathlib import Path
+from typing import Iterator
+
+import numpy as np
+from langchain_core.documents import Document
+
+from config.settings import settings
+from utils.logging import get_logger
+from utils.tenancy import current_tenant, tenant_scope
+
+try:
+    import fcntl
+except ImportError:  # Windows dev machines: no cross-process lock, single worker assumed
+    fcntl = None
+
+logger = get_logger(__name__)
+
+_CURRENT = "CURRENT"
+_LOCK = ".build.lock"
+
+
+@contextmanager
+def file_lock(path: Path) -> Iterator[None]:
+    """Exclusive advisory lock across processes (blocks until acquired)."""
+    path.parent.mkdir(parents=True, exist_ok=True)
+    with path.open("a") as f:
+        if fcntl is not None:
+            fcntl.flock(f.fileno(), fcntl.LOCK_EX)
+        try:
+            yield
+        finally:
+            if fcntl is not None:
+                fcntl.flock(f.fileno(), fcntl.LOCK_UN)
+
+
+class _MmapRetriever:
+    def __init__(self, index: "MmapVectorIndex", k: int):
+        self._index = index
+        self._k = k
+
+    def invoke(self, query: str) -> list[Document]:
+        return self._index.similarity_search(query, k=self._k)
+
+
+class MmapVectorIndex:
+    """Read-only cosine-similarity index over a memory-mapped embedding matrix."""
+
+    def __init__(self, path: Path, embeddings):
+        self.path = path
+        self.manifest = json.loads((path / "manifest.json").read_text(encoding="utf-8"))
+        self.version: str = self.manifest["version"]
+        self.vectors = np.load(path / "embeddings.npy", mmap_mode="r")
+        records = json.loads((path / "documents.json").read_text(encoding="utf-8"))
+        self.documents = [Document(page_content=r["page_content"], metadata=r["metadata"]) for r in records]
+        self._embeddings = embeddings
+
+    def similarity_search(self, query: str, k: int = 4) -> list[Document]:
+        if not self.documents:
+            return []
+        return self.similarity_search_by_vector(self._embeddings.embed_query(query), k=k)
+
+    def similarity_search_by_vector(self, embedding: list[float], k: int = 4) -> list[Document]:
+        if not self.documents:
+            return []
+        q = np.array(embedding, dtype=np.float32)
+        q /= np.linalg.norm(q) or 1.0
+        scores = self.vectors @ q
+        k = min(k, len(scores))
+        top = np.argpartition(-scores, k - 1)[:k]
+        return [self.documents[i] for i in top[np.argsort(-scores[top])]]
+
+    def as_retriever(self, search_kwargs: dict | None = None) -> _MmapRetriever:
+        return _MmapRetriever(self, k=(search_kwargs or {}).get("k", 4))
+
+
+def _artifact_root() -> Path:
+    return Path(current_tenant().index_artifact_dir)
+
+
+def current_version() -> str | None:
+    pointer = _artifact_root() / _CURRENT
+    if not pointer.exists():
+        return None
+    version = pointer.read_text(encoding="utf-8").strip()
+    return version if version and (_artifact_root() / version / "manifest.json").exists() else None
+
+
+def _content_version(docs: list[Document], model_name: str) -> str:
+    h = hashlib.sha256(model_name.encode())
+    for d in docs:
+        h.update(d.page_content.encode("utf-8"))
+        h.update(json.dumps(d.metadata, sort_keys=True).encode("utf-8"))
+    return h.hexdigest()[:12]
+
+
+def _write_atomic(path: Path, text: str) -> None:
+    tmp = path.with_name(f".{path.name}.{os.getpid()}.tmp")
+    tmp.write_text(text, encoding="utf-8")
+    os.replace(tmp, path)
+
+
+def _normalize(vectors: np.ndarray) -> np.ndarray:
+    if vectors.size:
+        vectors /= np.linalg.norm(vectors, axis=1, keepdims=True).clip(min=1e-12)
+    return vectors
+
+
+def _write_version(root: Path, version: str, docs: list[Document], vectors: np.ndarray, model_name: str) -> None:
+    staging = Path(tempfile.mkdtemp(prefix=f".{version}-", dir=root))
+    try:
+        np.save(staging / "embeddings.npy", vectors)
+        (staging / "documents.json").write_text(
+            json.dumps([{"page_content": d.page_content, "metadata": d.metadata} for d in docs]),
+            encoding="utf-8",
+        )
+        (staging / "manifest.json").write_text(
+            json.dumps(
+                {
+                    "version": version,
+                    "embedding_model": model_name,
+                    "num_docs": len(docs),
+                    "dim": int(vectors.shape[1]) if vectors.ndim == 2 else 0,
+                    "created_at": time.time(),
+                }
+            ),
+            encoding="utf-8",
+        )
+        staging.chmod(0o755)
+        os.replace(staging, root / version)
+    except Exception:
+        shutil.rmtree(staging, ignore_errors=True)
+        raise
+
+
+def build_index_artifact(docs: list[Document], embeddings, model_name: str) -> str:
+    """Embed docs into a new versioned artifact and point CURRENT at it. Returns the version."""
+    root = _artifact_root()
+    root.mkdir(parents=True, exist_ok=True)
+    version = _content_version(docs, model_name)
+    if not (root / version / "manifest.json").exists():
+        t = time.perf_counter()
+        vectors = np.asarray(embeddings.embed_documents([d.page_content for d in docs]), dtype=np.float32)
+        _write_version(root, version, docs, _normalize(vectors), model_name)
+        logger.info("index_artifact_built", version=version, num_docs=len(docs), seconds=round(time.perf_counter() - t, 2))
+    _write_atomic(root / _CURRENT, version)
+    return version
+
+
+def update_index_artifact(base: MmapVectorIndex, docs: list[Document], embeddings, model_name: str) -> tuple[MmapVectorIndex, int]:
+    """
+    Publish docs as a new version, copying the vector of every doc whose text is already in base (same
+    embedding model) and embedding only the rest, and load it. Runs under the build lock, so workers
+    applying the same corpus change write it once. Returns (index, docs embedded); base if nothing changed.
+    """
+    root = _artifact_root()
+    version = _content_version(docs, model_name)
+    if version == base.version:
+        return base, 0
+    embedded = 0
+    with file_lock(root / _LOCK):
+        if not (root / version / "manifest.json").exists():
+            rows: dict[str, int] = {}
+            if base.manifest.get("embedding_model") == model_name:
+                rows = {d.page_content: i for i, d in enumerate(base.documents)}
+            missing = [i for i, d in enumerate(docs) if d.page_content not in rows]
+            dim = base.vectors.shape[1] if base.vectors.ndim == 2 and rows else 0
+            if missing:
+                fresh = np.asarray(embeddings.embed_documents([docs[i].page_content for i in missing]), dtype=np.float32)
+                dim = fresh.shape[1]
+            vectors = np.zeros((len(docs), dim), dtype=np.float32)
+            for i, d in enumerate(docs):
+                if d.page_content in rows:
+                    vectors[i] = base.vectors[rows[d.page_content]]
+            if missing:
+                vectors[missing] = _normalize(fresh)
+            _write_version(root, version, docs, vectors, model_name)
+            embedded = len(missing)
+        _write_atomic(root / _CURRENT, version)
+    index = MmapVectorIndex(root / version, embeddings)
+    logger.info("index_artifact_updated", version=version, base=base.version, num_docs=len(docs), embedded=embedded)
+    return index, embedded
+
+
+def load_index_artifact(embeddings) -> MmapVectorIndex | None:
+    version = current_version()
+    if version is None:
+        return None
+    index = MmapVectorIndex(_artifact_root() / version, embeddings)
+    logger.info("index_artifact_loaded", version=version, num_docs=len(index.documents))
+    return index
+
+
+def ensure_index_artifact(build_docs, embeddings, model_name: str) -> MmapVectorIndex:
+    """
+    Load the CURRENT artifact, building it first if missing. The build lock elects one process
+    as builder; the others block on it and then load what the leader wrote.
+    """
+    index = load_index_artifact(embeddings)
+    if index is not None:
+        return index
+    if not settings.index_build_on_startup:
+        raise RuntimeError(
+            f"No prebuilt index in {_artifact_root()}. Run `python -m memory.index_artifact build` before starting workers."
+        )
+    with file_lock(_artifact_root() / _LOCK):
+        if current_version() is None:
+            logger.info("index_artifact_build_leader", pid=os.getpid())
+            build_index_artifact(build_docs(), embeddings, model_name)
+    return load_index_artifact(embeddings)
+
+
+def prune_index_artifacts(keep: int = 2) -> list[str]:
+    """Delete all but the newest `keep` versions (never CURRENT). Returns removed versions."""
+    root = _artifact_root()
+    current = current_version()
+    versions = sorted(
+        (p for p in root.iterdir() if p.is_dir() and (p / "manifest.json").exists()),
+        key=lambda p: p.stat().st_mtime,
+        reverse=True,
+    )
+    removed = []
+    for p in versions[keep:]:
+        if p.name != current:
+            shutil.rmtree(p, ignore_errors=True)
+            removed.append(p.name)
+    return removed
+
+
+def main(argv: list[str]) -> int:
+    """Offline build: `python -m memory.index_artifact build [--tenant NAME] [--prune N]` (run from backend/)."""
+    from memory.chroma_store import _all_documents
+    from memory.embeddings import embedding_model_id, get_embeddings
+
+    if not argv or argv[0] != "build":
+        print("usage: python -m memory.index_artifact build [--tenant NAME] [--prune N]", file=sys.stderr)
+        return 2
+    tenant = argv[argv.index("--tenant") + 1] if "--tenant" in argv else None
+    with tenant_scope(tenant):
+        with file_lock(_artifact_root() / _LOCK):
+            version = build_index_artifact(_all_documents(), get_embeddings(), embedding_model_id())
+        print(version)
+        if "--prune" in argv:
+            keep = int(argv[argv.index("--prune") + 1])
+            for v in prune_index_artifacts(keep):
+                print(f"pruned {v}", file=sys.stderr)
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main(sys.argv[1:]))
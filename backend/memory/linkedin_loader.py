@@ -1,65 +1,264 @@
-"""Load DataVex LinkedIn posts for RAG context. All posts in the configured JSON are indexed."""
+"""Load DataVex LinkedIn posts for RAG context. All posts in the configured JSON are indexed.
+
+Posts are streamed one at a time from either a JSON array (.json) or JSON Lines (.jsonl, append-friendly),
+so memory stays flat regardless of export size. Incremental indexing skips posts already indexed with the
+same content (by stable id and content fingerprint), so a new or edited post is picked up whatever its date
+or position. For .jsonl a watermark (byte offset plus the
+file's identity) also lets a pass resume after the lines an earlier one consumed instead of re-reading them.
+"""
+import hashlib
 import json
+import os
+from collections.abc import Mapping
+from dataclasses import asdict, dataclass
 from pathlib import Path
+from typing import BinaryIO, Iterator
 
 from langchain_core.documents import Document
 
-from config import settings
 from utils.logging import get_logger
+from utils.tenancy import current_tenant
 
 logger = get_logger(__name__)
 
+_READ_CHUNK = 64 * 1024
 
-def _linkedin_posts_path() -> Path:
-    """Resolve path to LinkedIn posts JSON (config or default under backend/data)."""
-    p = Path(settings.linkedin_posts_path)
-    if p.is_absolute():
-        return p
-    if p.exists():
+
+@dataclass
+class LinkedInWatermark:
+    """
+    Progress of the last indexing pass. last_date/last_url record the newest post indexed (for logs only;
+    which posts are new is decided by post id). For .jsonl, offset plus the file identity fields allow
+    resuming without re-reading the file; they are checked before resuming, see _jsonl_resumable.
+    """
+
+    last_date: str = ""
+    last_url: str = ""
+    count: int = 0  # posts seen so far
+    offset: int = 0  # .jsonl only: byte offset just past the last consumed line
+    inode: int = 0  # .jsonl only: identity of the consumed file
+    first_line: str = ""  # .jsonl only: hash of the file's first line
+    last_line_start: int = 0  # .jsonl only: byte offset of the last consumed line
+    last_line: str = ""  # .jsonl only: hash of the last consumed line
+
+    def advance(self, doc: Document) -> None:
+        key = (doc.metadata.get("date", ""), doc.metadata.get("url", ""))
+        if key > (self.last_date, self.last_url):
+            self.last_date, self.last_url = key
+
+
+def linkedin_posts_path() -> Path:
+    """Resolve the current tenant's LinkedIn posts JSON (config, or for DEFAULT_TENANT the default under backend/data)."""
+    tenant = current_tenant()
+    p = Path(tenant.linkedin_posts_path)
+    if p.is_absolute() or p.exists() or not tenant.is_default:
         return p
     # Default relative to backend
     default = Path(__file__).resolve().parent.parent / "data" / "linkedin_posts.json"
     return default if default.exists() else p
 
 
+def _watermark_path() -> Path:
+    return current_tenant().chroma_path() / "linkedin_watermark.json"
+
+
+def load_watermark() -> LinkedInWatermark | None:
+    path = _watermark_path()
+    if not path.exists():
+        return None
+    try:
+        return LinkedInWatermark(**json.loads(path.read_text(encoding="utf-8")))
+    except Exception as e:
+        logger.warning("linkedin_watermark_invalid", path=str(path), error=str(e))
+        return None
+
+
+def save_watermark(wm: LinkedInWatermark) -> None:
+    path = _watermark_path()
+    path.parent.mkdir(parents=True, exist_ok=True)
+    tmp = path.with_suffix(".tmp")
+    tmp.write_text(json.dumps(asdict(wm)), encoding="utf-8")
+    tmp.replace(path)
+
+
+def _iter_json_array(f) -> Iterator[object]:
+    """Yield elements of a top-level JSON array from a text stream, holding at most one element in memory."""
+    decoder = json.JSONDecoder()
+    buf = ""
+    pos = 0
+    started = False
+    eof = False
+    while True:
+        # Skip whitespace and separators
+        while True:
+            while pos < len(buf) and buf[pos] in " \t\r\n,":
+                pos += 1
+            if pos < len(buf) or eof:
+                break
+            buf, pos = f.read(_READ_CHUNK), 0
+            eof = not buf
+        if pos >= len(buf):
+            return
+        if not started:
+            if buf[pos] != "[":
+                raise ValueError("LinkedIn posts file is not a JSON array")
+            started = True
+            pos += 1
+            continue
+        if buf[pos] == "]":
+            return
+        try:
+            item, end = decoder.raw_decode(buf, pos)
+        except json.JSONDecodeError:
+            if eof:
+                raise
+            chunk = f.read(_READ_CHUNK)
+            eof = not chunk
+            buf, pos = buf[pos:] + chunk, 0
+            continue
+        yield item
+        pos = end
+
+
+def _iter_jsonl(f: BinaryIO, offset: int) -> Iterator[tuple[object | None, bytes, int]]:
+    """
+    Yield (item, raw line, offset after line) for each complete line of a binary JSON Lines stream from
+    offset; item is None for blank lines.
+    """
+    f.seek(offset)
+    for line in iter(f.readline, b""):
+        offset += len(line)
+        if not line.endswith(b"\n"):
+            return  # partially written trailing line; picked up on the next pass
+        yield (json.loads(line) if line.strip() else None), line, offset
+
+
+def _line_hash(line: bytes) -> str:
+    return hashlib.sha1(line).hexdigest()[:16]
+
+
+def _jsonl_resumable(f: BinaryIO, wm: LinkedInWatermark) -> bool:
+    """
+    Whether wm.offset still points just past the lines wm consumed: same file (inode), first line and last
+    consumed line unchanged. A rewritten or re-exported file fails this even when it is as large, and is
+    rescanned from the start instead of resumed mid-file.
+    """
+    st = os.fstat(f.fileno())
+    if not (0 < wm.offset <= st.st_size) or wm.inode != st.st_ino:
+        return False
+    f.seek(0)
+    if _line_hash(f.readline()) != wm.first_line:
+        return False
+    f.seek(wm.last_line_start)
+    line = f.readline()
+    return wm.last_line_start + len(line) == wm.offset and _line_hash(line) == wm.last_line
+
+
+def content_fingerprint(text: str) -> str:
+    return hashlib.sha1(text.encode("utf-8")).hexdigest()
+
+
+def post_id(content: str, date: str = "", url: str = "") -> str:
+    """
+    Stable id of a post: from its URL, else its date and content. Unlike the position in the export, it
+    does not change when posts are inserted above it or removed, so upserts by id never hit another post.
+    """
+    key = f"url:{url}" if url else f"{date}\n{content}"
+    return "linkedin_post_" + hashlib.sha1(key.encode("utf-8")).hexdigest()[:16]
+
+
+def _to_document(item: object) -> Document | None:
+    if not isinstance(item, dict):
+        return None
+    content = item.get("content") or item.get("text") or item.get("body") or ""
+    if not content or not str(content).strip():
+        return None
+    content = str(content).strip()
+    meta = {
+        "source": post_id(content, str(item.get("date") or ""), str(item.get("url") or "")),
+        "origin": "linkedin",
+    }
+    if item.get("date"):
+        meta["date"] = str(item["date"])
+    if item.get("url"):
+        meta["url"] = str(item["url"])
+    if item.get("title"):
+        meta["title"] = str(item["title"])
+    return Document(page_content=content, metadata=meta)
+
+
+def _is_indexed(doc: Document, indexed: Mapping[str, str] | None) -> bool:
+    return bool(indexed) and indexed.get(doc.metadata["source"]) == content_fingerprint(doc.page_content)
+
+
+def iter_linkedin_posts(
+    since: LinkedInWatermark | None = None,
+    indexed: Mapping[str, str] | None = None,
+) -> Iterator[Document]:
+    """
+    Stream posts as Documents, skipping those `indexed` (post id -> content_fingerprint of what the index
+    holds) lists with unchanged content. With
+    `since`, a .jsonl export the watermark consumed is resumed after its last consumed line, or rescanned
+    from the start if the file was rewritten. `since` is advanced in place as lines are consumed; persist it
+    with save_watermark once the yielded posts are indexed.
+    """
+    path = linkedin_posts_path()
+    if not path.exists():
+        logger.debug("linkedin_posts_file_missing", path=str(path))
+        return
+    wm = since
+
+    if path.suffix == ".jsonl":
+        with path.open("rb") as f:
+            resume = wm is not None and _jsonl_resumable(f, wm)
+            if wm is not None and not resume:
+                wm.offset = wm.count = 0
+                wm.inode = os.fstat(f.fileno()).st_ino
+            for item, line, end in _iter_jsonl(f, wm.offset if resume else 0):
+                if wm is not None:
+                    start = end - len(line)
+                    if start == 0:
+                        wm.first_line = _line_hash(line)
+                    wm.last_line_start, wm.last_line, wm.offset = start, _line_hash(line), end
+                doc = _to_document(item)
+                if doc is None:
+                    continue
+                if wm is not None:
+                    wm.count += 1
+                if _is_indexed(doc, indexed):
+                    continue
+                if wm is not None:
+                    wm.advance(doc)
+                yield doc
+        return
+
+    # JSON array: always scanned from the start; a post's position or date says nothing about whether it is new.
+    with path.open("r", encoding="utf-8") as f:
+        for i, item in enumerate(_iter_json_array(f)):
+            doc = _to_document(item)
+            if doc is None:
+                continue
+            if wm is not None:
+                wm.count = i + 1
+            if _is_indexed(doc, indexed):
+                continue
+            if wm is not None:
+                wm.advance(doc)
+            yield doc
+
+
 def load_linkedin_posts() -> list[Document]:
     """
     Load all LinkedIn posts from the configured JSON file.
     Expected format: array of objects with "content" (required), optional "date", "url", "title".
     Returns empty list if file missing or invalid.
     """
-    path = _linkedin_posts_path()
-    if not path.exists():
-        logger.debug("linkedin_posts_file_missing", path=str(path))
-        return []
+    path = linkedin_posts_path()
     try:
-        raw = path.read_text(encoding="utf-8")
-        data = json.loads(raw)
+        docs = list(iter_linkedin_posts())
     except Exception as e:
         logger.warning("linkedin_posts_load_failed", path=str(path), error=str(e))
         return []
-    if not isinstance(data, list):
-        logger.warning("linkedin_posts_not_array", path=str(path))
-        return []
-    docs: list[Document] = []
-    for i, item in enumerate(data):
-        if not isinstance(item, dict):
-            continue
-        content = item.get("content") or item.get("text") or item.get("body") or ""
-        if not content or not str(content).strip():
-            continue
-        content = str(content).strip()
-        meta = {
-            "source": f"linkedin_post_{i}",
-            "origin": "linkedin",
-        }
-        if item.get("date"):
-            meta["date"] = str(item["date"])
-        if item.get("url"):
-            meta["url"] = str(item["url"])
-        if item.get("title"):
-            meta["title"] = str(item["title"])
-        docs.append(Document(page_content=content, metadata=meta))
     if docs:
         logger.info("linkedin_posts_loaded", path=str(path), count=len(docs))
     return docs
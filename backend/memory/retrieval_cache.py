@@ -0,0 +1,167 @@
+"""
+Retrieval result cache for grounding queries.
+
+Positioning queries (core thesis + chosen angle) repeat across keywords, often verbatim and often with
+only wording changes. Results are cached per (tenant, index version, k, normalized query):
+- exact: the normalized query was seen before; neither the query embedding nor the search runs.
+- similar: the query embedding is within RETRIEVAL_CACHE_SIMILARITY (cosine) of a searched query's; the
+  search is skipped and that query's documents are reused. The new wording is cached as an exact-only
+  alias: it is not matched against later queries, so matches never chain past the threshold.
+- miss: search by the already computed embedding and cache the result.
+
+The index version is part of every key and a tenant's entries are dropped as soon as a newer version is
+seen, so corpus refreshes (memory.watcher) and rebuilds invalidate the cache without any hook.
+"""
+import re
+import threading
+import time
+from collections import OrderedDict
+from dataclasses import dataclass
+
+import numpy as np
+from langchain_core.documents import Document
+
+from config.settings import settings
+from memory.chroma_store import current_index
+from memory.embeddings import get_embeddings
+from utils.logging import get_logger
+from utils.metrics import RETRIEVAL_CACHE_LOOKUPS
+from utils.tenancy import current_tenant
+
+logger = get_logger(__name__)
+
+_WORD = re.compile(r"\w+")
+
+
+def normalize_query(query: str) -> str:
+    """Case, punctuation and whitespace differences do not change the cache key."""
+    return " ".join(_WORD.findall(query.lower()))
+
+
+@dataclass
+class Retrieval:
+    docs: list[Document]
+    cache: str  # exact | similar | miss | off
+    seconds: float
+    similarity: float | None = None  # cosine to the cached query, for "similar"
+
+
+class _Entry:
+    __slots__ = ("tenant", "version", "k", "vector", "docs")
+
+    def __init__(self, tenant: str, version: str, k: int, vector: np.ndarray | None, docs: list[Document]):
+        self.tenant = tenant
+        self.version = version
+        self.k = k
+        self.vector = vector  # None for aliases of a similar hit: exact lookups only
+        self.docs = docs
+
+
+class RetrievalCache:
+    """LRU of retrieval results; exact lookups by key, near-duplicate lookups by query embedding."""
+
+    def __init__(self, max_entries: int, similarity: float):
+        self.max_entries = max_entries
+        self.similarity = similarity
+        self._entries: "OrderedDict[tuple[str, str, int, str], _Entry]" = OrderedDict()
+        self._versions: dict[str, str] = {}  # tenant -> newest index version seen
+        self._lock = threading.Lock()
+
+    def _observe_version_locked(self, tenant: str, version: str) -> None:
+        if self._versions.get(tenant) == version:
+            return
+        self._versions[tenant] = version
+        stale = [key for key, e in self._entries.items() if e.tenant == tenant and e.version != version]
+        for key in stale:
+            del self._entries[key]
+        if stale:
+            logger.info("retrieval_cache_invalidated", tenant=tenant, index_version=version, dropped=len(stale))
+
+    def get(self, tenant: str, version: str, k: int, query: str) -> _Entry | None:
+        key = (tenant, version, k, query)
+        with self._lock:
+            self._observe_version_locked(tenant, version)
+            entry = self._entries.get(key)
+            if entry is not None:
+                self._entries.move_to_end(key)
+            return entry
+
+    def get_similar(self, tenant: str, version: str, k: int, vector: np.ndarray) -> tuple[_Entry, float] | None:
+        """Most similar searched query (aliases excluded) at or above the threshold."""
+        if self.similarity >= 1:
+            return None
+        best: tuple[_Entry, float] | None = None
+        with self._lock:
+            for key, entry in self._entries.items():
+                if entry.vector is None or entry.tenant != tenant or entry.version != version or entry.k != k:
+                    continue
+                score = float(entry.vector @ vector)
+                if score >= self.similarity and (best is None or score > best[1]):
+                    best = (entry, score)
+        return best
+
+    def put(
+        self, tenant: str, version: str, k: int, query: str, vector: np.ndarray | None, docs: list[Document]
+    ) -> None:
+        key = (tenant, version, k, query)
+        with self._lock:
+            if self._versions.get(tenant) != version:
+                return  # a newer index was seen while this search ran
+            self._entries[key] = _Entry(tenant, version, k, vector, docs)
+            self._entries.move_to_end(key)
+            while len(self._entries) > self.max_entries:
+                self._entries.popitem(last=False)
+
+    def clear(self) -> None:
+        with self._lock:
+            self._entries.clear()
+            self._versions.clear()
+
+
+_cache: RetrievalCache | None = None
+_cache_lock = threading.Lock()
+
+
+def get_retrieval_cache() -> RetrievalCache:
+    global _cache
+    with _cache_lock:
+        if _cache is None:
+            _cache = RetrievalCache(settings.retrieval_cache_size, settings.retrieval_cache_similarity)
+        return _cache
+
+
+def _unit(vector: list[float]) -> np.ndarray:
+    v = np.array(vector, dtype=np.float32)
+    v /= np.linalg.norm(v) or 1.0
+    return v
+
+
+def retrieve(query: str, k: int = 4) -> Retrieval:
+    """Top-k documents for query from the current tenant's index, through the retrieval cache."""
+    t = time.perf_counter()
+    store, version = current_index()
+    if not settings.retrieval_cache_enabled or settings.retrieval_cache_size <= 0 or version is None:
+        docs = store.as_retriever(search_kwargs={"k": k}).invoke(query)
+        RETRIEVAL_CACHE_LOOKUPS.labels(outcome="off").inc()
+        return Retrieval(docs, "off", time.perf_counter() - t)
+
+    cache = get_retrieval_cache()
+    tenant = current_tenant().name
+    key = normalize_query(query)
+    entry = cache.get(tenant, version, k, key)
+    if entry is not None:
+        RETRIEVAL_CACHE_LOOKUPS.labels(outcome="exact").inc()
+        return Retrieval(list(entry.docs), "exact", time.perf_counter() - t)
+
+    vector = _unit(get_embeddings().embed_query(query))
+    similar = cache.get_similar(tenant, version, k, vector)
+    if similar is not None:
+        entry, score = similar
+        cache.put(tenant, version, k, key, None, entry.docs)  # later repeats of this wording hit exactly
+        RETRIEVAL_CACHE_LOOKUPS.labels(outcome="similar").inc()
+        return Retrieval(list(entry.docs), "similar", time.perf_counter() - t, round(score, 4))
+
+    docs = store.similarity_search_by_vector(vector.tolist(), k=k)
+    cache.put(tenant, version, k, key, vector, docs)
+    RETRIEVAL_CACHE_LOOKUPS.labels(outcome="miss").inc()
+    return Retrieval(list(docs), "miss", time.perf_counter() - t)
@@ -0,0 +1,83 @@
+"""File-backed store of finished pipeline runs: by run_id, plus a latest-run pointer per (tenant, keyword)."""
+import hashlib
+import json
+import os
+import time
+from pathlib import Path
+
+from config import settings
+from utils.logging import get_logger
+from utils.schemas import PipelineState
+
+logger = get_logger(__name__)
+
+
+def _root() -> Path:
+    return Path(settings.run_store_dir)
+
+
+def _keyword_pointer(keyword: str, tenant: str | None) -> Path:
+    key = keyword.strip().lower()
+    if tenant and tenant != settings.default_tenant:
+        key = f"{tenant}\0{key}"  # DEFAULT_TENANT keeps the pointers written before tenants existed
+    digest = hashlib.sha1(key.encode("utf-8")).hexdigest()[:16]
+    return _root() / "by_keyword" / f"{digest}.json"
+
+
+def _write_atomic(path: Path, data: bytes) -> None:
+    path.parent.mkdir(parents=True, exist_ok=True)
+    tmp = path.with_name(f".{path.name}.{os.getpid()}.tmp")
+    tmp.write_bytes(data)
+    os.replace(tmp, path)
+
+
+def save_run(state: PipelineState) -> None:
+    """Persist the run. Completed runs also become the latest result for their tenant and keyword."""
+    if not settings.run_store_enabled or not state.run_id:
+        return
+    try:
+        _write_atomic(_root() / f"{state.run_id}.json", state.model_dump_json().encode("utf-8"))
+        if not state.aborted and state.content_assets is not None:
+            pointer = {"run_id": state.run_id, "created_at": state.created_at}
+            _write_atomic(_keyword_pointer(state.keyword, state.tenant), json.dumps(pointer).encode("utf-8"))
+    except Exception as e:
+        logger.warning("run_store_save_failed", run_id=state.run_id, error=str(e))
+
+
+def load_run(run_id: str) -> PipelineState | None:
+    if not run_id.isalnum():
+        return None
+    path = _root() / f"{run_id}.json"
+    if not path.exists():
+        return None
+    try:
+        return PipelineState.model_validate_json(path.read_bytes())
+    except Exception as e:
+        logger.warning("run_store_load_failed", run_id=run_id, error=str(e))
+        return None
+
+
+def latest_run_for_keyword(keyword: str, tenant: str | None = None) -> PipelineState | None:
+    """Most recent completed run for the keyword (case-insensitive) of tenant (None = DEFAULT_TENANT), if any."""
+    pointer = _keyword_pointer(keyword, tenant)
+    if not pointer.exists():
+        return None
+    try:
+        run_id = json.loads(pointer.read_text(encoding="utf-8"))["run_id"]
+    except Exception:
+        return None
+    return load_run(run_id)
+
+
+def fresh_run_for_keyword(keyword: str, tenant: str | None = None) -> PipelineState | None:
+    """
+    Latest run for keyword and tenant if /api/run may serve it instead of running: younger than
+    CACHED_RESULT_MAX_AGE_SECONDS. With the default 0, stored runs are never served, so none is fresh.
+    """
+    max_age = settings.cached_result_max_age_seconds
+    if max_age <= 0:
+        return None
+    state = latest_run_for_keyword(keyword, tenant)
+    if state is None or time.time() - state.created_at > max_age:
+        return None
+    return state
@@ -0,0 +1,119 @@
+"""
+Hot reload of the DataVex corpus: a background thread polls the corpus dir (*.md) and the LinkedIn
+export and, once changes have settled for CORPUS_WATCH_DEBOUNCE_SECONDS, calls refresh_index() so only
+new or edited documents are re-embedded into the live index.
+
+Polling (mtime + size every CORPUS_WATCH_POLL_SECONDS) needs no extra dependency and also works on
+network and container-mounted volumes where inotify events do not arrive. A burst of saves, or an
+export still being written, resets the debounce timer, so it is applied once. Each worker process
+runs its own watcher; in prebuilt mode they converge on the same artifact version, built once.
+Every tenant's files are watched; changes to a tenant whose index is not loaded are picked up when it loads.
+"""
+import threading
+import time
+from pathlib import Path
+
+from config import settings
+from config.tenants import tenant_names
+from memory.chroma_store import corpus_dir, refresh_index
+from memory.linkedin_loader import linkedin_posts_path
+from utils.logging import get_logger
+from utils.tenancy import tenant_scope
+
+logger = get_logger(__name__)
+
+_watcher: "CorpusWatcher | None" = None
+
+Snapshot = dict[str, tuple[int, int]]  # path -> (mtime_ns, size)
+
+
+def snapshot_corpus(tenant: str | None = None) -> Snapshot:
+    """Stat every file tenant's index is built from (web pages excepted)."""
+    paths: list[Path] = []
+    with tenant_scope(tenant):
+        root = corpus_dir()
+        if root.exists():
+            paths.extend(root.glob("**/*.md"))
+        paths.append(linkedin_posts_path())
+    snap: Snapshot = {}
+    for path in paths:
+        try:
+            st = path.stat()
+        except OSError:  # missing, or removed between glob and stat
+            continue
+        snap[str(path)] = (st.st_mtime_ns, st.st_size)
+    return snap
+
+
+class _TenantFiles:
+    def __init__(self, tenant: str) -> None:
+        self.tenant = tenant
+        self.applied: Snapshot = snapshot_corpus(tenant)  # what the live index reflects
+        self.seen: Snapshot = self.applied  # latest poll
+        self.changed_at: float | None = None  # monotonic time of the last change not yet applied
+
+
+class CorpusWatcher:
+    def __init__(self, poll_seconds: float, debounce_seconds: float) -> None:
+        self.poll_seconds = poll_seconds
+        self.debounce_seconds = debounce_seconds
+        self._halt = threading.Event()
+        self._thread = threading.Thread(target=self._loop, name="corpus-watcher", daemon=True)
+        self._tenants: list[_TenantFiles] = []
+
+    def start(self) -> None:
+        self._tenants = [_TenantFiles(name) for name in tenant_names()]
+        self._thread.start()
+
+    def stop(self) -> None:
+        self._halt.set()
+        self._thread.join(timeout=5)
+
+    def _loop(self) -> None:
+        while not self._halt.wait(self.poll_seconds):
+            for files in self._tenants:
+                try:
+                    self.poll(files)
+                except Exception:
+                    logger.exception("corpus_watch_poll_failed", tenant=files.tenant)
+
+    def poll(self, files: _TenantFiles) -> bool:
+        """One poll of a tenant; refreshes its index when a pending change has settled. True if it refreshed."""
+        snap = snapshot_corpus(files.tenant)
+        now = time.monotonic()
+        if snap != files.seen:
+            files.seen = snap
+            files.changed_at = now if snap != files.applied else None
+            return False
+        if files.changed_at is None or now - files.changed_at < self.debounce_seconds:
+            return False
+        changed = sorted(p for p in snap.keys() | files.applied.keys() if snap.get(p) != files.applied.get(p))
+        logger.info("corpus_change_detected", tenant=files.tenant, files=changed)
+        try:
+            refresh_index(files.tenant)
+        except Exception:
+            # Keep the change pending; retried after another debounce period.
+            files.changed_at = now
+            logger.exception("corpus_refresh_failed", tenant=files.tenant)
+            return False
+        # An index that is not loaded has nothing to refresh; it reads the current files when it loads.
+        files.applied = snap
+        files.changed_at = None
+        return True
+
+
+def start_corpus_watcher() -> None:
+    """Start the watcher if CORPUS_WATCH_ENABLED."""
+    global _watcher
+    if not settings.corpus_watch_enabled or _watcher is not None:
+        return
+    _watcher = CorpusWatcher(settings.corpus_watch_poll_seconds, settings.corpus_watch_debounce_seconds)
+    _watcher.start()
+    logger.info("corpus_watcher_started", tenants=tenant_names(), poll_seconds=_watcher.poll_seconds)
+
+
+def stop_corpus_watcher() -> None:
+    global _watcher
+    if _watcher is not None:
+        _watcher.stop()
+        _watcher = None
@@ -0,0 +1,5 @@
+"""Run tests from any directory with backend/ on sys.path, as the app itself runs (`cd backend`)."""
+import sys
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).resolve().parent.parent))
@@ -0,0 +1,65 @@
+import numpy as np
+import pytest
+from langchain_core.documents import Document
+
+from memory.dedup import NearDuplicateIndex, _lsh_params, dedupe_documents
+
+BASE = (
+    "DataVex builds decision infrastructure for data teams that need answers they can trust, "
+    "not dashboards nobody reads. We start from the decision a team has to make and work backwards "
+    "to the minimum data, models and review steps needed to make it repeatably and explain it afterwards."
+)
+OTHER = (
+    "Streaming joins fail in subtle ways when late events arrive after the watermark has passed. "
+    "This note walks through three production incidents and the windowing changes that fixed them."
+)
+
+
+def _doc(text: str, source: str) -> Document:
+    return Document(page_content=text, metadata={"source": source})
+
+
+@pytest.mark.parametrize("threshold", [0.5, 0.7, 0.85, 0.95])
+def test_lsh_params_fit_permutations_and_threshold(threshold):
+    bands, rows = _lsh_params(threshold, 128)
+    assert bands * rows <= 128
+    assert abs((1 / bands) ** (1 / rows) - threshold) < 0.1
+
+
+def test_signature_is_deterministic_across_indexes():
+    assert np.array_equal(NearDuplicateIndex().signature(BASE), NearDuplicateIndex().signature(BASE))
+
+
+def test_near_duplicate_collapses_into_earlier_document():
+    repost = BASE.replace("DataVex builds", "DataVex  builds").upper() + " #data"
+    kept, report = dedupe_documents([_doc(BASE, "corpus"), _doc(OTHER, "web"), _doc(repost, "linkedin")])
+    assert [d.metadata["source"] for d in kept] == ["corpus", "web"]
+    assert report.collapsed == 1
+    assert report.groups == [["corpus", "linkedin"]]
+    assert kept[0].metadata["duplicates_collapsed"] == 1
+
+
+def test_distinct_documents_are_kept():
+    kept, report = dedupe_documents([_doc(BASE, "a"), _doc(OTHER, "b")])
+    assert len(kept) == 2 and report.collapsed == 0
+
+
+def test_index_dedupes_incrementally_across_calls():
+    index = NearDuplicateIndex()
+    dedupe_documents([_doc(BASE, "corpus")], index=index)
+    kept, report = dedupe_documents([_doc(BASE + " Thanks for reading.", "post"), _doc(OTHER, "other")], index=index)
+    assert [d.metadata["source"] for d in kept] == ["other"]
+    assert report.groups == [["corpus", "post"]]
+
+
+def test_add_if_new_returns_the_duplicated_key_without_inserting():
+    index = NearDuplicateIndex()
+    assert index.add_if_new("a", BASE) is None
+    assert index.add_if_new("b", BASE) == "a"
+    assert index.add_if_new("c", BASE) == "a"
+
+
+def test_texts_without_words_do_not_crash():
+    index = NearDuplicateIndex()
+    assert index.add_if_new("empty", "") is None
+    assert index.add_if_new("real", OTHER) is None
@@ -0,0 +1,74 @@
+import pytest
+
+from agents.revision.editor import EditError, apply_edits, split_sections
+
+SECTIONS = ["one", "two", "three"]
+
+
+def test_mixed_edits_use_original_section_numbers():
+    edits = [
+        {"op": "delete", "section": 1},
+        {"op": "insert_after", "section": 1, "text": "after one"},
+        {"op": "replace", "section": 2, "text": "TWO"},
+        {"op": "insert_after", "section": 3, "text": "end"},
+    ]
+    assert apply_edits(SECTIONS, edits, "linkedin") == ["after one", "TWO", "three", "end"]
+
+
+def test_insert_after_zero_prepends_in_order():
+    edits = [
+        {"op": "insert_after", "section": 0, "text": "a"},
+        {"op": "insert_after", "section": 0, "text": "b"},
+    ]
+    assert apply_edits(SECTIONS, edits, "linkedin") == ["a", "b", "one", "two", "three"]
+
+
+@pytest.mark.parametrize("second", [{"op": "replace", "section": 2, "text": "x"}, {"op": "delete", "section": 2}])
+def test_second_edit_of_a_section_is_rejected(second):
+    with pytest.raises(EditError):
+        apply_edits(SECTIONS, [{"op": "replace", "section": 2, "text": "TWO"}, second], "linkedin")
+
+
+def test_deleting_everything_is_rejected():
+    edits = [{"op": "delete", "section": i} for i in range(1, len(SECTIONS) + 1)]
+    with pytest.raises(EditError):
+        apply_edits(SECTIONS, edits, "linkedin")
+
+
+def test_deleting_everything_but_inserting_is_kept():
+    edits = [{"op": "delete", "section": i} for i in range(1, len(SECTIONS) + 1)]
+    edits.append({"op": "insert_after", "section": 2, "text": "new"})
+    assert apply_edits(SECTIONS, edits, "linkedin") == ["new"]
+
+
+@pytest.mark.parametrize(
+    "edit",
+    [
+        {"op": "replace", "section": 4, "text": "x"},
+        {"op": "insert_after", "section": -1, "text": "x"},
+        {"op": "replace", "section": True, "text": "x"},
+        {"op": "replace", "section": 1, "text": "  "},
+        {"op": "move", "section": 1},
+    ],
+)
+def test_invalid_edits_are_rejected(edit):
+    with pytest.raises(EditError):
+        apply_edits(SECTIONS, [edit], "linkedin")
+
+
+def test_twitter_edits_are_single_line():
+    out = apply_edits(["t1", "t2"], [{"op": "replace", "section": 2, "text": "new\nthread  line"}], "twitter")
+    assert out == ["t1", "new thread line"]
+
+
+def test_blog_split_keeps_text_before_first_heading():
+    draft = "Intro paragraph.\n\n# First\nBody one.\n\n## Second\nBody two."
+    assert split_sections(draft, "blog") == ["Intro paragraph.", "# First\nBody one.", "## Second\nBody two."]
+
+
+def test_blog_with_one_heading_splits_by_paragraph():
+    assert split_sections("# Title\n\nPara one.\n\nPara two.", "blog") == ["# Title", "Para one.", "Para two."]
+
+
+def test_twitter_split_by_line():
+    assert split_sections("tweet 1\n\ntweet 2\ntweet 3\n", "twitter") == ["tweet 1", "tweet 2", "tweet 3"]
@@ -0,0 +1,109 @@
+import json
+
+import pytest
+
+from memory import linkedin_loader
+from memory.linkedin_loader import (
+    LinkedInWatermark,
+    content_fingerprint,
+    iter_linkedin_posts,
+    load_watermark,
+    save_watermark,
+)
+
+
+@pytest.fixture
+def export(tmp_path, monkeypatch):
+    """Point the loader at a .jsonl export under tmp_path; returns its path."""
+    path = tmp_path / "posts.jsonl"
+    monkeypatch.setattr(linkedin_loader, "linkedin_posts_path", lambda: path)
+    monkeypatch.setattr(linkedin_loader, "_watermark_path", lambda: tmp_path / "watermark.json")
+    return path
+
+
+def _line(content: str, date: str = "", url: str = "") -> str:
+    return json.dumps({"content": content, "date": date, "url": url}) + "\n"
+
+
+def _contents(docs) -> list[str]:
+    return [d.page_content for d in docs]
+
+
+def _indexed(docs) -> dict[str, str]:
+    return {d.metadata["source"]: content_fingerprint(d.page_content) for d in docs}
+
+
+def test_jsonl_resumes_after_consumed_lines(export):
+    export.write_text(_line("first", "2024-01-02") + _line("second", "2024-01-01"))
+    wm = LinkedInWatermark()
+    assert _contents(iter_linkedin_posts(since=wm)) == ["first", "second"]
+    assert (wm.count, wm.offset, wm.last_date) == (2, export.stat().st_size, "2024-01-02")
+
+    with export.open("a") as f:
+        f.write(_line("undated"))
+    # Without `indexed`, only a resume can explain the earlier lines not coming back.
+    assert _contents(iter_linkedin_posts(since=wm)) == ["undated"]
+    assert wm.count == 3
+
+
+def test_jsonl_partial_trailing_line_waits_for_next_pass(export):
+    export.write_text(_line("first") + '{"content": "sec')
+    wm = LinkedInWatermark()
+    assert _contents(iter_linkedin_posts(since=wm)) == ["first"]
+    export.write_text(_line("first") + _line("second"))
+    assert _contents(iter_linkedin_posts(since=wm)) == ["second"]
+
+
+def test_jsonl_rewritten_in_place_is_rescanned(export):
+    export.write_text(_line("aaaa") + _line("bbbb"))
+    wm = LinkedInWatermark()
+    docs = list(iter_linkedin_posts(since=wm))
+    size = export.stat().st_size
+
+    # Same size, different first line: the offset is no longer trustworthy.
+    export.write_text(_line("cccc") + _line("bbbb"))
+    assert export.stat().st_size == size
+    assert _contents(iter_linkedin_posts(since=wm, indexed=_indexed(docs))) == ["cccc"]
+    assert wm.count == 2
+
+
+def test_jsonl_truncated_file_is_rescanned(export):
+    export.write_text(_line("one") + _line("two") + _line("three"))
+    wm = LinkedInWatermark()
+    list(iter_linkedin_posts(since=wm))
+    export.write_text(_line("new"))
+    assert _contents(iter_linkedin_posts(since=wm)) == ["new"]
+
+
+def test_json_array_picks_up_undated_and_edited_posts(tmp_path, monkeypatch):
+    path = tmp_path / "posts.json"
+    monkeypatch.setattr(linkedin_loader, "linkedin_posts_path", lambda: path)
+    path.write_text(json.dumps([{"content": "newest", "date": "2024-05-01"}, {"content": "older", "date": "2023-01-01"}]))
+    wm = LinkedInWatermark()
+    indexed = _indexed(iter_linkedin_posts(since=wm))
+
+    posts = [
+        {"content": "no date"},
+        {"content": "newest", "date": "2024-05-01"},
+        {"content": "backfilled", "date": "2020-01-01"},
+        {"content": "older, edited", "date": "2023-01-01"},
+    ]
+    path.write_text(json.dumps(posts))
+    assert _contents(iter_linkedin_posts(since=wm, indexed=indexed)) == ["no date", "backfilled", "older, edited"]
+    assert wm.count == 4
+
+
+def test_edited_post_keeps_its_id_when_it_has_a_url(export):
+    export.write_text(_line("draft text", url="https://example.com/p/1"))
+    (before,) = iter_linkedin_posts()
+    export.write_text(_line("final text", url="https://example.com/p/1"))
+    (after,) = iter_linkedin_posts(indexed=_indexed([before]))
+    assert after.metadata["source"] == before.metadata["source"]
+
+
+def test_watermark_round_trips(export):
+    export.write_text(_line("first", "2024-01-01"))
+    wm = LinkedInWatermark()
+    list(iter_linkedin_posts(since=wm))
+    save_watermark(wm)
+    assert load_watermark() == wm
@@ -1,3 +1,3 @@
-from .logging import get_logger
+from .logging import configure_logging, get_logger
 
-__all__ = ["get_logger"]
+__all__ = ["configure_logging", "get_logger"]
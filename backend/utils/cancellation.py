@@ -0,0 +1,59 @@
+"""Cooperative cancellation of pipeline runs: checked between stages and before each LLM call."""
+import contextvars
+import threading
+from contextlib import contextmanager
+from typing import Iterator
+
+
+class RunCancelled(Exception):
+    """Raised inside a run whose CancellationToken was cancelled."""
+
+
+class CancellationToken:
+    def __init__(self) -> None:
+        self._event = threading.Event()
+        self.reason = ""
+
+    @property
+    def cancelled(self) -> bool:
+        return self._event.is_set()
+
+    def cancel(self, reason: str = "cancelled") -> None:
+        if not self._event.is_set():
+            self.reason = reason
+            self._event.set()
+
+    def wait(self, timeout: float) -> bool:
+        """Sleep up to timeout seconds, returning early (True) if the token is cancelled meanwhile."""
+        return self._event.wait(timeout)
+
+    def raise_if_cancelled(self) -> None:
+        if self._event.is_set():
+            raise RunCancelled(self.reason)
+
+
+_current: contextvars.ContextVar[CancellationToken | None] = contextvars.ContextVar("cancellation", default=None)
+
+
+@contextmanager
+def cancellation_scope(token: CancellationToken | None) -> Iterator[None]:
+    """Make token the current one for this context (and ContextThreadPoolExecutor workers spawned from it)."""
+    if token is None:
+        yield
+        return
+    reset = _current.set(token)
+    try:
+        yield
+    finally:
+        _current.reset(reset)
+
+
+def current_token() -> CancellationToken | None:
+    return _current.get()
+
+
+def check_cancelled() -> None:
+    """Raise RunCancelled if the current run has been cancelled; no-op outside a cancellation scope."""
+    token = _current.get()
+    if token is not None:
+        token.raise_if_cancelled()
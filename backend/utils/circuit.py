@@ -0,0 +1,177 @@
+"""
+Circuit breaker around Gemini traffic, one per process and shared by every run.
+
+closed → open after CIRCUIT_FAILURE_THRESHOLD consecutive bad attempts (an error, or a response slower than
+CIRCUIT_SLOW_CALL_SECONDS). While open, invoke_llm fails immediately with CircuitOpen instead of queueing,
+waiting out timeouts and retrying. After CIRCUIT_OPEN_SECONDS a single probe request is let through
+(half-open): success closes the circuit, another bad attempt re-opens it.
+
+Agents turn LLM errors into hard-coded fallbacks, so a run cannot rely on exceptions reaching the pipeline.
+Runs therefore open a circuit_scope(); check_circuit() between stages raises CircuitOpen if the breaker is open
+or a call in this run was rejected, and the API serves the keyword's last stored result instead.
+"""
+import contextvars
+import threading
+import time
+from contextlib import contextmanager
+from typing import Iterator
+
+from config import settings
+from utils.logging import get_logger
+from utils.metrics import CIRCUIT_STATE, CIRCUIT_TRANSITIONS
+
+logger = get_logger(__name__)
+
+CLOSED = "closed"
+OPEN = "open"
+HALF_OPEN = "half_open"
+_STATE_VALUES = {CLOSED: 0, HALF_OPEN: 1, OPEN: 2}
+
+
+class CircuitOpen(Exception):
+    """LLM traffic is short-circuited; retry_after is the time (s) until the breaker will probe again."""
+
+    def __init__(self, retry_after: float):
+        super().__init__(f"LLM circuit open; retry in {retry_after:.0f}s")
+        self.retry_after = retry_after
+
+
+class CircuitBreaker:
+    def __init__(self, failure_threshold: int, slow_call_seconds: float, open_seconds: float, enabled: bool = True):
+        self.failure_threshold = max(1, failure_threshold)
+        self.slow_call_seconds = slow_call_seconds
+        self.open_seconds = open_seconds
+        self.enabled = enabled
+        self._state = CLOSED
+        self._bad = 0  # consecutive bad attempts while closed
+        self._opened_at = 0.0
+        self._probe_in_flight = False
+        self._lock = threading.Lock()
+
+    @property
+    def state(self) -> str:
+        return self._state
+
+    def _transition(self, state: str, reason: str) -> None:
+        if state == self._state:
+            return
+        self._state = state
+        if state == OPEN:
+            self._opened_at = time.monotonic()
+        CIRCUIT_STATE.set(_STATE_VALUES[state])
+        CIRCUIT_TRANSITIONS.labels(state=state).inc()
+        logger.warning("llm_circuit_transition", state=state, reason=reason)
+
+    def _retry_after_locked(self) -> float:
+        return max(0.0, self._opened_at + self.open_seconds - time.monotonic())
+
+    def _blocking_locked(self) -> bool:
+        """Open and not yet due for a probe, or half-open with the probe still out."""
+        if self._state == OPEN:
+            return self._retry_after_locked() > 0
+        return self._state == HALF_OPEN and self._probe_in_flight
+
+    def is_open(self) -> bool:
+        """True while requests would be rejected (does not claim the half-open probe)."""
+        if not self.enabled:
+            return False
+        with self._lock:
+            return self._blocking_locked()
+
+    def retry_after(self) -> float:
+        with self._lock:
+            return self._retry_after_locked() if self._state == OPEN else self.open_seconds
+
+    def raise_if_open(self) -> None:
+        if not self.enabled:
+            return
+        with self._lock:
+            if self._blocking_locked():
+                raise CircuitOpen(self._retry_after_locked() if self._state == OPEN else self.open_seconds)
+
+    def before_attempt(self) -> None:
+        """Admit one request attempt or raise CircuitOpen; once the open period has passed, admits one probe."""
+        if not self.enabled:
+            return
+        with self._lock:
+            if self._blocking_locked():
+                raise CircuitOpen(self._retry_after_locked() if self._state == OPEN else self.open_seconds)
+            if self._state == OPEN:
+                self._transition(HALF_OPEN, "open period elapsed")
+                self._probe_in_flight = True
+            elif self._state == HALF_OPEN:
+                self._probe_in_flight = True
+
+    def record_success(self, seconds: float) -> None:
+        if not self.enabled:
+            return
+        if self.slow_call_seconds > 0 and seconds > self.slow_call_seconds:
+            self.record_failure(f"slow call ({seconds:.1f}s)")
+            return
+        with self._lock:
+            self._bad = 0
+            self._probe_in_flight = False
+            self._transition(CLOSED, "call succeeded")
+
+    def record_failure(self, reason: str = "call failed") -> None:
+        if not self.enabled:
+            return
+        with self._lock:
+            self._probe_in_flight = False
+            if self._state == HALF_OPEN:
+                self._transition(OPEN, f"probe failed: {reason}")
+                return
+            self._bad += 1
+            if self._state == CLOSED and self._bad >= self.failure_threshold:
+                self._transition(OPEN, f"{self._bad} consecutive bad calls; last: {reason}")
+
+
+_breaker: CircuitBreaker | None = None
+_breaker_lock = threading.Lock()
+
+
+def get_circuit_breaker() -> CircuitBreaker:
+    global _breaker
+    with _breaker_lock:
+        if _breaker is None:
+            _breaker = CircuitBreaker(
+                failure_threshold=settings.circuit_failure_threshold,
+                slow_call_seconds=settings.circuit_slow_call_seconds,
+                open_seconds=settings.circuit_open_seconds,
+                enabled=settings.circuit_breaker_enabled,
+            )
+        return _breaker
+
+
+class _RunCircuit:
+    __slots__ = ("rejected",)
+
+    def __init__(self) -> None:
+        self.rejected: CircuitOpen | None = None
+
+
+_run: contextvars.ContextVar[_RunCircuit | None] = contextvars.ContextVar("run_circuit", default=None)
+
+
+@contextmanager
+def circuit_scope() -> Iterator[None]:
+    """Track, for this run (and its worker threads), whether any LLM call was rejected by the breaker."""
+    token = _run.set(_RunCircuit())
+    try:
+        yield
+    finally:
+        _run.reset(token)
+
+
+def note_rejected(e: CircuitOpen) -> None:
+    run = _run.get()
+    if run is not None and run.rejected is None:
+        run.rejected = e
+
+
+def check_circuit() -> None:
+    """Raise CircuitOpen if the breaker is open or a call in the current run was short-circuited."""
+    run = _run.get()
+    if run is not None and run.rejected is not None:
+        raise run.rejected
+    get_circuit_breaker().raise_if_open()
@@ -0,0 +1,20 @@
+"""Thread pools that carry contextvars (run_id/keyword log context, current trace span) into worker threads
+and count their workers as threads of a profiled run."""
+import contextvars
+from concurrent.futures import Future, ThreadPoolExecutor
+from typing import Any, Callable
+
+from utils.profiling import profiled_thread
+
+
+class ContextThreadPoolExecutor(ThreadPoolExecutor):
+    """ThreadPoolExecutor whose tasks run in a copy of the submitting thread's context."""
+
+    def submit(self, fn: Callable[..., Any], /, *args: Any, **kwargs: Any) -> Future:
+        ctx = contextvars.copy_context()
+        return super().submit(ctx.run, _run_task, fn, args, kwargs)
+
+
+def _run_task(fn: Callable[..., Any], args: tuple, kwargs: dict) -> Any:
+    with profiled_thread():
+        return fn(*args, **kwargs)
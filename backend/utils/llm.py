@@ -0,0 +1,239 @@
+"""Shared Gemini client factory and instrumented invoke: span, metrics, queue wait, retries and token usage per call."""
+import contextvars
+import threading
+import time
+from concurrent.futures import Future, wait
+from contextlib import contextmanager
+from typing import TYPE_CHECKING, Any, Iterator
+
+from config.settings import require_google_api_key, settings
+from utils.cancellation import RunCancelled, check_cancelled, current_token
+from utils.circuit import CircuitBreaker, CircuitOpen, get_circuit_breaker, note_rejected
+from utils.concurrency import ContextThreadPoolExecutor
+from utils.logging import get_logger
+from utils.metrics import LLM_CALLS, LLM_DURATION, LLM_QUEUE_WAIT, LLM_RETRIES, LLM_TOKENS
+from utils.routing import record_latency
+from utils.tokens import record_tokens
+from utils.tracing import span
+
+if TYPE_CHECKING:
+    from langchain_core.messages import BaseMessage
+    from langchain_google_genai import ChatGoogleGenerativeAI
+
+logger = get_logger(__name__)
+
+_MODELS: dict[tuple[str, float], "ChatGoogleGenerativeAI"] = {}
+_MODELS_LOCK = threading.Lock()
+_SLOTS = threading.BoundedSemaphore(max(1, settings.llm_max_concurrency))
+_SLOT_POLL_SECONDS = 0.25
+# Provider calls made inside a cancellation scope run here so the run can abandon them. A call holds its
+# concurrency slot until it finishes, even once abandoned, so the pool never has more work than slots.
+_CALLS = ContextThreadPoolExecutor(max_workers=max(1, settings.llm_max_concurrency), thread_name_prefix="llm-call")
+
+
+class LLMCallCounter:
+    """
+    LLM request attempts (including retries) made inside a count_llm_calls() block, and how many of them were
+    abandoned in flight because the run was cancelled; nested blocks roll up.
+    """
+
+    def __init__(self, parent: "LLMCallCounter | None" = None) -> None:
+        self.calls = 0
+        self.abandoned = 0
+        self._parent = parent
+        self._lock = threading.Lock()
+
+    def _add(self) -> None:
+        with self._lock:
+            self.calls += 1
+        if self._parent is not None:
+            self._parent._add()
+
+    def _abandon(self) -> None:
+        with self._lock:
+            self.abandoned += 1
+        if self._parent is not None:
+            self._parent._abandon()
+
+
+_counter: contextvars.ContextVar[LLMCallCounter | None] = contextvars.ContextVar("llm_call_counter", default=None)
+
+
+@contextmanager
+def count_llm_calls() -> Iterator[LLMCallCounter]:
+    counter = LLMCallCounter(parent=_counter.get())
+    token = _counter.set(counter)
+    try:
+        yield counter
+    finally:
+        _counter.reset(token)
+
+
+def get_chat_model(model: str, temperature: float) -> "ChatGoogleGenerativeAI":
+    """Return a cached client for (model, temperature). Retries are handled by invoke_llm so they can be counted."""
+    key = (model, temperature)
+    with _MODELS_LOCK:
+        llm = _MODELS.get(key)
+        if llm is None:
+            from langchain_google_genai import ChatGoogleGenerativeAI  # heavy; first LLM call only
+
+            llm = ChatGoogleGenerativeAI(
+                model=model,
+                temperature=temperature,
+                google_api_key=require_google_api_key(),
+                max_retries=1,  # single attempt per invoke; see invoke_llm
+            )
+            _MODELS[key] = llm
+    return llm
+
+
+def _usage(resp: Any) -> tuple[int, int]:
+    """(prompt_tokens, response_tokens) from a LangChain AIMessage, 0 if the provider did not report usage."""
+    meta = getattr(resp, "usage_metadata", None) or {}
+    return int(meta.get("input_tokens", 0) or 0), int(meta.get("output_tokens", 0) or 0)
+
+
+def _acquire_slot() -> None:
+    """Wait for a concurrency slot, giving up with RunCancelled if the current run is cancelled meanwhile."""
+    token = current_token()
+    if token is None:
+        _SLOTS.acquire()
+        return
+    while not _SLOTS.acquire(timeout=_SLOT_POLL_SECONDS):
+        token.raise_if_cancelled()
+    if token.cancelled:
+        _SLOTS.release()
+        token.raise_if_cancelled()
+
+
+def _backoff(seconds: float) -> None:
+    token = current_token()
+    if token is None:
+        time.sleep(seconds)
+    else:
+        token.wait(seconds)
+
+
+def _attempt(llm: "ChatGoogleGenerativeAI", messages: list["BaseMessage"], breaker: CircuitBreaker) -> "BaseMessage":
+    """One provider request; its outcome feeds the breaker even if the run has abandoned it meanwhile."""
+    t = time.perf_counter()
+    try:
+        resp = llm.invoke(messages)
+    except Exception as e:
+        breaker.record_failure(str(e)[:200])
+        raise
+    breaker.record_success(time.perf_counter() - t)
+    return resp
+
+
+def _finished_before_cancel(fut: Future) -> bool:
+    """Wait for fut; False as soon as the current run is cancelled while it is still running."""
+    token = current_token()
+    while not wait([fut], timeout=_SLOT_POLL_SECONDS).done:
+        if token.cancelled:
+            return False
+    return True
+
+
+def _reject(e: CircuitOpen, model: str, stage: str, s) -> None:
+    LLM_CALLS.labels(model=model, stage=stage, outcome="rejected").inc()
+    s.set_attribute("llm.circuit_open", True)
+    note_rejected(e)
+
+
+def invoke_llm(llm: "ChatGoogleGenerativeAI", messages: list["BaseMessage"], *, stage: str) -> "BaseMessage":
+    """
+    Invoke the model under a concurrency slot, retrying transient failures with backoff.
+    Records an llm.call span and Prometheus metrics (latency, queue wait, retries, tokens), and adds the
+    token usage to the current run's accounting (utils.tokens).
+    Once the current run is cancelled, raises RunCancelled instead of queueing, while waiting for a slot,
+    before the next attempt, or while a request is in flight. Inside a cancellation scope the request runs on a
+    worker; an abandoned one finishes there in the background, keeping its slot until it does, and its
+    result is dropped.
+    While the circuit breaker (utils.circuit) is open, raises CircuitOpen at once, and before any retry.
+    """
+    model = str(getattr(llm, "model", "unknown")).removeprefix("models/")
+    breaker = get_circuit_breaker()
+    with span("llm.call", **{"llm.model": model, "llm.stage": stage}) as s:
+        try:
+            breaker.raise_if_open()
+        except CircuitOpen as e:
+            _reject(e, model, stage, s)
+            raise
+        t_wait = time.perf_counter()
+        try:
+            _acquire_slot()
+        except RunCancelled:
+            LLM_CALLS.labels(model=model, stage=stage, outcome="cancelled").inc()
+            s.set_attribute("llm.cancelled", True)
+            raise
+        slot_held = True
+        try:
+            queue_wait = time.perf_counter() - t_wait
+            LLM_QUEUE_WAIT.labels(model=model).observe(queue_wait)
+            s.set_attribute("llm.queue_wait_seconds", round(queue_wait, 4))
+
+            t = time.perf_counter()
+            retries = 0
+            while True:
+                try:
+                    check_cancelled()
+                except RunCancelled:
+                    LLM_CALLS.labels(model=model, stage=stage, outcome="cancelled").inc()
+                    raise
+                try:
+                    breaker.before_attempt()
+                except CircuitOpen as e:
+                    _reject(e, model, stage, s)
+                    raise
+                counter = _counter.get()
+                if counter is not None:
+                    counter._add()
+                try:
+                    if current_token() is None:
+                        resp = _attempt(llm, messages, breaker)
+                        break
+                    fut = _CALLS.submit(_attempt, llm, messages, breaker)
+                    if not _finished_before_cancel(fut):
+                        fut.add_done_callback(lambda _: _SLOTS.release())
+                        slot_held = False
+                        LLM_CALLS.labels(model=model, stage=stage, outcome="cancelled").inc()
+                        s.set_attribute("llm.abandoned", True)
+                        if counter is not None:
+                            counter._abandon()
+                        check_cancelled()
+                    resp = fut.result()
+                    break
+                except RunCancelled:
+                    raise
+                except Exception as e:
+                    if retries >= settings.llm_max_retries:
+                        LLM_CALLS.labels(model=model, stage=stage, outcome="error").inc()
+                        LLM_DURATION.labels(model=model, stage=stage).observe(time.perf_counter() - t)
+                        s.set_attribute("llm.retries", retries)
+                        raise
+                    retries += 1
+                    LLM_RETRIES.labels(model=model, stage=stage).inc()
+                    logger.warning("llm_retry", model=model, stage=stage, attempt=retries, error=str(e))
+                    _backoff(min(8.0, 0.5 * 2 ** (retries - 1)))
+            elapsed = time.perf_counter() - t
+        finally:
+            if slot_held:
+                _SLOTS.release()
+
+        prompt_tokens, response_tokens = _usage(resp)
+        LLM_CALLS.labels(model=model, stage=stage, outcome="ok").inc()
+        LLM_DURATION.labels(model=model, stage=stage).observe(elapsed)
+        record_latency(model, stage, elapsed)
+        LLM_TOKENS.labels(model=model, stage=stage, direction="prompt").inc(prompt_tokens)
+        LLM_TOKENS.labels(model=model, stage=stage, direction="response").inc(response_tokens)
+        record_tokens(prompt_tokens, response_tokens)
+        s.set_attributes(
+            **{
+                "llm.retries": retries,
+                "llm.prompt_tokens": prompt_tokens,
+                "llm.response_tokens": response_tokens,
+                "llm.latency_seconds": round(elapsed, 4),
+            }
+        )
+        return resp
@@ -1,22 +1,106 @@
+"""Structured logging, configured once per process.
+
+Log calls only build the event dict; rendering and stdout I/O happen on a background QueueListener thread.
+Per-run context (run_id, keyword) is carried in structlog contextvars and merged into every event.
+"""
+import atexit
 import logging
+import random
 import sys
+import threading
+from logging.handlers import QueueHandler, QueueListener
+from queue import SimpleQueue
 
 import structlog
 
+from config import settings
+
+_configure_lock = threading.Lock()
+_configured = False
+_listener: QueueListener | None = None
+
+
+class _DeferredQueueHandler(QueueHandler):
+    """Enqueue the raw record; ProcessorFormatter renders it on the listener thread instead of the caller's."""
+
+    def prepare(self, record: logging.LogRecord) -> logging.LogRecord:
+        return record
+
+
+def _sample_high_volume(_, __, event_dict: dict) -> dict:
+    """Drop a configurable fraction of named high-volume events (settings.log_sample_rates: event -> keep ratio)."""
+    rate = settings.log_sample_rates.get(event_dict.get("event", ""))
+    if rate is not None and rate < 1.0 and random.random() >= rate:
+        raise structlog.DropEvent
+    return event_dict
+
+
+def _capture_exc_info(_, __, event_dict: dict) -> dict:
+    """Resolve exc_info=True to the live exception now; the listener thread has no exception context."""
+    if event_dict.get("exc_info") is True:
+        event_dict["exc_info"] = sys.exc_info()
+    return event_dict
+
+
+def configure_logging() -> None:
+    """Configure structlog and the stdlib root logger. Idempotent; call once at startup."""
+    global _configured, _listener
+    with _configure_lock:
+        if _configured:
+            return
+
+        if sys.stderr.isatty():
+            render = [structlog.dev.ConsoleRenderer()]
+        else:
+            render = [structlog.processors.format_exc_info, structlog.processors.JSONRenderer()]
+        handler = logging.StreamHandler(sys.stdout)
+        handler.setFormatter(
+            structlog.stdlib.ProcessorFormatter(
+                processors=[structlog.stdlib.ProcessorFormatter.remove_processors_meta, *render],
+                foreign_pre_chain=[structlog.processors.add_log_level, structlog.processors.TimeStamper(fmt="iso")],
+            )
+        )
+
+        root = logging.getLogger()
+        root.handlers.clear()
+        root.setLevel(settings.log_level.upper())
+        if settings.log_async:
+            q: SimpleQueue = SimpleQueue()
+            root.addHandler(_DeferredQueueHandler(q))
+            _listener = QueueListener(q, handler)
+            _listener.start()
+            atexit.register(shutdown_logging)
+        else:
+            root.addHandler(handler)
+
+        structlog.configure(
+            processors=[
+                structlog.stdlib.filter_by_level,
+                structlog.contextvars.merge_contextvars,
+                _sample_high_volume,
+                structlog.processors.add_log_level,
+                structlog.processors.StackInfoRenderer(),
+                structlog.dev.set_exc_info,
+                _capture_exc_info,
+                structlog.processors.TimeStamper(fmt="iso"),
+                structlog.stdlib.ProcessorFormatter.wrap_for_formatter,
+            ],
+            wrapper_class=structlog.stdlib.BoundLogger,
+            context_class=dict,
+            logger_factory=structlog.stdlib.LoggerFactory(),
+            cache_logger_on_first_use=True,
+        )
+        _configured = True
+
+
+def shutdown_logging() -> None:
+    """Drain the log queue and stop the listener thread."""
+    global _listener
+    if _listener is not None:
+        _listener.stop()
+        _listener = None
+
 
 def get_logger(name: str) -> structlog.stdlib.BoundLogger:
-    structlog.configure(
-        processors=[
-            structlog.contextvars.merge_contextvars,
-            structlog.processors.add_log_level,
-            structlog.processors.StackInfoRenderer(),
-            structlog.dev.set_exc_info,
-            structlog.processors.TimeStamper(fmt="iso"),
-            structlog.dev.ConsoleRenderer() if sys.stderr.isatty() else structlog.processors.JSONRenderer(),
-        ],
-        wrapper_class=structlog.stdlib.BoundLogger,
-        context_class=dict,
-        logger_factory=structlog.PrintLoggerFactory(),
-        cache_logger_on_first_use=True,
-    )
+    configure_logging()
     return structlog.get_logger(name)
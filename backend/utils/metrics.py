@@ -0,0 +1,164 @@
+"""Prometheus metrics aggregated across runs; exposed at /metrics."""
+from prometheus_client import CONTENT_TYPE_LATEST, Counter, Gauge, Histogram, generate_latest
+
+# Pipeline runs take minutes; individual stages and LLM calls take seconds.
+_STAGE_BUCKETS = (0.05, 0.1, 0.25, 0.5, 1, 2.5, 5, 10, 20, 30, 60, 120, 300)
+_FAST_BUCKETS = (0.005, 0.01, 0.025, 0.05, 0.1, 0.25, 0.5, 1, 2.5, 5, 10, 15)
+
+PIPELINE_RUNS = Counter(
+    "growth_pipeline_runs_total",
+    "Pipeline runs by outcome.",
+    ["outcome"],  # completed | aborted | error | cancelled | circuit_open | rerun
+)
+PIPELINE_DURATION = Histogram(
+    "growth_pipeline_duration_seconds",
+    "End-to-end pipeline wall time.",
+    buckets=_STAGE_BUCKETS,
+)
+LLM_CALLS_SAVED = Counter(
+    "growth_cancelled_run_llm_calls_saved_total",
+    "Planned LLM calls not made, or abandoned in flight, because their run was cancelled.",
+)
+ADMISSION_DECISIONS = Counter(
+    "growth_admission_decisions_total",
+    "Run admission decisions by lane.",
+    ["lane", "outcome"],  # admitted | queued | rejected | deferred (batch)
+)
+ADMISSION_QUEUE_WAIT = Histogram(
+    "growth_admission_queue_wait_seconds",
+    "Time a run request waited for admission.",
+    ["lane"],
+    buckets=_STAGE_BUCKETS,
+)
+RUNS_IN_FLIGHT = Gauge(
+    "growth_runs_in_flight",
+    "Pipeline runs currently executing, by lane.",
+    ["lane"],
+)
+STAGE_DURATION = Histogram(
+    "growth_stage_duration_seconds",
+    "Wall time per pipeline stage.",
+    ["stage"],
+    buckets=_STAGE_BUCKETS,
+)
+LLM_CALLS = Counter(
+    "growth_llm_calls_total",
+    "LLM calls by model, stage and outcome.",
+    # ok | error | cancelled (run cancelled before the request was sent) | rejected (circuit open)
+    ["model", "stage", "outcome"],
+)
+CIRCUIT_STATE = Gauge(
+    "growth_llm_circuit_state",
+    "LLM circuit breaker state: 0 closed, 1 half-open, 2 open.",
+)
+CIRCUIT_TRANSITIONS = Counter(
+    "growth_llm_circuit_transitions_total",
+    "LLM circuit breaker transitions by new state.",
+    ["state"],  # closed | open | half_open
+)
+LLM_DURATION = Histogram(
+    "growth_llm_call_duration_seconds",
+    "LLM call latency (excluding queue wait), including retries.",
+    ["model", "stage"],
+    buckets=_STAGE_BUCKETS,
+)
+LLM_QUEUE_WAIT = Histogram(
+    "growth_llm_queue_wait_seconds",
+    "Time an LLM call waited for a concurrency slot.",
+    ["model"],
+    buckets=_FAST_BUCKETS,
+)
+LLM_RETRIES = Counter(
+    "growth_llm_retries_total",
+    "LLM call retries after a failed attempt.",
+    ["model", "stage"],
+)
+LLM_TOKENS = Counter(
+    "growth_llm_tokens_total",
+    "LLM tokens by model, stage and direction.",
+    ["model", "stage", "direction"],  # prompt | response
+)
+RETRIEVER_DURATION = Histogram(
+    "growth_retriever_query_duration_seconds",
+    "Grounding retrieval latency, retrieval cache lookups included.",
+    buckets=_FAST_BUCKETS,
+)
+WEB_FETCH_DURATION = Histogram(
+    "growth_web_fetch_duration_seconds",
+    "Outbound web fetch latency by outcome.",
+    ["outcome"],  # ok | error
+    buckets=_FAST_BUCKETS,
+)
+SIGNAL_SOURCE_DURATION = Histogram(
+    "growth_signal_source_duration_seconds",
+    "Live signal search latency per source adapter.",
+    ["source", "outcome"],  # ok | error | deadline
+    buckets=_FAST_BUCKETS,
+)
+CRITIQUE_RULE_VIOLATIONS = Counter(
+    "growth_critique_rule_violations_total",
+    "Pre-critic rule violations by platform, rule and severity.",
+    ["platform", "rule", "severity"],  # hard | soft
+)
+PIPELINE_DEGRADATIONS = Counter(
+    "growth_pipeline_degradations_total",
+    "Optional pipeline work dropped to stay within a run's token budget.",
+    ["action"],  # best_of_n_reduced | second_round_skipped
+)
+REVISIONS = Counter(
+    "growth_revisions_total",
+    "Round-2 revisions by platform and method.",
+    ["platform", "method"],  # edit | fallback (edits unusable, regenerated)
+)
+PREWARM_RUNS = Counter(
+    "growth_prewarm_runs_total",
+    "Background prewarm runs by outcome.",
+    ["outcome"],  # completed | aborted | cancelled | circuit_open | error
+)
+PREWARM_LLM_CALLS = Counter(
+    "growth_prewarm_llm_calls_total",
+    "LLM calls spent by background prewarm runs (including cancelled ones).",
+)
+CORPUS_DUPLICATES_COLLAPSED = Counter(
+    "growth_corpus_duplicates_collapsed_total",
+    "Near-duplicate documents dropped before embedding.",
+)
+CORPUS_REFRESHES = Counter(
+    "growth_corpus_refreshes_total",
+    "Live index refreshes after corpus file changes, by outcome.",
+    ["outcome"],  # updated | unchanged | error
+)
+CORPUS_DOCS_EMBEDDED = Counter(
+    "growth_corpus_docs_embedded_total",
+    "Documents (re-)embedded by live index refreshes.",
+)
+RETRIEVAL_CACHE_LOOKUPS = Counter(
+    "growth_retrieval_cache_lookups_total",
+    "Grounding retrievals by cache outcome.",
+    ["outcome"],  # exact | similar (hits) | miss | off
+)
+TENANT_INDEX_BYTES = Gauge(
+    "growth_tenant_index_bytes",
+    "Estimated size of the tenant vector indexes loaded in this process.",
+)
+TENANT_INDEX_EVICTIONS = Counter(
+    "growth_tenant_index_evictions_total",
+    "Tenant indexes unloaded to stay within TENANT_INDEX_MEMORY_MB.",
+)
+RESPONSE_BYTES = Histogram(
+    "growth_response_bytes",
+    "Serialized JSON response size before compression.",
+    ["endpoint"],
+    buckets=(1_000, 5_000, 10_000, 25_000, 50_000, 100_000, 250_000, 500_000, 1_000_000),
+)
+RESPONSE_SERIALIZE_SECONDS = Histogram(
+    "growth_response_serialize_seconds",
+    "Time spent encoding the JSON response body.",
+    ["endpoint"],
+    buckets=(0.0001, 0.00025, 0.0005, 0.001, 0.0025, 0.005, 0.01, 0.025, 0.05, 0.1),
+)
+
+
+def render_metrics() -> tuple[bytes, str]:
+    """Prometheus text exposition and its content type."""
+    return generate_latest(), CONTENT_TYPE_LATEST
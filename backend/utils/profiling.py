@@ -0,0 +1,154 @@
+"""Opt-in per-run profiling: wall-clock stack sampling (folded stacks for flamegraph.pl / speedscope) + tracemalloc snapshot."""
+import contextvars
+import sys
+import threading
+import time
+import tracemalloc
+from collections import Counter
+from contextlib import contextmanager
+from pathlib import Path
+from typing import Iterator
+
+from config import settings
+from utils.logging import get_logger
+from utils.schemas import ProfileArtifacts
+
+logger = get_logger(__name__)
+
+_SAMPLER_THREAD_NAME = "profile-sampler"
+_MAX_STACK_DEPTH = 128
+_TOP_ALLOCATIONS = 25
+
+# tracemalloc is process-global, so only one profiled run at a time.
+_ACTIVE = threading.Lock()
+
+# Idents of the threads working for the profiled run: the one that entered profile_run plus
+# ContextThreadPoolExecutor workers while they run its tasks. Other runs' threads are not sampled.
+_run_threads: contextvars.ContextVar[set[int] | None] = contextvars.ContextVar("profile_run_threads", default=None)
+
+
+@contextmanager
+def profiled_thread() -> Iterator[None]:
+    """Count the current thread as part of the profiled run (if any) for the duration of the block."""
+    threads = _run_threads.get()
+    if threads is None:
+        yield
+        return
+    ident = threading.get_ident()
+    threads.add(ident)
+    try:
+        yield
+    finally:
+        threads.discard(ident)
+
+
+def _frame_label(frame) -> str:
+    code = frame.f_code
+    return f"{code.co_name} ({Path(code.co_filename).name}:{code.co_firstlineno})"
+
+
+class _StackSampler(threading.Thread):
+    """Periodically snapshot the Python stacks of the run's threads and count identical stacks."""
+
+    def __init__(self, interval_seconds: float, threads: set[int]):
+        super().__init__(name=_SAMPLER_THREAD_NAME, daemon=True)
+        self.interval = interval_seconds
+        self.threads = threads
+        self.stacks: Counter[str] = Counter()
+        self.samples = 0
+        self._halt = threading.Event()
+
+    def run(self) -> None:
+        while not self._halt.wait(self.interval):
+            names = {t.ident: t.name for t in threading.enumerate()}
+            frames = sys._current_frames()
+            for ident in self.threads.copy():  # workers join and leave concurrently
+                frame = frames.get(ident)
+                if frame is None:
+                    continue
+                labels = []
+                while frame is not None and len(labels) < _MAX_STACK_DEPTH:
+                    labels.append(_frame_label(frame))
+                    frame = frame.f_back
+                labels.append(names.get(ident, f"thread-{ident}"))
+                self.stacks[";".join(reversed(labels))] += 1
+            self.samples += 1
+
+    def stop(self) -> None:
+        self._halt.set()
+        self.join()
+
+
+@contextmanager
+def profile_run(label: str) -> Iterator[ProfileArtifacts | None]:
+    """
+    Sample stacks and trace allocations for the duration of the block, then write
+    <profile_dir>/<label>.folded and <label>.alloc.txt. The yielded artifacts object is filled on exit;
+    None is yielded (and nothing recorded) if another profiled run is already active.
+
+    Only the run's own threads are sampled (see profiled_thread). tracemalloc is process-wide, so
+    allocations made by runs overlapping this one still show up in <label>.alloc.txt.
+    """
+    if not _ACTIVE.acquire(blocking=False):
+        logger.warning("profile_skipped_busy", label=label)
+        yield None
+        return
+
+    artifacts = ProfileArtifacts()
+    started_tracemalloc = not tracemalloc.is_tracing()
+    if started_tracemalloc:
+        tracemalloc.start(settings.profile_tracemalloc_frames)
+    threads = {threading.get_ident()}
+    sampler = _StackSampler(settings.profile_sample_interval_ms / 1000.0, threads)
+    reset = _run_threads.set(threads)
+    t0 = time.perf_counter()
+    sampler.start()
+    try:
+        yield artifacts
+    finally:
+        sampler.stop()
+        _run_threads.reset(reset)
+        snapshot = tracemalloc.take_snapshot()
+        _, peak = tracemalloc.get_traced_memory()
+        if started_tracemalloc:
+            tracemalloc.stop()
+        _ACTIVE.release()
+        try:
+            _write_artifacts(label, sampler, snapshot, peak, time.perf_counter() - t0, artifacts)
+        except Exception as e:
+            logger.warning("profile_write_failed", label=label, error=str(e))
+
+
+def _write_artifacts(
+    label: str,
+    sampler: _StackSampler,
+    snapshot: tracemalloc.Snapshot,
+    peak_bytes: int,
+    duration: float,
+    artifacts: ProfileArtifacts,
+) -> None:
+    out_dir = Path(settings.profile_dir)
+    out_dir.mkdir(parents=True, exist_ok=True)
+    folded = out_dir / f"{label}.folded"
+    allocations = out_dir / f"{label}.alloc.txt"
+
+    folded.write_text(
+        "".join(f"{stack} {count}\n" for stack, count in sampler.stacks.most_common()),
+        encoding="utf-8",
+    )
+    snapshot = snapshot.filter_traces(
+        [tracemalloc.Filter(False, tracemalloc.__file__), tracemalloc.Filter(False, __file__)]
+    )
+    top = [str(stat) for stat in snapshot.statistics("lineno")[:_TOP_ALLOCATIONS]]
+    allocations.write_text(
+        f"peak_traced_bytes {peak_bytes}\n\n" + "\n".join(top) + "\n",
+        encoding="utf-8",
+    )
+
+    artifacts.flamegraph_path = str(folded)
+    artifacts.allocations_path = str(allocations)
+    artifacts.samples = sampler.samples
+    artifacts.duration_seconds = round(duration, 2)
+    artifacts.peak_traced_memory_bytes = peak_bytes
+    artifacts.top_allocations = top[:10]
+    logger.info("profile_written", label=label, samples=sampler.samples, flamegraph=str(folded))
@@ -0,0 +1,120 @@
+"""
+Latency-budget-aware model routing for strategy-tier (Pro) LLM calls.
+
+Agents ask route_model(stage, preferred) for the model to use. Without an active run budget the preferred
+model is returned unchanged. Within a run started under latency_budget(), a Pro call is downgraded to the
+content model (Flash) when its expected latency (EWMA of observed calls, or a configured prior) does not fit
+its share of the remaining budget: remaining time / remaining planned calls, stretched by (1 + importance)
+for important stages. Every decision is collected on the run's RoutingBudget.
+"""
+import contextvars
+import threading
+import time
+from contextlib import contextmanager
+from typing import Iterator
+
+from config.settings import settings
+from utils.schemas import RoutingDecision
+
+_EWMA_ALPHA = 0.3
+
+_latency: dict[tuple[str, str], float] = {}
+_latency_lock = threading.Lock()
+
+
+class RoutingBudget:
+    """Deadline, planned call count and decisions of one run; shared by the run's worker threads."""
+
+    def __init__(self, budget_seconds: float, planned_calls: int):
+        self.budget_seconds = budget_seconds
+        self.deadline = time.monotonic() + budget_seconds
+        self.planned_calls = planned_calls
+        self.calls_done = 0
+        self.decisions: list[RoutingDecision] = []
+        self._lock = threading.Lock()
+
+    def remaining_seconds(self) -> float:
+        return self.deadline - time.monotonic()
+
+    def _call_finished(self) -> None:
+        with self._lock:
+            self.calls_done += 1
+
+    def _record(self, decision: RoutingDecision) -> None:
+        with self._lock:
+            self.decisions.append(decision)
+
+
+_budget: contextvars.ContextVar[RoutingBudget | None] = contextvars.ContextVar("routing_budget", default=None)
+
+
+@contextmanager
+def latency_budget(budget_seconds: float | None, planned_calls: int) -> Iterator[RoutingBudget | None]:
+    """Route this run's LLM calls against budget_seconds; None or <= 0 disables routing (static models)."""
+    if not budget_seconds or budget_seconds <= 0:
+        yield None
+        return
+    budget = RoutingBudget(budget_seconds, planned_calls)
+    token = _budget.set(budget)
+    try:
+        yield budget
+    finally:
+        _budget.reset(token)
+
+
+def record_latency(model: str, stage: str, seconds: float) -> None:
+    """Fold one completed call into the (model, stage) EWMA and count it against the active run budget."""
+    key = (model, stage)
+    with _latency_lock:
+        prev = _latency.get(key)
+        _latency[key] = seconds if prev is None else _EWMA_ALPHA * seconds + (1 - _EWMA_ALPHA) * prev
+    budget = _budget.get()
+    if budget is not None:
+        budget._call_finished()
+
+
+def expected_latency(model: str, stage: str) -> float:
+    with _latency_lock:
+        observed = _latency.get((model, stage))
+    if observed is not None:
+        return observed
+    return settings.routing_latency_priors.get(model, 10.0)
+
+
+def route_model(stage: str, preferred: str, *, importance_key: str | None = None) -> str:
+    """
+    Model for one call of `stage` (the invoke_llm stage label). importance_key selects a more specific
+    entry in ROUTING_STAGE_IMPORTANCE (e.g. critique_2 for the final critique), falling back to stage.
+    """
+    budget = _budget.get()
+    fallback = settings.llm_content
+    if budget is None or preferred == fallback:
+        return preferred
+
+    key = importance_key or stage
+    importances = settings.routing_stage_importance
+    importance = importances.get(key, importances.get(stage, 0.5))
+    remaining = budget.remaining_seconds()
+    remaining_calls = max(1, budget.planned_calls - budget.calls_done)
+    share = max(0.0, remaining) / remaining_calls * (1 + importance)
+    estimate = expected_latency(preferred, stage)
+
+    if estimate <= share:
+        model, reason = preferred, "fits_budget"
+    elif importance >= 1.0 and estimate <= remaining:
+        model, reason = preferred, "critical_stage"
+    else:
+        model, reason = fallback, "over_budget" if remaining > 0 else "budget_exhausted"
+    budget._record(
+        RoutingDecision(
+            stage=key,
+            preferred_model=preferred,
+            model=model,
+            reason=reason,
+            importance=importance,
+            estimated_seconds=round(estimate, 2),
+            share_seconds=round(share, 2),
+            remaining_budget_seconds=round(remaining, 2),
+        )
+    )
+    return model
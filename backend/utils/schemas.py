@@ -73,6 +73,8 @@ class CritiqueResult(BaseModel):
     scores: CritiqueScores
     feedback: str
     draft_number: int
+    source: str = "llm"  # llm | rules (failed hard constraints; no LLM critique was made)
+    rule_violations: list[str] = Field(default_factory=list)
 
 
 class ContentWithCritiqueTrace(BaseModel):
@@ -80,6 +82,7 @@ class ContentWithCritiqueTrace(BaseModel):
     drafts: list[str] = Field(default_factory=list)
     critiques: list[CritiqueResult] = Field(default_factory=list)
     score_evolution: list[CritiqueScores] = Field(default_factory=list)
+    candidate_scores: list[list[float]] = Field(default_factory=list)  # per round, avg score of each best-of-N candidate
 
 
 # --- Final content assets ---
@@ -89,9 +92,60 @@ class ContentAssets(BaseModel):
     twitter_thread: ContentWithCritiqueTrace  # stored as single string, newline-sep tweets
 
 
+# --- Profiling (opt-in per run) ---
+class ProfileArtifacts(BaseModel):
+    flamegraph_path: str | None = None  # folded stacks: flamegraph.pl / speedscope / inferno
+    allocations_path: str | None = None  # tracemalloc top allocations by line
+    samples: int = 0
+    duration_seconds: float = 0.0
+    peak_traced_memory_bytes: int = 0
+    top_allocations: list[str] = Field(default_factory=list)
+
+
 # --- Full pipeline state (for orchestration and API response) ---
+class RoutingDecision(BaseModel):
+    """Model chosen for one strategy-tier LLM call under a latency budget."""
+
+    stage: str
+    preferred_model: str
+    model: str
+    reason: str  # fits_budget | critical_stage | over_budget | budget_exhausted
+    importance: float
+    estimated_seconds: float  # expected latency of preferred_model for this stage
+    share_seconds: float  # time this call may take: remaining budget / remaining calls * (1 + importance)
+    remaining_budget_seconds: float
+
+
+class TokenUsage(BaseModel):
+    """LLM tokens and request attempts attributed to one pipeline stage (or a whole run)."""
+
+    prompt_tokens: int = 0
+    response_tokens: int = 0
+    calls: int = 0
+
+    @property
+    def total_tokens(self) -> int:
+        return self.prompt_tokens + self.response_tokens
+
+
+class Degradation(BaseModel):
+    """Optional work dropped because the run's token budget would not cover it."""
+
+    stage: str  # blog | linkedin | twitter
+    action: str  # best_of_n_reduced | second_round_skipped
+    reason: str
+    tokens_used: int  # run total when the decision was made
+    token_budget: int
+
+
 class PipelineState(BaseModel):
     keyword: str
+    tenant: str | None = None  # brand corpus the run was grounded in; None = DEFAULT_TENANT
+    run_id: str = ""
+    parent_run_id: str | None = None  # set when this state was produced by re-running part of another run
+    stale: bool = False  # an earlier stored run served in place of a new one (LLM circuit open)
+    stale_reason: str | None = None
+    created_at: float = 0.0  # unix time the run started
     signal_result: SignalResult | None = None
     gap_analysis: GapAnalysis | None = None
     strategy_brief: StrategyBrief | None = None
@@ -101,5 +155,13 @@ class PipelineState(BaseModel):
     aborted: bool = False
     abort_reason: str | None = None
     stage_timings_seconds: dict[str, float] = Field(default_factory=dict)
+    retrieval_cache: str | None = None  # positioning retrieval: exact | similar (cache hits) | miss | off
+    profile: ProfileArtifacts | None = None  # set only when the run was profiled
+    latency_budget_seconds: float | None = None
+    routing_decisions: list[RoutingDecision] = Field(default_factory=list)
+    token_usage: TokenUsage = Field(default_factory=TokenUsage)  # whole run
+    token_usage_by_stage: dict[str, TokenUsage] = Field(default_factory=dict)
+    token_budget: int | None = None
+    degradations: list[Degradation] = Field(default_factory=list)
 
     model_config = {"arbitrary_types_allowed": True}
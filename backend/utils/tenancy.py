@@ -0,0 +1,29 @@
+"""
+The tenant (brand corpus) the current run retrieves from.
+
+run_pipeline opens a tenant_scope(); corpus paths, fetch URLs and the vector index resolve through
+current_tenant(), and ContextThreadPoolExecutor carries the scope into worker threads. Outside a scope
+(warm-up, CLI tools) everything resolves to DEFAULT_TENANT.
+"""
+import contextvars
+from contextlib import contextmanager
+from typing import Iterator
+
+from config.tenants import TenantConfig, get_tenant
+
+_tenant: contextvars.ContextVar[str | None] = contextvars.ContextVar("tenant", default=None)
+
+
+@contextmanager
+def tenant_scope(name: str | None) -> Iterator[TenantConfig]:
+    """Resolve name (None = DEFAULT_TENANT; raises UnknownTenant) and make it current for this context."""
+    tenant = get_tenant(name)
+    token = _tenant.set(tenant.name)
+    try:
+        yield tenant
+    finally:
+        _tenant.reset(token)
+
+
+def current_tenant() -> TenantConfig:
+    return get_tenant(_tenant.get())
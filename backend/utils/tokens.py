@@ -0,0 +1,102 @@
+"""
+Per-run token accounting and the token budget that drives graceful degradation.
+
+invoke_llm reports every response's usage to record_tokens(). Inside a run started under token_accounting(),
+usage is attributed to the pipeline stage set by stage_scope() (contextvars, so best-of-N and section worker
+threads count toward their stage) and summed for the run. With a budget, the critique loops ask the RunTokens
+whether optional work still fits and record a Degradation for what they drop.
+"""
+import contextvars
+import threading
+from contextlib import contextmanager
+from typing import Iterator
+
+from utils.logging import get_logger
+from utils.metrics import PIPELINE_DEGRADATIONS
+from utils.schemas import Degradation, TokenUsage
+
+logger = get_logger(__name__)
+
+_OTHER_STAGE = "other"
+
+
+class RunTokens:
+    """Token usage of one run by stage, its budget and the degradations applied; shared by its worker threads."""
+
+    def __init__(self, budget: int | None):
+        self.budget = budget
+        self.by_stage: dict[str, TokenUsage] = {}
+        self.degradations: list[Degradation] = []
+        self._lock = threading.Lock()
+
+    def _add(self, stage: str, prompt_tokens: int, response_tokens: int) -> None:
+        with self._lock:
+            usage = self.by_stage.setdefault(stage, TokenUsage())
+            usage.prompt_tokens += prompt_tokens
+            usage.response_tokens += response_tokens
+            usage.calls += 1
+
+    def total(self) -> TokenUsage:
+        with self._lock:
+            return TokenUsage(
+                prompt_tokens=sum(u.prompt_tokens for u in self.by_stage.values()),
+                response_tokens=sum(u.response_tokens for u in self.by_stage.values()),
+                calls=sum(u.calls for u in self.by_stage.values()),
+            )
+
+    def used(self) -> int:
+        return self.total().total_tokens
+
+    def remaining(self) -> int | None:
+        """Tokens left in the budget (may be negative); None without a budget."""
+        if self.budget is None:
+            return None
+        return self.budget - self.used()
+
+    def fits(self, tokens: int) -> bool:
+        remaining = self.remaining()
+        return remaining is None or tokens <= remaining
+
+    def degrade(self, stage: str, action: str, reason: str) -> None:
+        degradation = Degradation(
+            stage=stage, action=action, reason=reason, tokens_used=self.used(), token_budget=self.budget or 0
+        )
+        with self._lock:
+            self.degradations.append(degradation)
+        PIPELINE_DEGRADATIONS.labels(action=action).inc()
+        logger.info("token_budget_degradation", **degradation.model_dump())
+
+
+_run: contextvars.ContextVar[RunTokens | None] = contextvars.ContextVar("run_tokens", default=None)
+_stage: contextvars.ContextVar[str] = contextvars.ContextVar("token_stage", default=_OTHER_STAGE)
+
+
+@contextmanager
+def token_accounting(budget: int | None) -> Iterator[RunTokens]:
+    """Account this run's LLM tokens; budget None or <= 0 records usage without degrading anything."""
+    run = RunTokens(budget if budget and budget > 0 else None)
+    token = _run.set(run)
+    try:
+        yield run
+    finally:
+        _run.reset(token)
+
+
+@contextmanager
+def stage_scope(stage: str) -> Iterator[None]:
+    token = _stage.set(stage)
+    try:
+        yield
+    finally:
+        _stage.reset(token)
+
+
+def current_run_tokens() -> RunTokens | None:
+    return _run.get()
+
+
+def record_tokens(prompt_tokens: int, response_tokens: int) -> None:
+    """Attribute one LLM response to the current run and stage; no-op outside token_accounting()."""
+    run = _run.get()
+    if run is not None:
+        run._add(_stage.get(), prompt_tokens, response_tokens)
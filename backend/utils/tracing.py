@@ -0,0 +1,222 @@
+"""OpenTelemetry-style spans for pipeline stages, LLM calls, retriever queries and web fetches.
+
+Spans nest through contextvars and are exported off the request path by a background thread,
+either as JSON lines to a file or as OTLP/HTTP JSON to a local collector (settings.tracing_exporter).
+"""
+import json
+import os
+import queue
+import threading
+import time
+from contextlib import contextmanager
+from contextvars import ContextVar
+from dataclasses import dataclass, field
+from pathlib import Path
+from typing import Any, Iterator
+
+from config import settings
+from utils.logging import get_logger
+
+logger = get_logger(__name__)
+
+_SERVICE_NAME = "datavex-growth-engine"
+_EXPORT_BATCH_SIZE = 64
+_EXPORT_FLUSH_SECONDS = 2.0
+
+
+@dataclass
+class Span:
+    name: str
+    trace_id: str
+    span_id: str
+    parent_span_id: str | None = None
+    start_time_ns: int = 0
+    end_time_ns: int = 0
+    attributes: dict[str, Any] = field(default_factory=dict)
+    status: str = "ok"  # ok | error
+    status_message: str = ""
+
+    def set_attribute(self, key: str, value: Any) -> None:
+        self.attributes[key] = value
+
+    def set_attributes(self, **attributes: Any) -> None:
+        self.attributes.update(attributes)
+
+    @property
+    def duration_seconds(self) -> float:
+        return max(0, self.end_time_ns - self.start_time_ns) / 1e9
+
+    def to_dict(self) -> dict[str, Any]:
+        return {
+            "name": self.name,
+            "trace_id": self.trace_id,
+            "span_id": self.span_id,
+            "parent_span_id": self.parent_span_id,
+            "start_time_unix_nano": self.start_time_ns,
+            "end_time_unix_nano": self.end_time_ns,
+            "duration_seconds": round(self.duration_seconds, 6),
+            "attributes": self.attributes,
+            "status": self.status,
+            "status_message": self.status_message,
+            "service": _SERVICE_NAME,
+        }
+
+
+_current_span: ContextVar[Span | None] = ContextVar("current_span", default=None)
+
+
+def current_span() -> Span | None:
+    """Innermost active span in this context, if any."""
+    return _current_span.get()
+
+
+@contextmanager
+def span(name: str, **attributes: Any) -> Iterator[Span]:
+    """
+    Open a child of the current span (or a new trace root). Exceptions mark the span as errored and re-raise.
+    """
+    parent = _current_span.get()
+    s = Span(
+        name=name,
+        trace_id=parent.trace_id if parent else os.urandom(16).hex(),
+        span_id=os.urandom(8).hex(),
+        parent_span_id=parent.span_id if parent else None,
+        start_time_ns=time.time_ns(),
+        attributes=dict(attributes),
+    )
+    token = _current_span.set(s)
+    try:
+        yield s
+    except BaseException as e:
+        s.status = "error"
+        s.status_message = f"{type(e).__name__}: {e}"[:500]
+        raise
+    finally:
+        s.end_time_ns = time.time_ns()
+        _current_span.reset(token)
+        if _exporter is not None:
+            _exporter.submit(s)
+
+
+# --- Exporters ---
+
+
+def _otlp_value(value: Any) -> dict[str, Any]:
+    if isinstance(value, bool):
+        return {"boolValue": value}
+    if isinstance(value, int):
+        return {"intValue": str(value)}
+    if isinstance(value, float):
+        return {"doubleValue": value}
+    return {"stringValue": str(value)}
+
+
+def _to_otlp(spans: list[Span]) -> dict[str, Any]:
+    """Encode spans as an OTLP/JSON ExportTraceServiceRequest."""
+    return {
+        "resourceSpans": [
+            {
+                "resource": {
+                    "attributes": [{"key": "service.name", "value": {"stringValue": _SERVICE_NAME}}],
+                },
+                "scopeSpans": [
+                    {
+                        "scope": {"name": "growth_engine"},
+                        "spans": [
+                            {
+                                "traceId": s.trace_id,
+                                "spanId": s.span_id,
+                                "parentSpanId": s.parent_span_id or "",
+                                "name": s.name,
+                                "kind": 1,
+                                "startTimeUnixNano": str(s.start_time_ns),
+                                "endTimeUnixNano": str(s.end_time_ns),
+                                "attributes": [
+                                    {"key": k, "value": _otlp_value(v)} for k, v in s.attributes.items()
+                                ],
+                                "status": {"code": 2 if s.status == "error" else 1, "message": s.status_message},
+                            }
+                            for s in spans
+                        ],
+                    }
+                ],
+            }
+        ]
+    }
+
+
+class _BackgroundExporter:
+    """Queue finished spans and ship them in batches from a daemon thread."""
+
+    def __init__(self, kind: str):
+        self.kind = kind
+        self._queue: queue.SimpleQueue[Span | None] = queue.SimpleQueue()
+        self._thread = threading.Thread(target=self._run, name="span-exporter", daemon=True)
+        self._thread.start()
+
+    def submit(self, s: Span) -> None:
+        self._queue.put(s)
+
+    def shutdown(self, timeout: float = 5.0) -> None:
+        self._queue.put(None)
+        self._thread.join(timeout=timeout)
+
+    def _run(self) -> None:
+        batch: list[Span] = []
+        deadline = time.monotonic() + _EXPORT_FLUSH_SECONDS
+        while True:
+            try:
+                item = self._queue.get(timeout=max(0.0, deadline - time.monotonic()))
+            except queue.Empty:
+                item = ...
+            if item is None:
+                self._flush(batch)
+                return
+            if isinstance(item, Span):
+                batch.append(item)
+            if len(batch) >= _EXPORT_BATCH_SIZE or time.monotonic() >= deadline:
+                self._flush(batch)
+                batch = []
+                deadline = time.monotonic() + _EXPORT_FLUSH_SECONDS
+
+    def _flush(self, batch: list[Span]) -> None:
+        if not batch:
+            return
+        try:
+            if self.kind == "file":
+                path = Path(settings.tracing_file_path)
+                path.parent.mkdir(parents=True, exist_ok=True)
+                with path.open("a", encoding="utf-8") as f:
+                    for s in batch:
+                        f.write(json.dumps(s.to_dict(), default=str) + "\n")
+            elif self.kind == "otlp":
+                import httpx
+
+                url = settings.otlp_endpoint.rstrip("/") + "/v1/traces"
+                httpx.post(url, json=_to_otlp(batch), timeout=5.0).raise_for_status()
+        except Exception as e:
+            logger.warning("span_export_failed", exporter=self.kind, spans=len(batch), error=str(e))
+
+
+_exporter: _BackgroundExporter | None = None
+
+
+def init_tracing() -> None:
+    """Start the configured span exporter. Idempotent; 'none' keeps spans in-process only."""
+    global _exporter
+    kind = (settings.tracing_exporter or "none").strip().lower()
+    if _exporter is not None or kind == "none":
+        return
+    if kind not in ("file", "otlp"):
+        logger.warning("unknown_tracing_exporter", exporter=kind)
+        return
+    _exporter = _BackgroundExporter(kind)
+    logger.info("tracing_initialized", exporter=kind)
+
+
+def shutdown_tracing() -> None:
+    """Flush pending spans and stop the exporter thread."""
+    global _exporter
+    if _exporter is not None:
+        _exporter.shutdown()
+        _exporter = None
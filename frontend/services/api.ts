@@ -15,6 +15,9 @@ export interface RunResponse {
 
 export interface PipelineResult {
   keyword: string;
+  run_id: string;
+  parent_run_id: string | null;
+  created_at: number;
   signal_result: SignalResult | null;
   gap_analysis: GapAnalysis | null;
   strategy_brief: StrategyBrief | null;
@@ -112,3 +115,25 @@ export async function runPipeline(keyword: string): Promise<RunResponse> {
   }
   return res.json();
 }
+
+export type RerunTarget =
+  | "gap_analysis"
+  | "strategy_brief"
+  | "positioning"
+  | "blog"
+  | "linkedin"
+  | "twitter"
+  | "content";
+
+export async function rerunPipeline(runId: string, target: RerunTarget): Promise<RunResponse> {
+  const res = await fetch(`${API_BASE}/api/rerun`, {
+    method: "POST",
+    headers: { "Content-Type": "application/json" },
+    body: JSON.stringify({ run_id: runId, target }),
+  });
+  if (!res.ok) {
+    const err = await res.text();
+    throw new Error(err || `HTTP ${res.status}`);
+  }
+  return res.json();
+}